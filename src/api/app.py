@@ -1,32 +1,60 @@
 import sys
+from contextlib import asynccontextmanager
 from pathlib import Path
 
 # Add the api directory to sys.path so imports work when running directly
 sys.path.insert(0, str(Path(__file__).parent))
 
 from connexion import AsyncApp
+from connexion.middleware import MiddlewarePosition
 from connexion.exceptions import ProblemException
 from pydantic import ValidationError
 
-from mcp.app import mcp_http_app
+from config import settings
+from dependencies import container_lifespan
+from mcp.deferred import mcp_app
 from mcp.proxy import mcp_proxy
 from middleware import (
+    CompressionMiddleware,
+    MetricsMiddleware,
+    ServerTimingMiddleware,
     app_exception_handler,
     generic_exception_handler,
     http_exception_handler,
     validation_error_handler,
 )
 from shared.exceptions import AppError
+from shared.specification import load_specification
+
+
+@asynccontextmanager
+async def lifespan(app):
+    # One service container for REST and MCP, closed after the MCP session manager stops.
+    # The MCP app is imported and started in the background, so REST is ready first.
+    async with container_lifespan(), mcp_app.lifespan(app):
+        yield
+
 
 app = AsyncApp(
     __name__,
     specification_dir=Path(__file__).parent,
-    lifespan=mcp_http_app.lifespan,
+    lifespan=lifespan,
+)
+app.add_api(load_specification(Path(__file__).parent / "specification.yaml"))
+# Outermost, so error responses and the MCP mount are timed too.
+app.add_middleware(ServerTimingMiddleware, position=MiddlewarePosition.BEFORE_EXCEPTION)
+app.add_middleware(MetricsMiddleware, position=MiddlewarePosition.BEFORE_EXCEPTION)
+# Inside the timing middleware, so compression shows up as a Server-Timing stage. It
+# wraps the /mcp route and mount as well, so JSON-RPC results are compressed too.
+app.add_middleware(
+    CompressionMiddleware,
+    position=MiddlewarePosition.BEFORE_EXCEPTION,
+    minimum_size=settings.compression_minimum_size,
+    encodings=tuple(settings.compression_encodings),
 )
-app.add_api("specification.yaml")
 
 app._middleware_app.router.add_route("/mcp", mcp_proxy, methods=["POST"])
-app._middleware_app.router.mount("/mcp/", mcp_http_app)
+app._middleware_app.router.mount("/mcp/", mcp_app)
 
 app.add_error_handler(ValidationError, validation_error_handler)
 app.add_error_handler(ProblemException, http_exception_handler)
@@ -0,0 +1,76 @@
+"""Measure cold start: process spawn to the first successful REST response.
+
+Starts ``uvicorn api.app:app`` (as the image does) with in-memory adapters on a free port, polls
+``GET /v1/generators`` until it answers 200, and reports the median over runs.
+
+    python benchmarks/bench_cold_start.py --runs 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+from pathlib import Path
+
+API_DIR = Path(__file__).resolve().parents[1]
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def time_to_first_response(timeout: float, poll_interval: float) -> float:
+    port = free_port()
+    env = {**os.environ, "USE_IN_MEMORY_ADAPTERS": "true"}
+    started = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "api.app:app", "--port", str(port), "--log-level", "warning"],
+        cwd=API_DIR.parent,
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        url = f"http://127.0.0.1:{port}/v1/generators"
+        while time.perf_counter() - started < timeout:
+            if process.poll() is not None:
+                raise RuntimeError(f"uvicorn exited with {process.returncode}")
+            try:
+                with urllib.request.urlopen(url, timeout=poll_interval * 10) as response:
+                    if response.status == 200:
+                        return time.perf_counter() - started
+            except (urllib.error.URLError, ConnectionError):
+                pass
+            time.sleep(poll_interval)
+        raise TimeoutError(f"No response within {timeout}s")
+    finally:
+        process.terminate()
+        process.wait()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--timeout", type=float, default=30.0)
+    parser.add_argument("--poll-ms", type=float, default=10.0)
+    args = parser.parse_args()
+
+    samples = [time_to_first_response(args.timeout, args.poll_ms / 1000) for _ in range(args.runs)]
+    median = statistics.median(samples) * 1000
+    print(
+        f"time to first response: median {median:8.1f} ms  "
+        f"min {min(samples) * 1000:8.1f} ms  max {max(samples) * 1000:8.1f} ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
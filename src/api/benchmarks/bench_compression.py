@@ -0,0 +1,61 @@
+"""Weigh compression CPU against egress for full-catalog list responses.
+
+Renders ``GET /v1/generators`` bodies for synthetic catalogs and, per available coding,
+reports compression time, compressed size and the estimated time to deliver the body
+over a link of ``--mbps`` (compression plus transfer), next to the uncompressed body.
+
+    python benchmarks/bench_compression.py --sizes 100 1000 10000 --mbps 50 --runs 10
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from bench_serialization import INTERNAL_FIELDS, make_generators  # noqa: E402
+from models.dtos import GeneratorView  # noqa: E402
+from shared.compression import available_encodings  # noqa: E402
+
+
+def measure(compress, body: bytes, runs: int) -> tuple[float, int]:
+    samples = []
+    size = 0
+    for _ in range(runs):
+        started = time.process_time()
+        size = len(compress(body))
+        samples.append(time.process_time() - started)
+    return statistics.median(samples), size
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 10000])
+    parser.add_argument("--mbps", type=float, default=50.0, help="Client link bandwidth")
+    parser.add_argument("--runs", type=int, default=10)
+    args = parser.parse_args()
+
+    view = GeneratorView(INTERNAL_FIELDS)
+    bytes_per_second = args.mbps * 1_000_000 / 8
+    encodings = available_encodings()
+    print(f"codings: {', '.join(encoding.name for encoding in encodings)}")
+    for count in args.sizes:
+        body = b'{"items":' + view.items_json(make_generators(count)) + b"}"
+        print(f"\n{count} generators, {len(body) / 1024:.1f} KiB")
+        rows = [("identity", 0.0, len(body))]
+        for encoding in encodings:
+            rows.append((encoding.name, *measure(encoding.compress, body, args.runs)))
+        for name, cpu, size in rows:
+            deliver = cpu * 1000 + size / bytes_per_second * 1000
+            print(
+                f"{name:>9}: cpu {cpu * 1000:8.3f} ms  {size:>10} B  "
+                f"ratio {len(body) / size:5.2f}  deliver {deliver:9.3f} ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""Compare the buffering MCP proxy with the ASGI pass-through.
+
+Drives both proxies with a synthetic ASGI app that streams a large ``tools/call``-sized
+body in chunks, and reports time to first byte, total time and peak memory.
+
+    python benchmarks/bench_mcp_proxy.py --size-mb 8 --chunk-kb 64 --runs 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from starlette.requests import Request  # noqa: E402
+from starlette.responses import Response  # noqa: E402
+
+
+def streaming_app(total_bytes: int, chunk_bytes: int):
+    chunk = b"x" * chunk_bytes
+
+    async def app(scope, receive, send):
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        remaining = total_bytes
+        while remaining > 0:
+            size = min(chunk_bytes, remaining)
+            remaining -= size
+            await send(
+                {"type": "http.response.body", "body": chunk[:size], "more_body": remaining > 0}
+            )
+
+    return app
+
+
+def buffering_proxy(app):
+    """The previous ``mcp_proxy``: collects every chunk before building a Response."""
+
+    async def endpoint(request: Request) -> Response:
+        scope = dict(request.scope)
+        scope["path"] = "/"
+        scope["raw_path"] = b"/"
+        body_chunks: list[bytes] = []
+        status_code = 500
+        response_headers: list[tuple[bytes, bytes]] = []
+
+        async def send(message):
+            nonlocal status_code, response_headers
+            if message.get("type") == "http.response.start":
+                status_code = message.get("status", 500)
+                response_headers = message.get("headers", [])
+            elif message.get("type") == "http.response.body":
+                body_chunks.append(message.get("body", b""))
+
+        await app(scope, request.receive, send)
+        headers = {key.decode(): value.decode() for key, value in response_headers}
+        return Response(content=b"".join(body_chunks), status_code=status_code, headers=headers)
+
+    async def asgi(scope, receive, send):
+        response = await endpoint(Request(scope, receive))
+        await response(scope, receive, send)
+
+    return asgi
+
+
+def pass_through_proxy(app):
+    from mcp.proxy import MCPProxy
+
+    return MCPProxy(app)
+
+
+async def measure(proxy) -> tuple[float, float, int]:
+    scope = {"type": "http", "method": "POST", "path": "/mcp", "raw_path": b"/mcp", "headers": []}
+    first_byte_at: float | None = None
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        nonlocal first_byte_at
+        if message["type"] == "http.response.body" and first_byte_at is None:
+            first_byte_at = time.perf_counter()
+
+    tracemalloc.start()
+    started = time.perf_counter()
+    await proxy(scope, receive, send)
+    finished = time.perf_counter()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return (first_byte_at or finished) - started, finished - started, peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size-mb", type=float, default=8.0)
+    parser.add_argument("--chunk-kb", type=int, default=64)
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+
+    app = streaming_app(int(args.size_mb * 1024 * 1024), args.chunk_kb * 1024)
+    for name, build in (("buffering", buffering_proxy), ("pass-through", pass_through_proxy)):
+        proxy = build(app)
+        samples = [asyncio.run(measure(proxy)) for _ in range(args.runs)]
+        ttfb = statistics.median(sample[0] for sample in samples) * 1000
+        total = statistics.median(sample[1] for sample in samples) * 1000
+        peak = max(sample[2] for sample in samples) / (1024 * 1024)
+        print(f"{name:>12}: ttfb {ttfb:8.3f} ms  total {total:8.3f} ms  peak {peak:7.2f} MiB")
+
+
+if __name__ == "__main__":
+    main()
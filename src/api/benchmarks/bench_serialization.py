@@ -0,0 +1,91 @@
+"""Compare the previous list serialization with the precompiled GeneratorView path.
+
+The previous path revalidated the response model, built a per-index exclude dict and
+let the framework encode the resulting dict; the new path dumps the items straight to
+JSON bytes with a cached ``__all__`` exclusion plan.
+
+    python benchmarks/bench_serialization.py --sizes 1000 10000 --runs 10
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from models.dtos import Generator, GeneratorListResponse, GeneratorView  # noqa: E402
+from shared.encoding import dumps  # noqa: E402
+
+INTERNAL_FIELDS = {"artifact", "entrypoint"}
+
+
+def make_generators(count: int) -> list[Generator]:
+    return [
+        Generator(
+            id=f"gen_{n:012d}",
+            name=f"generator-{n}",
+            description="Generates CRUD scaffolding for FastAPI services.",
+            language="python",
+            stack="fastapi",
+            version="1.4.0",
+            tags=["api", "crud", "backend"],
+            entrypoint="generate.py",
+            upload_status="ready",
+            artifact={"bucket": "bucket", "object": f"gen_{n:012d}/generator.zip"},
+            created_at="2026-01-01T00:00:00Z",
+            updated_at="2026-01-01T00:00:00Z",
+        )
+        for n in range(count)
+    ]
+
+
+def previous_path(items: list[Generator]) -> bytes:
+    result = {"items": items, "next_page_token": None}
+    response = GeneratorListResponse.model_validate(result)
+    payload = response.model_dump(
+        mode="json",
+        exclude_none=True,
+        exclude={"items": {i: INTERNAL_FIELDS for i in range(len(result["items"]))}},
+    )
+    return json.dumps(payload).encode()
+
+
+def view_path(view: GeneratorView, items: list[Generator]) -> bytes:
+    return b'{"items":' + view.items_json(items) + b"}"
+
+
+def timed(func, runs: int) -> float:
+    samples = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - started)
+    return statistics.median(samples) * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000])
+    parser.add_argument("--runs", type=int, default=10)
+    args = parser.parse_args()
+
+    view = GeneratorView(INTERNAL_FIELDS)
+    for size in args.sizes:
+        items = make_generators(size)
+        assert json.loads(previous_path(items)) == json.loads(view_path(view, items))
+        before = timed(lambda: previous_path(items), args.runs)
+        after = timed(lambda: view_path(view, items), args.runs)
+        encoder = timed(lambda: dumps(view.items(items)), args.runs)
+        print(
+            f"{size:>6} items: previous {before:8.2f} ms  view {after:8.2f} ms  "
+            f"view+dict+encoder {encoder:8.2f} ms  speedup {before / after:5.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,173 @@
+"""Benchmark harness for the request hot path.
+
+Provides a ``benchmark`` fixture in the style of pytest-benchmark, stores results as a
+JSON baseline and, when comparing, fails a benchmark whose chosen statistic regressed
+beyond a threshold:
+
+    pytest src/api/benchmarks --benchmark-save=.benchmarks/baseline.json
+    pytest src/api/benchmarks --benchmark-compare=.benchmarks/baseline.json \\
+        --benchmark-compare-fail=p95:10%
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Callable
+
+import pytest
+
+os.environ.setdefault("USE_IN_MEMORY_ADAPTERS", "true")
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+CATALOG_SIZES = (100, 10_000, 100_000)
+MIN_ROUNDS = 5
+STATISTICS = ("min", "median", "mean", "p95", "p99", "max")
+
+
+@dataclass(slots=True)
+class BenchmarkStats:
+    rounds: int
+    min: float
+    median: float
+    mean: float
+    p95: float
+    p99: float
+    max: float
+
+    @classmethod
+    def from_samples(cls, samples: list[float]) -> BenchmarkStats:
+        percentiles = statistics.quantiles(samples, n=100, method="inclusive")
+        return cls(
+            rounds=len(samples),
+            min=min(samples),
+            median=statistics.median(samples),
+            mean=statistics.fmean(samples),
+            p95=percentiles[94],
+            p99=percentiles[98],
+            max=max(samples),
+        )
+
+
+class BenchmarkFixture:
+    """Calls ``func`` repeatedly for at least ``min_time`` seconds and records timings."""
+
+    def __init__(self, min_time: float, max_rounds: int) -> None:
+        self.min_time = min_time
+        self.max_rounds = max(max_rounds, MIN_ROUNDS)
+        self.stats: BenchmarkStats | None = None
+
+    def __call__(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        result = func(*args, **kwargs)  # warm-up round, not recorded
+        samples: list[float] = []
+        deadline = time.perf_counter() + self.min_time
+        while len(samples) < self.max_rounds and (
+            len(samples) < MIN_ROUNDS or time.perf_counter() < deadline
+        ):
+            started = time.perf_counter()
+            func(*args, **kwargs)
+            samples.append(time.perf_counter() - started)
+        self.stats = BenchmarkStats.from_samples(samples)
+        return result
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    group = parser.getgroup("benchmark")
+    group.addoption("--benchmark-save", metavar="PATH", help="Write results as a baseline.")
+    group.addoption("--benchmark-compare", metavar="PATH", help="Baseline to compare with.")
+    group.addoption(
+        "--benchmark-compare-fail",
+        metavar="STAT:PERCENT",
+        default="p95:10%",
+        help=f"Fail when STAT ({', '.join(STATISTICS)}) regresses by more than PERCENT.",
+    )
+    group.addoption("--benchmark-min-time", type=float, default=0.2)
+    group.addoption("--benchmark-max-rounds", type=int, default=1000)
+    group.addoption(
+        "--benchmark-sizes",
+        default=",".join(str(size) for size in CATALOG_SIZES),
+        help="Comma-separated synthetic catalog sizes.",
+    )
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    config.benchmark_results = {}  # type: ignore[attr-defined]
+
+
+def pytest_generate_tests(metafunc: pytest.Metafunc) -> None:
+    if "catalog_size" in metafunc.fixturenames:
+        option = metafunc.config.getoption("--benchmark-sizes")
+        sizes = [int(size) for size in option.split(",") if size.strip()]
+        metafunc.parametrize("catalog_size", sizes, scope="session")
+
+
+def _fail_rule(config: pytest.Config) -> tuple[str, float]:
+    stat, _, percent = config.getoption("--benchmark-compare-fail").partition(":")
+    if stat not in STATISTICS:
+        raise pytest.UsageError(f"Unknown benchmark statistic '{stat}'")
+    return stat, float(percent.rstrip("%")) / 100
+
+
+@pytest.fixture(scope="session")
+def benchmark_baseline(pytestconfig: pytest.Config) -> dict[str, dict[str, float]]:
+    path = pytestconfig.getoption("--benchmark-compare")
+    if not path:
+        return {}
+    return json.loads(Path(path).read_text(encoding="utf-8"))["benchmarks"]
+
+
+@pytest.fixture()
+def benchmark(request: pytest.FixtureRequest, benchmark_baseline):
+    config = request.config
+    fixture = BenchmarkFixture(
+        config.getoption("--benchmark-min-time"), config.getoption("--benchmark-max-rounds")
+    )
+    yield fixture
+
+    if fixture.stats is None:
+        return
+    name = request.node.name
+    config.benchmark_results[name] = asdict(fixture.stats)  # type: ignore[attr-defined]
+
+    baseline = benchmark_baseline.get(name)
+    if baseline:
+        stat, threshold = _fail_rule(config)
+        current, previous = getattr(fixture.stats, stat), baseline[stat]
+        if current > previous * (1 + threshold):
+            pytest.fail(
+                f"{name}: {stat} regressed {current / previous - 1:+.1%} "
+                f"({previous * 1e3:.3f} ms -> {current * 1e3:.3f} ms, limit {threshold:.0%})"
+            )
+
+
+def pytest_sessionfinish(session: pytest.Session) -> None:
+    path = session.config.getoption("--benchmark-save")
+    results = session.config.benchmark_results  # type: ignore[attr-defined]
+    if not path or not results:
+        return
+    target = Path(path)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    payload = {
+        "machine": {"python": platform.python_version(), "platform": platform.platform()},
+        "benchmarks": results,
+    }
+    target.write_text(json.dumps(payload, indent=2, sort_keys=True), encoding="utf-8")
+
+
+def pytest_terminal_summary(terminalreporter, config: pytest.Config) -> None:
+    results = config.benchmark_results  # type: ignore[attr-defined]
+    if not results:
+        return
+    terminalreporter.section("benchmarks (ms)")
+    width = max(len(name) for name in results)
+    header = "".join(f"{stat:>11}" for stat in STATISTICS)
+    terminalreporter.write_line(f"{'name':<{width}}{header}{'rounds':>9}")
+    for name, stats in sorted(results.items()):
+        values = "".join(f"{stats[stat] * 1e3:>11.4f}" for stat in STATISTICS)
+        terminalreporter.write_line(f"{name:<{width}}{values}{stats['rounds']:>9}")
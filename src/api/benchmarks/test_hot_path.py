@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+import dependencies
+from logger import Lazy, get_logger
+from controllers import generator_controller
+from mcp.proxy import MCPProxy
+from mcp.tools import main as mcp_tools
+from models.dtos import GeneratorCreateRequest, ListGeneratorsQuery
+from repositories.memory import InMemoryMetadataAdapter
+from repositories.storage import FakeSignedUploadAdapter
+from services.generator_service import GeneratorService
+
+LANGUAGES = ("python", "typescript", "go", "php", "java")
+
+
+def _body(n: int) -> dict:
+    return {
+        "name": f"generator-{n}",
+        "description": "Generates CRUD scaffolding for FastAPI services.",
+        "language": LANGUAGES[n % len(LANGUAGES)],
+        "stack": f"stack-{n % 20}",
+        "version": f"1.{n % 10}.0",
+        "tags": ["api", f"team-{n % 50}", "crud" if n % 3 == 0 else "cli"],
+        "entrypoint": "generate.py",
+        "upload": {"content_type": "application/zip"},
+    }
+
+
+@pytest.fixture(scope="session")
+def loop():
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest.fixture(scope="session")
+def metadata(loop, catalog_size: int) -> InMemoryMetadataAdapter:
+    adapter = InMemoryMetadataAdapter()
+    loop.run_until_complete(adapter.create_generators([_body(n) for n in range(catalog_size)]))
+    return adapter
+
+
+@pytest.fixture()
+def service(monkeypatch: pytest.MonkeyPatch, metadata) -> GeneratorService:
+    # No list cache: every call pays for the read and the serialization.
+    service = GeneratorService(metadata=metadata, storage=FakeSignedUploadAdapter())
+    monkeypatch.setattr(dependencies, "_container", dependencies.ServiceContainer(service))
+    return service
+
+
+def test_list_query_validation(benchmark):
+    params = {"language": "python", "tag": ["api", "crud"], "limit": "50", "fields": "id,name"}
+
+    query = benchmark(ListGeneratorsQuery.model_validate, params)
+
+    assert query.limit == 50
+
+
+def test_create_request_validation(benchmark):
+    body = _body(1)
+
+    request = benchmark(GeneratorCreateRequest.model_validate, body)
+
+    assert request.name == "generator-1"
+
+
+def test_controller_list_serialization(benchmark, loop, service, catalog_size):
+    response = benchmark(lambda: loop.run_until_complete(generator_controller.list_generators()))
+
+    assert response.body.count(b"\"id\"") >= catalog_size
+    assert response.headers["ETag"]
+
+
+def test_mcp_list_result_shaping(benchmark, loop, service, catalog_size):
+    result = benchmark(lambda: loop.run_until_complete(mcp_tools.list_generators.fn()))
+
+    assert len(result["items"]) >= catalog_size
+
+
+def test_memory_filtering(benchmark, loop, metadata):
+    items = benchmark(
+        lambda: loop.run_until_complete(
+            metadata.list_generators(language="python", tag=["api", "crud"], limit=50)
+        )
+    )
+
+    assert all(item.language == "python" for item in items)
+
+
+def test_request_logging(benchmark):
+    # Cost on the calling thread only; formatting and writing happen on the log thread.
+    log = get_logger("benchmarks")
+    query = ListGeneratorsQuery.model_validate({"language": "python", "limit": "50"})
+
+    benchmark(
+        log.info, "Listing generators", extra={"query": Lazy(query.model_dump, exclude_none=True)}
+    )
+
+
+def test_mcp_proxy_overhead(benchmark, loop):
+    async def app(scope, receive, send):
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b"{}"})
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        return None
+
+    proxy = MCPProxy(app)
+
+    def call():
+        scope = {"type": "http", "method": "POST", "path": "/mcp", "raw_path": b"/mcp"}
+        loop.run_until_complete(proxy(scope, receive, send))
+
+    benchmark(call)
@@ -18,7 +18,13 @@ class AppConfig(BaseSettings):
     # Runtime
     env: Literal["dev", "prod"] = "dev"
     log_level: str = "INFO"
+    # Records buffered for the log writer thread; overflow is dropped and counted
+    log_queue_size: int = 10_000
+    # Share of INFO records kept per logger prefix, e.g. {"api.controllers": 0.1}
+    log_sample_rates: dict[str, float] = Field(default_factory=dict)
     use_in_memory_adapters: bool = False
+    # Metadata store; USE_IN_MEMORY_ADAPTERS=true overrides it with "memory"
+    metadata_backend: Literal["firestore", "sqlite", "memory"] = "firestore"
 
     # GCP Credentials
     google_application_credentials: str | None = None
@@ -27,11 +33,67 @@ class AppConfig(BaseSettings):
     firestore_project_id: str = ""
     firestore_database_id: str = "(default)"
     firestore_collection: str = "generators"
+    # Serve lists and gets from an in-memory replica fed by a snapshot listener
+    firestore_replica_enabled: bool = False
+
+    # SQLite (METADATA_BACKEND=sqlite)
+    sqlite_path: str = "constructio.db"
+    sqlite_read_pool_size: int = 4
+    sqlite_statement_cache_size: int = 128
 
     # Google Cloud Storage
     gcs_project_id: str = ""
     gcs_bucket: str = ""
     gcs_upload_url_expiry_seconds: int = 600
+    gcs_download_url_window_seconds: int = 300
+    gcs_download_url_refresh_ahead_seconds: int = 60
+    gcs_download_url_cache_size: int = 2048
+    gcs_signer_max_concurrency: int = 8
+    gcs_credentials_refresh_margin_seconds: int = 300
+    gcs_cleanup_batch_size: int = 100
+    gcs_cleanup_flush_seconds: float = 1.0
+    # Keep-alive connections per host in the GCS HTTP session (requests defaults to 10)
+    gcs_http_pool_size: int = 32
+
+    # Concurrency for per-item storage calls in batch endpoints
+    signed_url_concurrency: int = 16
+
+    # List cache. Writes invalidate only this instance (and the shared tier), so other
+    # instances may serve a list up to ttl + stale seconds old; keep the stale window short.
+    list_cache_enabled: bool = True
+    list_cache_ttl_seconds: float = 30.0
+    list_cache_stale_seconds: float = 5.0
+    list_cache_max_entries: int = 256
+    # Shared tier (Redis / Memorystore, needs the ``cache`` extra); unset keeps it local
+    list_cache_redis_url: str | None = None
+
+    # Full-text search (q=): in-process index, loaded from the metadata store at startup.
+    # Without the Firestore replica, other instances' writes are picked up by a rebuild
+    # every search_refresh_seconds (0 disables it).
+    search_enabled: bool = True
+    search_refresh_seconds: float = 60.0
+
+    # Response compression: codings offered in preference order (br and zstd need the
+    # brotli / zstandard packages) and the smallest body worth compressing
+    compression_encodings: list[str] = Field(default_factory=lambda: ["zstd", "br", "gzip"])
+    compression_minimum_size: int = 1024
+
+    # Cache-Control max-age for generator GETs (revalidated with ETag / If-None-Match)
+    http_cache_max_age_seconds: int = 30
+
+    # Admin diagnostics (/admin/*); disabled while the token is empty
+    admin_token: str = ""
+    profiler_max_seconds: float = 60.0
+
+    @property
+    def resolved_metadata_backend(self) -> str:
+        return "memory" if self.use_in_memory_adapters else self.metadata_backend
+
+    @property
+    def uses_gcs(self) -> bool:
+        """GCS is optional with SQLite; without a bucket the fake upload adapter is used."""
+        backend = self.resolved_metadata_backend
+        return backend == "firestore" or (backend == "sqlite" and bool(self.gcs_bucket))
 
     def validate_gcp_settings(self) -> None:
         """Ensure required GCP settings are configured."""
@@ -48,10 +110,11 @@ class AppConfig(BaseSettings):
             os.environ["GOOGLE_APPLICATION_CREDENTIALS"] = str(path)
 
         missing: list[str] = []
-        if not self.firestore_project_id:
-            missing.append("FIRESTORE_PROJECT_ID")
-        if not self.firestore_collection:
-            missing.append("FIRESTORE_COLLECTION")
+        if self.resolved_metadata_backend == "firestore":
+            if not self.firestore_project_id:
+                missing.append("FIRESTORE_PROJECT_ID")
+            if not self.firestore_collection:
+                missing.append("FIRESTORE_COLLECTION")
         if not self.gcs_project_id:
             missing.append("GCS_PROJECT_ID")
         if not self.gcs_bucket:
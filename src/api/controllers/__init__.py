@@ -1,4 +1,7 @@
 from controllers.generator_controller import (
+    batch_create_generators,
+    batch_delete_generators,
+    batch_get_generators,
     create_generator,
     delete_generator,
     get_generator,
@@ -6,6 +9,9 @@ from controllers.generator_controller import (
 )
 
 __all__ = [
+    "batch_create_generators",
+    "batch_delete_generators",
+    "batch_get_generators",
     "create_generator",
     "delete_generator",
     "get_generator",
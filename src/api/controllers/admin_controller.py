@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from typing import Any
+
+from starlette.responses import Response
+
+from config import settings
+from logger import logger
+from shared.encoding import dumps
+from shared.profiling import (
+    AllocationTracker,
+    ProfilerBusyError,
+    SamplingProfiler,
+    collapsed,
+    speedscope,
+)
+
+_profiler = SamplingProfiler()
+_allocations = AllocationTracker()
+
+
+def _profile_busy() -> tuple[dict[str, Any], int]:
+    return {"error": "conflict", "message": "A profile is already running"}, 409
+
+
+async def profile(
+    seconds: float = 10.0, interval_ms: int = 10, output: str = "collapsed", threads: str = "loop"
+) -> Response | tuple[dict[str, Any], int]:
+    if _profiler.running:
+        return _profile_busy()
+    seconds = min(seconds, settings.profiler_max_seconds)
+    interval = interval_ms / 1000
+    # This handler runs on the event loop thread, which is the one serving requests.
+    thread_ids = {threading.get_ident()} if threads == "loop" else None
+
+    logger.info("Admin: profile", extra={"seconds": seconds, "interval_ms": interval_ms})
+    try:
+        stacks = await asyncio.to_thread(_profiler.profile, seconds, interval, thread_ids)
+    except ProfilerBusyError:
+        return _profile_busy()
+
+    if output == "speedscope":
+        content = dumps(speedscope(stacks, interval, name=f"constructio {threads} {seconds}s"))
+        return Response(
+            content,
+            media_type="application/json",
+            headers={"Content-Disposition": 'attachment; filename="profile.speedscope.json"'},
+        )
+    return Response(collapsed(stacks), media_type="text/plain")
+
+
+async def get_tracemalloc() -> dict[str, Any]:
+    return _allocations.status()
+
+
+async def start_tracemalloc(frames: int = 1) -> dict[str, Any]:
+    logger.info("Admin: start tracemalloc", extra={"frames": frames})
+    _allocations.start(frames)
+    return _allocations.status()
+
+
+async def stop_tracemalloc() -> dict[str, Any]:
+    logger.info("Admin: stop tracemalloc")
+    _allocations.stop()
+    return _allocations.status()
+
+
+async def create_snapshot(limit: int = 25) -> tuple[dict[str, Any], int]:
+    if not _allocations.tracing:
+        return {
+            "error": "conflict",
+            "message": "tracemalloc is not tracing; call /admin/tracemalloc:start first",
+        }, 409
+    snapshot_id = await asyncio.to_thread(_allocations.snapshot)
+    top = await asyncio.to_thread(_allocations.top, snapshot_id, limit)
+    return {"id": snapshot_id, "stats": top}, 201
+
+
+async def get_snapshot(
+    snapshotId: str, limit: int = 25, compare_to: str | None = None
+) -> tuple[dict[str, Any], int]:
+    for snapshot_id in (snapshotId, compare_to):
+        if snapshot_id is not None and not _allocations.has(snapshot_id):
+            return {
+                "error": "not_found",
+                "message": f"Snapshot '{snapshot_id}' was not found",
+            }, 404
+    if compare_to is None:
+        stats = await asyncio.to_thread(_allocations.top, snapshotId, limit)
+        return {"id": snapshotId, "stats": stats}, 200
+    stats = await asyncio.to_thread(_allocations.diff, snapshotId, compare_to, limit)
+    return {"id": snapshotId, "compare_to": compare_to, "stats": stats}, 200
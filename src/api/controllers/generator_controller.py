@@ -1,59 +1,193 @@
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, AsyncIterator
 
-from dependencies import build_generator_service
-from logger import logger
+from connexion.context import request as current_request
+from pydantic import ValidationError
+from starlette.responses import Response, StreamingResponse
+
+from config import settings
+from dependencies import get_generator_service
+from logger import Lazy, get_logger
 from models.dtos import (
-    Generator,
+    BatchCreateGeneratorsRequest,
+    BatchDeleteGeneratorsRequest,
+    BatchGetGeneratorsRequest,
     GeneratorCreateRequest,
     GeneratorCreateResponse,
-    GeneratorListResponse,
+    GeneratorView,
+    GetGeneratorQuery,
     ListGeneratorsQuery,
 )
+from shared.encoding import dumps
+from shared.etag import none_match
+from shared.timing import stage
 
-_service = build_generator_service()
 
 # Fields to prune from public API responses
 INTERNAL_FIELDS = {"artifact", "entrypoint"}
 
+_view = GeneratorView(INTERNAL_FIELDS)
+
+logger = get_logger("controllers")
+
+
+def _json_response(
+    content: bytes, status_code: int = 200, headers: dict[str, str] | None = None
+) -> Response:
+    return Response(
+        content, status_code=status_code, headers=headers, media_type="application/json"
+    )
+
+
+def _cache_headers(etag: str, max_age: int) -> dict[str, str]:
+    # Shared caches (API Gateway) may store the response; everyone revalidates when stale.
+    return {"ETag": etag, "Cache-Control": f"public, max-age={max_age}, must-revalidate"}
+
+
+def _not_modified(headers: dict[str, str]) -> Response:
+    return Response(status_code=304, headers=headers)
+
 
-async def list_generators(**kwargs) -> dict[str, Any]:
+def _request_header(name: str) -> str | None:
+    # Connexion passes no header parameters to handlers, so they are read from the
+    # request context, which does not exist when a handler is called directly.
+    try:
+        return current_request.headers.get(name)
+    except RuntimeError:
+        return None
+
+
+async def list_generators(**kwargs) -> Response:
     # Validation handled by middleware/connexion
-    query = ListGeneratorsQuery.model_validate(kwargs)
+    with stage("validate"):
+        query = ListGeneratorsQuery.model_validate(kwargs)
 
     logger.info(
         "Controller: list_generators",
-        extra={"query": query.model_dump(exclude_none=True)},
-    )
-    result = await _service.list_generators(**query.model_dump(exclude_none=True))
-
-    response = GeneratorListResponse.model_validate(result)
-    return response.model_dump(
-        mode="json",
-        exclude_none=True,
-        exclude={"items": {i: INTERNAL_FIELDS for i in range(len(result.get("items", [])))}}
-        if isinstance(result, dict) else {"items": {i: INTERNAL_FIELDS for i in range(len(result.items))}}
+        extra={"query": Lazy(query.model_dump, exclude_none=True)},
     )
+    service = get_generator_service()
+    filters = query.model_dump(exclude_none=True)
+    result = await service.list_generators(**filters)
+
+    etag = service.list_etag(filters, result)
+    headers = _cache_headers(etag, settings.http_cache_max_age_seconds)
+    if none_match(_request_header("if-none-match"), headers["ETag"]):
+        return _not_modified(headers)
+
+    # Items are rendered straight to JSON bytes and spliced into the envelope.
+    with stage("serialize"):
+        content = b'{"items":' + _view.items_json(result["items"], query.fields)
+        if result.get("next_page_token"):
+            content += b',"next_page_token":' + dumps(result["next_page_token"])
+    return _json_response(content + b"}", headers=headers)
 
 
 async def create_generator(body) -> tuple[dict[str, Any], int]:
-    request = GeneratorCreateRequest.model_validate(body)
+    with stage("validate"):
+        request = GeneratorCreateRequest.model_validate(body)
 
     logger.info("Controller: create_generator", extra={"generator_name": request.name})
-    result = await _service.create_generator(request.model_dump(exclude_none=True))
+    result = await get_generator_service().create_generator(
+        request.model_dump(exclude_none=True)
+    )
 
-    response = GeneratorCreateResponse.model_validate(result)
-    return response.model_dump(
-        mode="json", 
-        exclude_none=True, 
-        exclude={"generator": INTERNAL_FIELDS, "upload": {"artifact"}}
-    ), 201
+    with stage("serialize"):
+        response = GeneratorCreateResponse.model_validate(result)
+        payload = response.model_dump(
+            mode="json",
+            exclude_none=True,
+            exclude={"generator": INTERNAL_FIELDS, "upload": {"artifact"}},
+        )
+    return payload, 201
 
 
-async def get_generator(generatorId) -> dict[str, Any] | tuple[dict[str, Any], int]:
-    generator = await _service.get_generator(generatorId)
-    if not generator:
+async def batch_create_generators(
+    body,
+) -> tuple[dict[str, Any], int, dict[str, str]] | StreamingResponse:
+    request = BatchCreateGeneratorsRequest.model_validate(body)
+
+    logger.info("Controller: batch_create_generators", extra={"count": len(request.items)})
+    rejected: list[dict[str, Any]] = []
+    accepted: list[tuple[int, GeneratorCreateRequest]] = []
+    for index, item in enumerate(request.items):
+        try:
+            accepted.append((index, GeneratorCreateRequest.model_validate(item)))
+        except ValidationError as exc:
+            rejected.append(
+                {
+                    "index": index,
+                    "error": {
+                        "error": "bad_request",
+                        "message": "Validation failed",
+                        "details": {"errors": exc.errors(include_url=False, include_context=False)},
+                    },
+                }
+            )
+
+    created = None
+    if accepted:
+        # Written before the response starts, so a failed batch gets an error status
+        # rather than a truncated NDJSON stream; only upload signing is streamed.
+        created = await get_generator_service().create_generators(
+            [request.model_dump(exclude_none=True) for _, request in accepted]
+        )
+    results = _batch_create_results(accepted, rejected, created)
+    if "application/x-ndjson" in (_request_header("accept") or ""):
+        return StreamingResponse(_ndjson(results), media_type="application/x-ndjson")
+    payload = {"results": sorted([result async for result in results], key=lambda r: r["index"])}
+    # The operation declares two media types, so the JSON one is named explicitly.
+    return payload, 200, {"Content-Type": "application/json"}
+
+
+async def _batch_create_results(
+    accepted: list[tuple[int, GeneratorCreateRequest]],
+    rejected: list[dict[str, Any]],
+    created: AsyncIterator[tuple[int, dict[str, Any]]] | None,
+) -> AsyncIterator[dict[str, Any]]:
+    for result in rejected:
+        yield result
+    if created is None:
+        return
+
+    async for position, result in created:
+        index = accepted[position][0]
+        if "error" in result:
+            yield {
+                "index": index,
+                "generator": _view.item(result["generator"]),
+                "error": {"error": "upload_unavailable", "message": result["error"]},
+            }
+            continue
+        response = GeneratorCreateResponse.model_validate(result)
+        yield {
+            "index": index,
+            **response.model_dump(
+                mode="json",
+                exclude_none=True,
+                exclude={"generator": INTERNAL_FIELDS, "upload": {"artifact"}},
+            ),
+        }
+
+
+async def _ndjson(results: AsyncIterator[dict[str, Any]]) -> AsyncIterator[bytes]:
+    async for result in results:
+        yield dumps(result) + b"\n"
+
+
+async def get_generator(
+    generatorId, fields=None
+) -> Response | tuple[dict[str, Any], int]:
+    with stage("validate"):
+        query = GetGeneratorQuery.model_validate({"fields": fields})
+    service = get_generator_service()
+    found = await service.get_generator_conditional(
+        generatorId,
+        fields=query.fields,
+        if_none_match=_request_header("if-none-match"),
+    )
+    if not found:
         # We can eventually use a proper NotFoundException
         # For now, return 404 manually or raise exception
         return {
@@ -61,15 +195,78 @@ async def get_generator(generatorId) -> dict[str, Any] | tuple[dict[str, Any], i
             "message": f"Generator '{generatorId}' was not found",
         }, 404
 
-    response = Generator.model_validate(generator)
-    return response.model_dump(mode="json", exclude_none=True, exclude=INTERNAL_FIELDS)
+    max_age = settings.http_cache_max_age_seconds
+    if service.wants_download_url(query.fields):
+        # Cached copies must not outlive the signed download URL they carry.
+        max_age = min(max_age, int(service.download_etag_seconds))
+    headers = _cache_headers(found["etag"], max_age)
+    if found["generator"] is None:
+        return _not_modified(headers)
+
+    with stage("serialize"):
+        content = _view.item_json(found["generator"], query.fields)
+    return _json_response(content, headers=headers)
+
+
+async def batch_get_generators(body) -> dict[str, Any]:
+    request = BatchGetGeneratorsRequest.model_validate(body)
+
+    logger.info("Controller: batch_get_generators", extra={"count": len(request.ids)})
+    results = await get_generator_service().get_generators(request.ids, fields=request.fields)
+
+    return {
+        "results": [
+            _batch_get_result(generator_id, generator, error, request.fields)
+            for generator_id, generator, error in results
+        ]
+    }
+
+
+def _batch_get_result(
+    generator_id: str, generator: Any, error: str | None, fields: list[str] | None
+) -> dict[str, Any]:
+    if error:
+        return {
+            "id": generator_id,
+            "error": {"error": "download_unavailable", "message": error},
+        }
+    if not generator:
+        return {
+            "id": generator_id,
+            "error": {
+                "error": "not_found",
+                "message": f"Generator '{generator_id}' was not found",
+            },
+        }
+    return {"id": generator_id, "generator": _view.item(generator, fields)}
 
 
 async def delete_generator(generatorId) -> tuple[str, int] | tuple[dict[str, Any], int]:
-    deleted = await _service.delete_generator(generatorId)
+    deleted = await get_generator_service().delete_generator(generatorId)
     if not deleted:
         return {
             "error": "not_found",
             "message": f"Generator '{generatorId}' was not found",
         }, 404
     return "", 204
+
+
+async def batch_delete_generators(body) -> dict[str, Any]:
+    request = BatchDeleteGeneratorsRequest.model_validate(body)
+
+    logger.info("Controller: batch_delete_generators", extra={"count": len(request.ids)})
+    results = await get_generator_service().delete_generators(request.ids)
+    return {
+        "results": [
+            {"id": generator_id, "deleted": True}
+            if deleted
+            else {
+                "id": generator_id,
+                "error": {
+                    "error": "not_found",
+                    "message": f"Generator '{generator_id}' was not found",
+                },
+            }
+            for generator_id, deleted in results
+        ]
+    }
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import asyncio
+
+from starlette.responses import Response
+
+from dependencies import get_generator_service
+from logger import log_stats
+from shared import metrics
+from shared.concurrency import executor_queue_depth
+
+
+def _ratio(hits: int, misses: int) -> float | None:
+    lookups = hits + misses
+    return hits / lookups if lookups else None
+
+
+def _cache_hit_ratios() -> dict[tuple[str, ...], float]:
+    service = get_generator_service()
+    ratios: dict[tuple[str, ...], float | None] = {}
+    list_stats = service.list_cache_stats()
+    if list_stats:
+        hits = list_stats["hits"] + list_stats["stale_hits"] + list_stats["shared_hits"]
+        ratios[("generator_list",)] = _ratio(hits, list_stats["misses"])
+    download_stats = getattr(service.storage, "download_cache_stats", None)
+    if download_stats is not None:
+        stats = download_stats()
+        ratios[("download_url",)] = _ratio(stats["hits"], stats["misses"])
+    return {labels: ratio for labels, ratio in ratios.items() if ratio is not None}
+
+
+def _executor_queue_depths() -> dict[tuple[str, ...], float]:
+    service = get_generator_service()
+    # Blocking Firestore, GCS and signing calls share the loop's default executor.
+    depths = {("default",): executor_queue_depth(asyncio.get_running_loop()._default_executor)}
+    metadata_depth = getattr(service.metadata, "executor_queue_depth", None)
+    if metadata_depth is not None:
+        depths[("sqlite",)] = metadata_depth()
+    cleanup_stats = getattr(service.storage, "cleanup_stats", None)
+    if cleanup_stats is not None:
+        depths[("gcs_cleanup",)] = cleanup_stats()["pending"]
+    return depths
+
+
+def _catalog_replica() -> dict[tuple[str, ...], float]:
+    replica_stats = getattr(get_generator_service().metadata, "replica_stats", None)
+    stats = replica_stats() if replica_stats is not None else None
+    if stats is None:
+        return {}
+    measures = {
+        "synced": float(stats["synced"]),
+        "documents": stats["documents"],
+        "lag_seconds": stats["lag_seconds"],
+        "staleness_seconds": stats["staleness_seconds"],
+    }
+    return {(measure,): value for measure, value in measures.items() if value is not None}
+
+
+metrics.cache_hit_ratio.set_function(_cache_hit_ratios)
+metrics.catalog_replica.set_function(_catalog_replica)
+metrics.executor_queue_depth.set_function(_executor_queue_depths)
+metrics.log_records.set_function(
+    lambda: {(state,): value for state, value in log_stats().items()}
+)
+
+
+async def get_metrics() -> Response:
+    return Response(metrics.registry.render(), media_type=metrics.CONTENT_TYPE)
@@ -1,29 +1,145 @@
 from __future__ import annotations
 
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import AsyncIterator
+
 from config import settings
-from repositories.firestore import FirestoreMetadataAdapter
-from repositories.memory import InMemoryMetadataAdapter
-from repositories.storage import FakeSignedUploadAdapter, GCSSignedUploadAdapter
+from interfaces.repositories import GeneratorMetadataPort, UploadStoragePort
+from logger import logger
 from services.generator_service import GeneratorService
+from services.list_cache import GeneratorListCache
+from services.search_index import GeneratorSearchIndex
+
+
+@dataclass(slots=True)
+class ServiceContainer:
+    """Application-scoped services shared by the REST and MCP surfaces."""
+
+    generator_service: GeneratorService
+
+    async def start(self) -> None:
+        await self.generator_service.start()
+
+    async def aclose(self) -> None:
+        await self.generator_service.aclose()
+
+
+_container: ServiceContainer | None = None
+
+
+def build_list_cache() -> GeneratorListCache | None:
+    if not settings.list_cache_enabled:
+        return None
+    shared = None
+    if settings.list_cache_redis_url:
+        from repositories.redis_cache import RedisSharedCache
+
+        shared = RedisSharedCache(settings.list_cache_redis_url)
+    return GeneratorListCache(
+        ttl_seconds=settings.list_cache_ttl_seconds,
+        stale_seconds=settings.list_cache_stale_seconds,
+        max_entries=settings.list_cache_max_entries,
+        shared=shared,
+    )
 
 
 def build_generator_service() -> GeneratorService:
-    if settings.use_in_memory_adapters:
-        return GeneratorService(
-            metadata=InMemoryMetadataAdapter(),
-            storage=FakeSignedUploadAdapter(),
+    if settings.uses_gcs:
+        settings.validate_gcp_settings()
+    return GeneratorService(
+        metadata=build_metadata_adapter(),
+        storage=build_storage_adapter(),
+        list_cache=build_list_cache(),
+        search_index=GeneratorSearchIndex() if settings.search_enabled else None,
+        search_refresh_seconds=settings.search_refresh_seconds,
+        signed_url_concurrency=settings.signed_url_concurrency,
+        download_etag_seconds=settings.gcs_download_url_refresh_ahead_seconds,
+    )
+
+
+# Adapters are imported by the builders so only the configured backend's client
+# libraries (google-cloud-firestore / -storage take most of the import time) load.
+def build_metadata_adapter() -> GeneratorMetadataPort:
+    backend = settings.resolved_metadata_backend
+    if backend == "memory":
+        from repositories.memory import InMemoryMetadataAdapter
+
+        return InMemoryMetadataAdapter()
+    if backend == "sqlite":
+        from repositories.sqlite import SqliteMetadataAdapter
+
+        return SqliteMetadataAdapter(
+            path=settings.sqlite_path,
+            read_pool_size=settings.sqlite_read_pool_size,
+            statement_cache_size=settings.sqlite_statement_cache_size,
         )
+    from repositories.firestore import FirestoreMetadataAdapter
+    from repositories.replica import CatalogReplica, collection_listener
 
-    settings.validate_gcp_settings()
-    return GeneratorService(
-        metadata=FirestoreMetadataAdapter(
-            project_id=settings.firestore_project_id or "",
-            database_id=settings.firestore_database_id,
-            collection_name=settings.firestore_collection,
-        ),
-        storage=GCSSignedUploadAdapter(
-            project_id=settings.gcs_project_id or "",
-            bucket_name=settings.gcs_bucket or "",
-            expiry_seconds=settings.gcs_upload_url_expiry_seconds,
-        ),
+    replica = None
+    if settings.firestore_replica_enabled:
+        replica = CatalogReplica(
+            collection_listener(
+                settings.firestore_project_id or "",
+                settings.firestore_database_id,
+                settings.firestore_collection,
+            )
+        )
+    return FirestoreMetadataAdapter(
+        project_id=settings.firestore_project_id or "",
+        database_id=settings.firestore_database_id,
+        collection_name=settings.firestore_collection,
+        replica=replica,
+    )
+
+
+def build_storage_adapter() -> UploadStoragePort:
+    from repositories.storage import FakeSignedUploadAdapter, GCSSignedUploadAdapter
+
+    if not settings.uses_gcs:
+        return FakeSignedUploadAdapter()
+    return GCSSignedUploadAdapter(
+        project_id=settings.gcs_project_id or "",
+        bucket_name=settings.gcs_bucket or "",
+        expiry_seconds=settings.gcs_upload_url_expiry_seconds,
+        download_window_seconds=settings.gcs_download_url_window_seconds,
+        download_refresh_ahead_seconds=settings.gcs_download_url_refresh_ahead_seconds,
+        download_cache_size=settings.gcs_download_url_cache_size,
+        signer_max_concurrency=settings.gcs_signer_max_concurrency,
+        credentials_refresh_margin_seconds=settings.gcs_credentials_refresh_margin_seconds,
+        cleanup_batch_size=settings.gcs_cleanup_batch_size,
+        cleanup_flush_seconds=settings.gcs_cleanup_flush_seconds,
+        http_pool_size=settings.gcs_http_pool_size,
     )
+
+
+def get_container() -> ServiceContainer:
+    """Return the process-wide container, building it on first use."""
+    global _container
+    if _container is None:
+        _container = ServiceContainer(generator_service=build_generator_service())
+    return _container
+
+
+def get_generator_service() -> GeneratorService:
+    return get_container().generator_service
+
+
+async def close_container() -> None:
+    global _container
+    container, _container = _container, None
+    if container is not None:
+        await container.aclose()
+        logger.info("Service container closed")
+
+
+@asynccontextmanager
+async def container_lifespan() -> AsyncIterator[ServiceContainer]:
+    """Build the container at startup and close its clients at shutdown."""
+    container = get_container()
+    await container.start()
+    try:
+        yield container
+    finally:
+        await close_container()
@@ -0,0 +1,15 @@
+from __future__ import annotations
+
+from typing import Protocol
+
+
+class SharedCachePort(Protocol):
+    """Cache tier shared between instances (e.g. Redis or Memorystore)."""
+
+    async def get(self, key: str) -> bytes | None: ...
+
+    async def set(self, key: str, value: bytes, ttl_seconds: float) -> None: ...
+
+    async def clear(self, prefix: str) -> None: ...
+
+    async def aclose(self) -> None: ...
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
-from typing import Any, Protocol
-from models.dtos import Generator
+from typing import Any, Callable, Protocol
+from models.dtos import ArtifactRef, Generator, GeneratorProjection
+
+# Called with ``(upserted, removed_ids)`` for changes made by any instance.
+CatalogChangeCallback = Callable[[list[Generator], list[str]], None]
 
 
 class GeneratorMetadataPort(Protocol):
@@ -12,18 +15,78 @@ class GeneratorMetadataPort(Protocol):
         version: str | None = None,
         stack: str | None = None,
         tag: list[str] | None = None,
-    ) -> list[Generator]: ...
+        limit: int | None = None,
+        start_after: tuple[str, str] | None = None,
+        fields: list[str] | None = None,
+    ) -> list[Generator] | list[GeneratorProjection]:
+        """Return matches ordered by ``(updated_at, id)`` descending.
+
+        ``start_after`` is the ``(updated_at, id)`` of the last item of the previous page.
+        With ``fields``, items are projections holding at least those fields.
+        """
+        ...
 
-    async def get_generator(self, generator_id: str) -> Generator | None: ...
+    async def get_generator(
+        self, generator_id: str, fields: list[str] | None = None
+    ) -> Generator | GeneratorProjection | None: ...
+
+    async def get_generators(
+        self, generator_ids: list[str], fields: list[str] | None = None
+    ) -> dict[str, Generator | GeneratorProjection]:
+        """Read several generators in one round trip; missing ids are left out."""
+        ...
 
     async def create_generator(self, body: dict[str, Any]) -> Generator: ...
 
+    async def create_generators(self, bodies: list[dict[str, Any]]) -> list[Generator]:
+        """Create several generators with batched writes, in input order."""
+        ...
+
     async def delete_generator(self, generator_id: str) -> bool: ...
 
+    async def delete_generators(
+        self, generator_ids: list[str]
+    ) -> dict[str, ArtifactRef | None]:
+        """Delete several generators; maps each deleted id to its record's artifact.
+
+        Ids that did not exist are left out; a deleted record without an artifact maps
+        to None.
+        """
+        ...
+
+    async def start(self) -> None:
+        """Start background work, such as listeners; called once at app startup."""
+        ...
+
+    def watch(self, callback: CatalogChangeCallback) -> bool:
+        """Report every change to the catalog, including other instances' writes.
+
+        Returns False when the adapter cannot observe other writers; callers then
+        have to re-read the store to see them.
+        """
+        ...
+
+    async def aclose(self) -> None:
+        """Release clients and connections held by the adapter."""
+        ...
+
 
 class UploadStoragePort(Protocol):
     async def build_upload_instruction(
         self, generator: Generator
     ) -> dict[str, Any]: ...
 
-    async def get_download_url(self, generator: Generator) -> str | None: ...
+    async def get_download_url(
+        self, generator: Generator
+    ) -> dict[str, Any] | None: ...
+
+    def schedule_artifact_cleanup(self, artifacts: dict[str, ArtifactRef | None]) -> None:
+        """Queue removal of deleted generators' artifacts, keyed by generator id.
+
+        Must not block the caller.
+        """
+        ...
+
+    async def aclose(self) -> None:
+        """Flush background work and release clients held by the adapter."""
+        ...
@@ -1,36 +1,166 @@
+import atexit
 import logging
+import queue
+import random
 import sys
-from typing import Any
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Callable
+
+from config import settings
 
 try:
     from pythonjsonlogger import jsonlogger
 except ImportError:
     jsonlogger = None  # type: ignore
 
+ROOT_LOGGER = "api"
+
+
+class Lazy:
+    """An ``extra`` value computed only if the record is written, on the writer thread.
+
+    ``logger.info("Listing", extra={"query": Lazy(query.model_dump, exclude_none=True)})``
+    """
+
+    __slots__ = ("func", "args", "kwargs")
+
+    def __init__(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> None:
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+
+    def __call__(self) -> Any:
+        return self.func(*self.args, **self.kwargs)
+
+
+class SamplingFilter(logging.Filter):
+    """Keeps a share of INFO-and-below records per logger; warnings always pass.
+
+    ``rates`` maps logger names to the share kept (0..1); the longest matching name
+    prefix applies, so ``{"api.controllers": 0.1}`` also covers its child loggers.
+    """
+
+    def __init__(self, rates: dict[str, float]) -> None:
+        super().__init__()
+        self.rates = dict(rates)
+        self.sampled_out = 0
+        self._resolved: dict[str, float] = {}
+
+    def _rate(self, name: str) -> float:
+        rate = self._resolved.get(name)
+        if rate is None:
+            rate = 1.0
+            for prefix in sorted(self.rates, key=len, reverse=True):
+                if name == prefix or name.startswith(prefix + "."):
+                    rate = self.rates[prefix]
+                    break
+            self._resolved[name] = rate
+        return rate
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno > logging.INFO:
+            return True
+        rate = self._rate(record.name)
+        if rate >= 1.0 or random.random() < rate:
+            return True
+        self.sampled_out += 1
+        return False
+
+
+class DroppingQueueHandler(QueueHandler):
+    """Hands records to a bounded queue without blocking; counts what does not fit."""
 
-def setup_logger(name: str | None = None) -> logging.Logger:
-    logger = logging.getLogger(name or "api")
+    def __init__(self, log_queue: "queue.Queue[logging.LogRecord]") -> None:
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Formatting is left to the writer thread; only merge the message arguments so
+        # later changes to mutable args cannot alter what is logged.
+        if record.args:
+            record.msg = record.getMessage()
+            record.args = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+def _resolve_lazy(record: logging.LogRecord) -> bool:
+    for key, value in record.__dict__.items():
+        if isinstance(value, Lazy):
+            try:
+                record.__dict__[key] = value()
+            except Exception as exc:
+                # Never let a broken payload take down the writer thread.
+                record.__dict__[key] = f"<unavailable: {exc!r}>"
+    return True
+
+
+def _formatter() -> logging.Formatter:
+    if jsonlogger:
+        return jsonlogger.JsonFormatter(
+            fmt="%(asctime)s %(levelname)s %(name)s %(message)s",
+            datefmt="%Y-%m-%dT%H:%M:%SZ",
+        )
+    # Fallback to standard logging if library is missing
+    return logging.Formatter(
+        fmt="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+        datefmt="%Y-%m-%dT%H:%M:%SZ",
+    )
+
+
+def setup_logger(
+    name: str | None = None,
+    *,
+    level: int | str = logging.INFO,
+    queue_size: int = 10_000,
+    sample_rates: dict[str, float] | None = None,
+) -> logging.Logger:
+    """Log through a bounded queue; a background thread formats and writes to stdout."""
+    logger = logging.getLogger(name or ROOT_LOGGER)
 
     if not logger.handlers:
-        handler = logging.StreamHandler(sys.stdout)
-
-        if jsonlogger:
-            formatter = jsonlogger.JsonFormatter(
-                fmt="%(asctime)s %(levelname)s %(name)s %(message)s",
-                datefmt="%Y-%m-%dT%H:%M:%SZ",
-            )
-        else:
-            # Fallback to standard logging if library is missing
-            formatter = logging.Formatter(
-                fmt="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-                datefmt="%Y-%m-%dT%H:%M:%SZ",
-            )
-
-        handler.setFormatter(formatter)
+        stream = logging.StreamHandler(sys.stdout)
+        stream.setFormatter(_formatter())
+        stream.addFilter(_resolve_lazy)
+
+        handler = DroppingQueueHandler(queue.Queue(queue_size))
+        handler.addFilter(SamplingFilter(sample_rates or {}))
+        listener = QueueListener(handler.queue, stream, respect_handler_level=True)
+        listener.start()
+        # Flush what is still queued when the process exits.
+        atexit.register(listener.stop)
+
         logger.addHandler(handler)
-        logger.setLevel(logging.INFO)
+        logger.setLevel(level)
 
     return logger
 
 
-logger = setup_logger()
+def get_logger(name: str) -> logging.Logger:
+    """Child of the API logger, e.g. ``api.controllers``, for per-logger sampling."""
+    return logging.getLogger(f"{ROOT_LOGGER}.{name}")
+
+
+def log_stats() -> dict[str, int]:
+    """Records dropped on a full queue, sampled out, and still waiting to be written."""
+    stats = {"dropped": 0, "sampled_out": 0, "pending": 0}
+    for handler in logging.getLogger(ROOT_LOGGER).handlers:
+        if isinstance(handler, DroppingQueueHandler):
+            stats["dropped"] += handler.dropped
+            stats["pending"] += handler.queue.qsize()
+            for log_filter in handler.filters:
+                if isinstance(log_filter, SamplingFilter):
+                    stats["sampled_out"] += log_filter.sampled_out
+    return stats
+
+
+logger = setup_logger(
+    level=settings.log_level,
+    queue_size=settings.log_queue_size,
+    sample_rates=settings.log_sample_rates,
+)
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import asyncio
+import importlib
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator
+
+from starlette.types import Receive, Scope, Send
+
+from logger import logger
+
+
+class DeferredMCPApp:
+    """The MCP ASGI app, imported and started in the background at startup.
+
+    Importing FastMCP and the tool modules is most of the service's import time, so
+    ``lifespan()`` loads ``module:attribute`` in a worker thread and runs its lifespan
+    in a background task instead of delaying readiness. REST is served meanwhile;
+    MCP requests wait until the app is up.
+    """
+
+    def __init__(self, target: str) -> None:
+        self.target = target
+        self.app: Any = None
+        self._ready: asyncio.Event | None = None
+        self._error: BaseException | None = None
+
+    def _load(self) -> Any:
+        module_name, _, attribute = self.target.partition(":")
+        return getattr(importlib.import_module(module_name), attribute)
+
+    @asynccontextmanager
+    async def lifespan(self, app: Any) -> AsyncIterator[None]:
+        self._ready = asyncio.Event()
+        stopping = asyncio.Event()
+        task = asyncio.create_task(self._serve(app, stopping))
+        try:
+            yield
+        finally:
+            stopping.set()
+            await task
+
+    async def _serve(self, app: Any, stopping: asyncio.Event) -> None:
+        try:
+            self.app = await asyncio.to_thread(self._load)
+            async with self.app.lifespan(app):
+                self._ready.set()
+                await stopping.wait()
+        except Exception as exc:
+            self._error = exc
+            logger.error("MCP app failed to start", extra={"error": repr(exc)})
+        finally:
+            self._ready.set()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if self._ready is None:
+            raise RuntimeError("MCP app used outside the application lifespan")
+        await self._ready.wait()
+        if self._error is not None or self.app is None:
+            raise RuntimeError("MCP app is not available") from self._error
+        await self.app(scope, receive, send)
+
+
+mcp_app = DeferredMCPApp("mcp.app:mcp_http_app")
@@ -1,27 +1,25 @@
-from starlette.requests import Request
-from starlette.responses import Response
-
-from .app import mcp_http_app
-
-
-async def mcp_proxy(request: Request) -> Response:
-    scope = dict(request.scope)
-    scope["path"] = "/"
-    scope["raw_path"] = b"/"
-    body_chunks: list[bytes] = []
-    status_code = 500
-    response_headers: list[tuple[bytes, bytes]] = []
-
-    async def send(message):
-        nonlocal status_code, response_headers
-        if message.get("type") == "http.response.start":
-            status_code = message.get("status", 500)
-            response_headers = message.get("headers", [])
-        elif message.get("type") == "http.response.body":
-            body_chunks.append(message.get("body", b""))
-
-    await mcp_http_app(scope, request.receive, send)
-    headers = {key.decode(): value.decode() for key, value in response_headers}
-    return Response(
-        content=b"".join(body_chunks), status_code=status_code, headers=headers
-    )
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from .deferred import mcp_app
+
+
+class MCPProxy:
+    """ASGI pass-through from ``POST /mcp`` to the MCP app mounted at ``/mcp/``.
+
+    The MCP app gets a copy of the scope, routed as the ``/mcp/`` mount would route it,
+    so the caller's scope, and the path middleware logs, is left as it arrived.
+    ``receive`` and ``send`` go straight to the MCP app, so streamed and SSE responses
+    reach the client chunk by chunk without buffering.
+    Starlette routes treat class instances as raw ASGI apps rather than request handlers.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        path = scope["path"] + "/"
+        child = {**scope, "path": path, "raw_path": path.encode(), "root_path": scope["path"]}
+        await self.app(child, receive, send)
+
+
+mcp_proxy = MCPProxy(mcp_app)
@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+import contextlib
+import time
+from typing import Any
+
+from fastmcp.server.dependencies import get_http_request
+from fastmcp.server.middleware import CallNext, Middleware, MiddlewareContext
+
+from shared import metrics
+from shared.timing import SCOPE_KEY, bind_timings, stage
+
+
+class ToolTimingMiddleware(Middleware):
+    """Records MCP tool calls into the tool latency metric and the request's timings.
+
+    Tools run in the session manager's task rather than the request's, so the
+    request's context is not inherited; the timings are picked up from the ASGI scope
+    the ``ServerTimingMiddleware`` left them in and bound for the call.
+    """
+
+    async def on_call_tool(self, context: MiddlewareContext[Any], call_next: CallNext) -> Any:
+        timings = None
+        with contextlib.suppress(RuntimeError):
+            timings = get_http_request().scope.get(SCOPE_KEY)
+        name = context.message.name
+        outcome = "error"
+        started = time.perf_counter()
+        try:
+            with bind_timings(timings), stage(f"mcp_{name}"):
+                result = await call_next(context)
+            outcome = "ok"
+            return result
+        finally:
+            metrics.mcp_tool_duration.labels(name, outcome).observe(
+                time.perf_counter() - started
+            )
@@ -3,23 +3,34 @@ from __future__ import annotations
 from typing import Any
 
 from fastmcp import FastMCP
+from pydantic import ValidationError
 from fastmcp.tools.tool_transform import ArgTransformConfig, ToolTransformConfig
 
-from dependencies import build_generator_service
-from logger import logger
+from dependencies import get_generator_service
+from logger import Lazy, get_logger
+from mcp.timing import ToolTimingMiddleware
 from models.dtos import (
-    Generator,
+    BATCH_CREATE_MAX_ITEMS,
+    BATCH_GET_MAX_IDS,
+    GeneratorField,
     GeneratorCreateRequest,
     GeneratorCreateResponse,
-    GeneratorListResponse,
+    GeneratorView,
+    Language,
     ListGeneratorsQuery,
 )
+from shared.exceptions import ValidationException
 
 mcp = FastMCP("Constructio")
-_service = build_generator_service()
+mcp.add_middleware(ToolTimingMiddleware())
+
+logger = get_logger("mcp")
 
 INTERNAL_FIELDS = {"artifact", "entrypoint"}
 LIST_FIELDS = {"id", "name", "description", "language", "stack"}
+SEARCH_MAX_RESULTS = 50
+
+_view = GeneratorView(INTERNAL_FIELDS)
 
 CREATE_GENERATOR_BODY_EXAMPLE = {
     "name": "fastapi-crud",
@@ -41,19 +52,62 @@ async def list_generators(filters: ListGeneratorsQuery | None = None) -> dict[st
     query = filters or ListGeneratorsQuery()
     logger.info(
         "MCP: list_generators",
-        extra={"query": query.model_dump(exclude_none=True)},
+        extra={"query": Lazy(query.model_dump, exclude_none=True)},
     )
-    result = await _service.list_generators(**query.model_dump(exclude_none=True))
-
-    response = GeneratorListResponse.model_validate(result)
-    items = [
-        Generator.model_validate(item).model_dump(
-            mode="json",
-            exclude_none=True,
-            include=LIST_FIELDS,
+    # Only the requested fields are read from storage; LIST_FIELDS by default.
+    fields = query.fields or sorted(LIST_FIELDS)
+    try:
+        result = await get_generator_service().list_generators(
+            **{**query.model_dump(exclude_none=True), "fields": fields}
+        )
+    except ValidationException as exc:
+        # A malformed or tampered page_token.
+        return {"error": "bad_request", "message": exc.message}
+
+    items = _view.items(result["items"], fields)
+    if result.get("next_page_token"):
+        return {"items": items, "next_page_token": result["next_page_token"]}
+    return {"items": items}
+
+
+@mcp.tool()
+async def search_generators(
+    query: str,
+    limit: int = 10,
+    language: Language | None = None,
+    version: str | None = None,
+    stack: str | None = None,
+    tags: list[str] | None = None,
+) -> dict[str, Any]:
+    """
+    Find generators by keywords in their name, description and tags, best match first.
+    Each item carries a relevance ``score``.
+    """
+    if not query.strip() or not 1 <= limit <= SEARCH_MAX_RESULTS:
+        return {
+            "error": "bad_request",
+            "message": f"query must not be empty and limit must be 1-{SEARCH_MAX_RESULTS}",
+        }
+
+    logger.info("MCP: search_generators", extra={"query": query, "limit": limit})
+    fields = sorted(LIST_FIELDS)
+    try:
+        result = await get_generator_service().search_generators(
+            q=query,
+            limit=limit,
+            language=language,
+            version=version,
+            stack=stack,
+            tag=tags,
+            fields=fields,
         )
-        for item in response.items
-    ]
+    except ValidationException as exc:
+        return {"error": "bad_request", "message": exc.message}
+
+    scores = result["scores"]
+    items = _view.items(result["items"], fields)
+    for item in items:
+        item["score"] = round(scores[item["id"]], 4)
     return {"items": items}
 
 
@@ -62,7 +116,9 @@ async def create_generator(body: GeneratorCreateRequest) -> dict[str, Any]:
     request = body
 
     logger.info("MCP: create_generator", extra={"generator_name": request.name})
-    result = await _service.create_generator(request.model_dump(exclude_none=True))
+    result = await get_generator_service().create_generator(
+        request.model_dump(exclude_none=True)
+    )
 
     response = GeneratorCreateResponse.model_validate(result)
     return response.model_dump(
@@ -80,29 +136,155 @@ mcp.add_tool_transformation(
 )
 
 
+@mcp.tool()
+async def create_generators(bodies: list[dict[str, Any]]) -> dict[str, Any]:
+    """
+    Register several generators in one call and return an upload URL for each.
+    Each body has the create_generator shape; invalid ones are reported per index.
+    """
+    if len(bodies) > BATCH_CREATE_MAX_ITEMS:
+        return {
+            "error": "bad_request",
+            "message": f"At most {BATCH_CREATE_MAX_ITEMS} generators can be created at once",
+        }
+
+    logger.info("MCP: create_generators", extra={"count": len(bodies)})
+    results: list[dict[str, Any]] = []
+    accepted: list[tuple[int, GeneratorCreateRequest]] = []
+    for index, body in enumerate(bodies):
+        try:
+            accepted.append((index, GeneratorCreateRequest.model_validate(body)))
+        except ValidationError as exc:
+            results.append(
+                {
+                    "index": index,
+                    "error": "bad_request",
+                    "message": "Validation failed",
+                    "details": {"errors": exc.errors(include_url=False, include_context=False)},
+                }
+            )
+    if not accepted:
+        return {"results": results}
+
+    created = await get_generator_service().create_generators(
+        [request.model_dump(exclude_none=True) for _, request in accepted]
+    )
+    async for position, result in created:
+        index = accepted[position][0]
+        if "error" in result:
+            results.append(
+                {
+                    "index": index,
+                    "generator": _view.item(result["generator"]),
+                    "error": "upload_unavailable",
+                    "message": result["error"],
+                }
+            )
+            continue
+        response = GeneratorCreateResponse.model_validate(result)
+        results.append(
+            {
+                "index": index,
+                **response.model_dump(
+                    mode="json",
+                    exclude_none=True,
+                    exclude={"generator": INTERNAL_FIELDS, "upload": {"artifact"}},
+                ),
+            }
+        )
+    return {"results": sorted(results, key=lambda item: item["index"])}
+
+
+mcp.add_tool_transformation(
+    "create_generators",
+    ToolTransformConfig(
+        arguments={"bodies": ArgTransformConfig(examples=[[CREATE_GENERATOR_BODY_EXAMPLE]])}
+    ),
+)
+
+
 @mcp.tool()
 async def get_generator(generator_id: str) -> dict[str, Any]:
-    generator = await _service.get_generator(generator_id)
+    generator = await get_generator_service().get_generator(generator_id)
     if not generator:
         return {
             "error": "not_found",
             "message": f"Generator '{generator_id}' was not found",
         }
 
-    response = Generator.model_validate(generator)
-    return response.model_dump(
-        mode="json",
-        exclude_none=True,
-        exclude=INTERNAL_FIELDS,
-    )
+    return _view.item(generator)
+
+
+@mcp.tool()
+async def get_generators(
+    generator_ids: list[str], fields: list[GeneratorField] | None = None
+) -> dict[str, Any]:
+    """
+    Get several generators in one call. Missing ids and download URLs that could not
+    be signed are reported per item.
+    """
+    if len(generator_ids) > BATCH_GET_MAX_IDS:
+        return {
+            "error": "bad_request",
+            "message": f"At most {BATCH_GET_MAX_IDS} generator ids can be requested at once",
+        }
+
+    logger.info("MCP: get_generators", extra={"count": len(generator_ids)})
+    selected = list(dict.fromkeys(["id", *fields])) if fields else None
+    results = await get_generator_service().get_generators(generator_ids, fields=selected)
+
+    items = []
+    for generator_id, generator, error in results:
+        if error:
+            items.append(
+                {"id": generator_id, "error": "download_unavailable", "message": error}
+            )
+        elif not generator:
+            items.append(
+                {
+                    "id": generator_id,
+                    "error": "not_found",
+                    "message": f"Generator '{generator_id}' was not found",
+                }
+            )
+        else:
+            items.append(_view.item(generator, selected))
+    return {"items": items}
 
 
 @mcp.tool()
 async def delete_generator(generator_id: str) -> str | dict[str, Any]:
-    deleted = await _service.delete_generator(generator_id)
+    deleted = await get_generator_service().delete_generator(generator_id)
     if not deleted:
         return {
             "error": "not_found",
             "message": f"Generator '{generator_id}' was not found",
         }
     return ""
+
+
+@mcp.tool()
+async def delete_generators(generator_ids: list[str]) -> dict[str, Any]:
+    """
+    Delete several generators in one call. Missing ids are reported per item.
+    """
+    if len(generator_ids) > BATCH_GET_MAX_IDS:
+        return {
+            "error": "bad_request",
+            "message": f"At most {BATCH_GET_MAX_IDS} generator ids can be deleted at once",
+        }
+
+    logger.info("MCP: delete_generators", extra={"count": len(generator_ids)})
+    results = await get_generator_service().delete_generators(generator_ids)
+    return {
+        "items": [
+            {"id": generator_id, "deleted": True}
+            if deleted
+            else {
+                "id": generator_id,
+                "error": "not_found",
+                "message": f"Generator '{generator_id}' was not found",
+            }
+            for generator_id, deleted in results
+        ]
+    }
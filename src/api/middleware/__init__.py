@@ -1,11 +1,17 @@
+from middleware.compression import CompressionMiddleware
 from middleware.error_handler import (
     app_exception_handler,
     generic_exception_handler,
     http_exception_handler,
     validation_error_handler,
 )
+from middleware.metrics import MetricsMiddleware
+from middleware.timing import ServerTimingMiddleware
 
 __all__ = [
+    "CompressionMiddleware",
+    "MetricsMiddleware",
+    "ServerTimingMiddleware",
     "app_exception_handler",
     "generic_exception_handler",
     "http_exception_handler",
@@ -0,0 +1,195 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Callable
+
+from starlette.datastructures import Headers, MutableHeaders
+
+from middleware.timing import Message, Receive, Scope, Send
+from shared.compression import CompressionStream, Encoding, available_encodings, negotiate
+from shared.timing import stage
+
+COMPRESSIBLE_TYPES = (
+    "application/json",
+    "application/problem+json",
+    "application/x-ndjson",
+    "text/plain",
+)
+
+# Larger bodies are compressed in a worker thread (zlib, brotli and zstd release the
+# GIL) rather than stalling every other request on the event loop.
+OFFLOAD_SIZE = 256 * 1024
+
+
+async def _compress(func: Callable[[bytes], bytes], data: bytes) -> bytes:
+    with stage("compress"):
+        if len(data) >= OFFLOAD_SIZE:
+            return await asyncio.to_thread(func, data)
+        return func(data)
+
+
+def _compressible(start: Message) -> bool:
+    headers = Headers(raw=start.get("headers", []))
+    if start["status"] < 200 or start["status"] in (204, 304):
+        return False
+    if "content-encoding" in headers:
+        return False
+    content_type = headers.get("content-type", "").split(";", 1)[0].strip().lower()
+    return content_type in COMPRESSIBLE_TYPES
+
+
+class _CompressingResponder:
+    """Wraps ``send`` for one response, choosing its coding from the start message.
+
+    Responses without a ``Content-Length``, and NDJSON, are streamed: each chunk is
+    compressed and flushed as it arrives, so the first line is never held back. Bodies
+    whose length is under ``minimum_size`` are sent as they are; larger single bodies
+    are compressed in one call with a new ``Content-Length``. ``encoding`` is None when
+    the client accepts none of the offered codings; compressible responses then only
+    get ``Vary: Accept-Encoding``.
+    """
+
+    def __init__(self, send: Send, encoding: Encoding | None, minimum_size: int) -> None:
+        self.send = send
+        self.encoding = encoding
+        self.minimum_size = minimum_size
+        self.start: Message | None = None
+        self.mode = "identity"  # "whole" or "stream" when the body is compressed
+        self.stream: CompressionStream | None = None
+
+    async def __call__(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            self.start = message
+            self._choose_mode()
+            if self.mode != "whole":
+                await self._flush_start()
+            return
+        if message["type"] != "http.response.body":
+            await self._flush_start()
+            await self.send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+        if self.mode == "stream":
+            await self._send_compressed(body, more_body)
+        elif self.mode == "whole":
+            await self._send_whole(body, more_body)
+        else:
+            await self.send(message)
+
+    def _choose_mode(self) -> None:
+        if self.start["status"] == 304:
+            self._mark_revalidated()
+            return
+        if not _compressible(self.start):
+            return
+        headers = self._mark_variant()
+        if self.encoding is None:
+            return
+        content_length = headers.get("content-length")
+        content_type = headers.get("content-type", "").split(";", 1)[0].strip().lower()
+        if content_length is None or content_type == "application/x-ndjson":
+            self._start_stream(headers)
+        elif int(content_length) >= self.minimum_size:
+            # Held until the body arrives, in case compressing it does not pay off.
+            self.mode = "whole"
+
+    def _start_stream(self, headers: MutableHeaders) -> None:
+        self.mode = "stream"
+        self.stream = self.encoding.stream()
+        headers["Content-Encoding"] = self.encoding.name
+        del headers["Content-Length"]
+
+    async def _send_whole(self, body: bytes, more_body: bool) -> None:
+        if more_body:
+            # A sized body sent in parts is streamed rather than buffered.
+            self._start_stream(MutableHeaders(raw=self.start["headers"]))
+            await self._flush_start()
+            await self._send_compressed(body, more_body)
+            return
+        compressed = await _compress(self.encoding.compress, body)
+        if len(compressed) >= len(body):
+            self.mode = "identity"
+            await self._flush_start()
+            await self.send({"type": "http.response.body", "body": body})
+            return
+        headers = MutableHeaders(raw=self.start["headers"])
+        headers["Content-Encoding"] = self.encoding.name
+        headers["Content-Length"] = str(len(compressed))
+        await self._flush_start()
+        await self.send({"type": "http.response.body", "body": compressed})
+
+    def _mark_revalidated(self) -> None:
+        # A 304 refreshes the stored response, so it must carry the same validator and
+        # Vary as the 200 it stands for, or shared caches can mix encodings.
+        self._mark_variant()
+
+    def _mark_variant(self) -> MutableHeaders:
+        # Vary is set whether or not this request negotiated a coding, so a shared cache
+        # never serves an identity body stored for one client to another that wants gzip.
+        self.start["headers"] = list(self.start.get("headers", []))
+        headers = MutableHeaders(raw=self.start["headers"])
+        headers.add_vary_header("Accept-Encoding")
+        if self.encoding is not None:
+            # Weak even when sent as identity, so the ETag a client or cache stores for
+            # this request does not depend on the body size, and matches its 304s.
+            self._weaken_etag(headers)
+        return headers
+
+    @staticmethod
+    def _weaken_etag(headers: MutableHeaders) -> None:
+        # The encoded bytes differ from the identity ones, so the validator becomes weak;
+        # If-None-Match compares weakly, so revalidation still matches.
+        etag = headers.get("etag")
+        if etag and not etag.startswith("W/"):
+            headers["ETag"] = f"W/{etag}"
+
+    async def _send_compressed(self, body: bytes, more_body: bool) -> None:
+        chunk = await _compress(self.stream.compress, body) if body else b""
+        if not more_body:
+            chunk += self.stream.finish()
+        await self.send({"type": "http.response.body", "body": chunk, "more_body": more_body})
+
+    async def _flush_start(self) -> None:
+        start, self.start = self.start, None
+        if start is not None:
+            await self.send(start)
+
+    def close(self) -> None:
+        if self.stream is not None:
+            self.stream.close()
+
+
+class CompressionMiddleware:
+    """Compresses JSON and text responses with the best coding the client accepts.
+
+    Offers zstd, br and gzip (those installed, in ``encodings`` order) and leaves
+    bodies under ``minimum_size`` bytes, already-encoded responses and event
+    streams untouched.
+    """
+
+    def __init__(
+        self,
+        app,
+        *,
+        minimum_size: int = 1024,
+        encodings: tuple[str, ...] = ("zstd", "br", "gzip"),
+    ) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+        self.encodings = {encoding.name: encoding for encoding in available_encodings(encodings)}
+        self.offered = tuple(self.encodings)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not self.offered:
+            await self.app(scope, receive, send)
+            return
+        accept_encoding = Headers(scope=scope).get("accept-encoding")
+        name = negotiate(accept_encoding, self.offered) if accept_encoding else None
+        encoding = self.encodings[name] if name is not None else None
+        responder = _CompressingResponder(send, encoding, self.minimum_size)
+        try:
+            await self.app(scope, receive, responder)
+        finally:
+            responder.close()
@@ -7,17 +7,17 @@ from starlette.requests import Request
 
 from logger import logger
 from models.dtos import ErrorResponse
-from shared.exceptions import AppError, NotFoundException
+from shared.exceptions import AppError, NotFoundException, ValidationException
 
 
 async def validation_error_handler(request: Request, exc: ValidationError):
-    logger.warning(
-        "Validation error", extra={"path": request.url.path, "errors": exc.errors()}
-    )
+    # Built once for the response; the log record reuses it on the writer thread.
+    errors = exc.errors()
+    logger.warning("Validation error", extra={"path": request.url.path, "errors": errors})
     payload = ErrorResponse(
         error="bad_request",
         message="Validation failed",
-        details={"errors": exc.errors()},
+        details={"errors": errors},
     )
     return problem(
         status=400,
@@ -50,9 +50,11 @@ async def app_exception_handler(request: Request, exc: AppError):
     status_code = 500
     if isinstance(exc, NotFoundException):
         status_code = 404
+    elif isinstance(exc, ValidationException):
+        status_code = 400
     logger.info(
         f"App exception: {exc.__class__.__name__}",
-        extra={"path": request.url.path, "message": exc.message},
+        extra={"path": request.url.path, "detail": exc.message},
     )
 
     payload = ErrorResponse(
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import time
+
+from middleware.timing import Message, Receive, Scope, Send
+from shared import metrics
+from shared.timing import SCOPE_KEY
+
+ROUTING_EXTENSION = "connexion_routing"
+
+
+def _operation(scope: Scope, is_mcp: bool) -> str:
+    if is_mcp:
+        return "mcp"
+    routing = scope.get("extensions", {}).get(ROUTING_EXTENSION, {})
+    operation_id = routing.get("operation_id")
+    # Unrouted paths share one label so scanners cannot blow up the label set.
+    return operation_id.rsplit(".", 1)[-1] if operation_id else "unmatched"
+
+
+class MetricsMiddleware:
+    """Records request latency per operationId and Firestore reads per request."""
+
+    def __init__(self, app) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        # The MCP proxy rewrites the path, so look at it before passing the request on.
+        is_mcp = scope["path"].startswith("/mcp")
+        status = 500
+        started = time.perf_counter()
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            metrics.http_request_duration.labels(_operation(scope, is_mcp), str(status)).observe(
+                time.perf_counter() - started
+            )
+            timings = scope.get(SCOPE_KEY)
+            if timings is not None and metrics.FIRESTORE_READS in timings.counts:
+                metrics.firestore_documents_read.observe(timings.counts[metrics.FIRESTORE_READS])
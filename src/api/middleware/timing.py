@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+from typing import Any, Awaitable, Callable, MutableMapping
+
+from logger import get_logger
+from shared.timing import SCOPE_KEY, RequestTimings, bind_timings
+
+Scope = MutableMapping[str, Any]
+Message = MutableMapping[str, Any]
+Receive = Callable[[], Awaitable[Message]]
+Send = Callable[[Message], Awaitable[None]]
+
+logger = get_logger("requests")
+
+
+class ServerTimingMiddleware:
+    """Times each HTTP request by stage and reports it.
+
+    Binds a fresh ``RequestTimings`` for the request, adds a ``Server-Timing`` header
+    with the stages recorded before the response starts, and logs one line with the
+    full summary once the response has been sent.
+    """
+
+    def __init__(self, app: Callable[[Scope, Receive, Send], Awaitable[None]]) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        timings = RequestTimings()
+        scope[SCOPE_KEY] = timings
+        status = 500
+
+        async def send_with_timing(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                headers = list(message.get("headers", []))
+                headers.append((b"server-timing", timings.server_timing().encode("latin-1")))
+                message["headers"] = headers
+            await send(message)
+
+        try:
+            with bind_timings(timings):
+                await self.app(scope, receive, send_with_timing)
+        finally:
+            summary = timings.summary()
+            logger.info(
+                "Request timing",
+                extra={
+                    "method": scope.get("method"),
+                    "path": scope.get("path"),
+                    "status": status,
+                    "duration_ms": summary["total_ms"],
+                    "timings": summary["stages"],
+                    "counts": summary["counts"],
+                },
+            )
@@ -1,29 +1,51 @@
 from .common import (
+    COMPUTED_FIELDS,
+    PROJECTABLE_FIELDS,
     ArtifactRef,
     ErrorResponse,
     Generator,
+    GeneratorField,
+    GeneratorProjection,
     Language,
     UploadInstruction,
     UploadRequest,
     UploadStatus,
 )
 from .generator_requests import (
+    BATCH_CREATE_MAX_ITEMS,
+    BATCH_GET_MAX_IDS,
+    BatchCreateGeneratorsRequest,
+    BatchDeleteGeneratorsRequest,
+    BatchGetGeneratorsRequest,
     GeneratorCreateRequest,
+    GetGeneratorQuery,
     ListGeneratorsQuery,
 )
 from .generator_responses import (
     GeneratorCreateResponse,
     GeneratorListResponse,
 )
+from .views import GeneratorView
 
 __all__ = [
+    "BATCH_CREATE_MAX_ITEMS",
+    "BATCH_GET_MAX_IDS",
+    "COMPUTED_FIELDS",
+    "PROJECTABLE_FIELDS",
     "ArtifactRef",
+    "BatchCreateGeneratorsRequest",
+    "BatchDeleteGeneratorsRequest",
+    "BatchGetGeneratorsRequest",
     "ErrorResponse",
     "Generator",
+    "GeneratorField",
+    "GeneratorProjection",
     "Language",
     "GeneratorCreateRequest",
     "GeneratorCreateResponse",
     "GeneratorListResponse",
+    "GeneratorView",
+    "GetGeneratorQuery",
     "ListGeneratorsQuery",
     "UploadInstruction",
     "UploadRequest",
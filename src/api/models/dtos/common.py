@@ -1,9 +1,12 @@
 from __future__ import annotations
 
-from typing import Any, Literal
+from typing import Any, Literal, Self, Sequence, get_args
+from uuid import uuid4
 
 from pydantic import BaseModel, ConfigDict, Field
 
+from shared.time import now_iso
+
 Language = Literal[
     "python", "typescript", "javascript", "php", "csharp", "java", "go", "rust", "other"
 ]
@@ -17,6 +20,7 @@ class ArtifactRef(BaseModel):
     content_type: str | None = Field(default="application/zip", max_length=100)
     size_bytes: int | None = Field(default=None, ge=0)
     sha256: str | None = Field(default=None, max_length=64)
+    generation: int | None = Field(default=None, ge=0)
 
 
 UploadStatus = Literal["pending", "uploaded", "ready", "failed"]
@@ -31,7 +35,8 @@ class Generator(BaseModel):
     language: str  # Simplified from Language enum to avoid validation complexity if not needed
     stack: str | None = None
     version: str | None = None
-    tags: list[str] = []
+    # A list on requests, a tuple on stored records (FrozenGenerator); both serialize alike.
+    tags: Sequence[str] = []
     entrypoint: str | None = None
     upload_status: str
     artifact: ArtifactRef | None = None
@@ -40,6 +45,81 @@ class Generator(BaseModel):
     download_url: str | None = None
     download_expires_at: str | None = None
 
+    @classmethod
+    def new(cls, body: dict[str, Any], *, bucket: str = "") -> Self:
+        """A pending record for a create request, with a fresh id and artifact location."""
+        now = now_iso()
+        generator_id = f"gen_{uuid4().hex[:12]}"
+        upload = body.get("upload") or {}
+        return cls.model_validate(
+            {
+                "id": generator_id,
+                "name": body["name"],
+                "description": body.get("description"),
+                "language": body["language"],
+                "stack": body.get("stack"),
+                "version": body.get("version"),
+                "tags": body.get("tags", []),
+                "entrypoint": body.get("entrypoint"),
+                "upload_status": "pending",
+                "artifact": {
+                    "bucket": upload.get("bucket") or bucket,
+                    "object": f"{generator_id}/generator.zip",
+                    "content_type": upload.get("content_type", "application/zip"),
+                },
+                "created_at": now,
+                "updated_at": now,
+            }
+        )
+
+
+# Public fields a client may request with ``fields=``.
+GeneratorField = Literal[
+    "id",
+    "name",
+    "description",
+    "language",
+    "stack",
+    "version",
+    "tags",
+    "upload_status",
+    "created_at",
+    "updated_at",
+    "download_url",
+    "download_expires_at",
+]
+PROJECTABLE_FIELDS = frozenset(get_args(GeneratorField))
+
+# Not stored with the metadata; filled in from storage when a generator is read.
+COMPUTED_FIELDS = frozenset({"download_url", "download_expires_at"})
+
+
+class GeneratorProjection(BaseModel):
+    """Partial generator read with a field projection; unselected fields stay None."""
+
+    model_config = ConfigDict(extra="ignore")
+
+    id: str
+    name: str | None = None
+    description: str | None = None
+    language: str | None = None
+    stack: str | None = None
+    version: str | None = None
+    tags: list[str] | None = None
+    entrypoint: str | None = None
+    upload_status: str | None = None
+    artifact: ArtifactRef | None = None
+    created_at: str | None = None
+    updated_at: str | None = None
+    download_url: str | None = None
+    download_expires_at: str | None = None
+
+    @classmethod
+    def from_generator(
+        cls, generator: Generator, fields: list[str]
+    ) -> GeneratorProjection:
+        return cls.model_validate(generator.model_dump(include={"id", *fields}))
+
 
 class UploadRequest(BaseModel):
     model_config = ConfigDict(extra="forbid")
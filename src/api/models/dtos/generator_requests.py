@@ -1,19 +1,41 @@
 from __future__ import annotations
 
-from typing import Any
+from typing import Annotated, Any
 
 from pydantic import BaseModel, ConfigDict, Field, field_validator
 
-from .common import Language, UploadRequest
+from .common import GeneratorField, Language, UploadRequest
 
 
-class ListGeneratorsQuery(BaseModel):
+class FieldSelection(BaseModel):
     model_config = ConfigDict(extra="forbid")
 
+    fields: list[GeneratorField] | None = None
+
+    @field_validator("fields", mode="before")
+    @classmethod
+    def split_fields(cls, value: Any) -> Any:
+        if isinstance(value, str):
+            return [field.strip() for field in value.split(",") if field.strip()]
+        return value
+
+    @field_validator("fields")
+    @classmethod
+    def include_id(cls, value: list[str] | None) -> list[str] | None:
+        if value is None:
+            return None
+        return list(dict.fromkeys(["id", *value]))
+
+
+class ListGeneratorsQuery(FieldSelection):
+
+    q: str | None = Field(default=None, min_length=1, max_length=200)
     language: Language | None = None
     version: str | None = Field(default=None, max_length=32)
     stack: str | None = Field(default=None, max_length=64)
     tag: list[str] | None = None
+    limit: int | None = Field(default=None, ge=1, le=200)
+    page_token: str | None = Field(default=None, max_length=512)
 
     @field_validator("tag", mode="before")
     @classmethod
@@ -25,6 +47,37 @@ class ListGeneratorsQuery(BaseModel):
         return value
 
 
+class GetGeneratorQuery(FieldSelection):
+    pass
+
+
+BATCH_GET_MAX_IDS = 100
+
+
+class BatchGetGeneratorsRequest(FieldSelection):
+    ids: list[Annotated[str, Field(min_length=1, max_length=64)]] = Field(
+        min_length=1, max_length=BATCH_GET_MAX_IDS
+    )
+
+
+class BatchDeleteGeneratorsRequest(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    ids: list[Annotated[str, Field(min_length=1, max_length=64)]] = Field(
+        min_length=1, max_length=BATCH_GET_MAX_IDS
+    )
+
+
+BATCH_CREATE_MAX_ITEMS = 500
+
+
+class BatchCreateGeneratorsRequest(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    # Items are validated one by one so a bad item does not reject the whole batch.
+    items: list[dict[str, Any]] = Field(min_length=1, max_length=BATCH_CREATE_MAX_ITEMS)
+
+
 class GeneratorCreateRequest(BaseModel):
     model_config = ConfigDict(extra="forbid")
 
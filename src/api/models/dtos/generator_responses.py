@@ -8,6 +8,7 @@ from .common import Generator, UploadInstruction
 class GeneratorListResponse(BaseModel):
     model_config = ConfigDict(extra="forbid")
     items: list[Generator]
+    next_page_token: str | None = None
 
 
 class GeneratorCreateResponse(BaseModel):
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Any, Iterable, Sequence
+
+from pydantic import BaseModel, TypeAdapter
+
+
+@lru_cache(maxsize=None)
+def _list_adapter(model: type[BaseModel]) -> TypeAdapter[list[Any]]:
+    return TypeAdapter(list[model])  # type: ignore[valid-type]
+
+
+@lru_cache(maxsize=256)
+def _plan(
+    hidden: frozenset[str], fields: frozenset[str] | None, many: bool
+) -> dict[str, Any]:
+    plan = {"include": set(fields)} if fields else {"exclude": set(hidden)}
+    if many:
+        return {key: {"__all__": value} for key, value in plan.items()}
+    return plan
+
+
+class GeneratorView:
+    """Public rendering of generators for one surface (REST or MCP).
+
+    Models coming out of the service are dumped as they are, never revalidated.
+    Include/exclude plans are built once per field selection, and lists go through a
+    prebuilt ``TypeAdapter`` with an ``__all__`` plan instead of one entry per index.
+    """
+
+    def __init__(self, hidden_fields: Iterable[str]) -> None:
+        self.hidden_fields = frozenset(hidden_fields)
+
+    def plan(self, fields: Iterable[str] | None = None, many: bool = False) -> dict[str, Any]:
+        return _plan(self.hidden_fields, frozenset(fields) if fields else None, many)
+
+    def item(self, generator: BaseModel, fields: Iterable[str] | None = None) -> dict[str, Any]:
+        return generator.model_dump(mode="json", exclude_none=True, **self.plan(fields))
+
+    def item_json(self, generator: BaseModel, fields: Iterable[str] | None = None) -> bytes:
+        return generator.model_dump_json(exclude_none=True, **self.plan(fields)).encode()
+
+    def items(
+        self, generators: Sequence[BaseModel], fields: Iterable[str] | None = None
+    ) -> list[dict[str, Any]]:
+        if not generators:
+            return []
+        return _list_adapter(type(generators[0])).dump_python(
+            list(generators), mode="json", exclude_none=True, **self.plan(fields, many=True)
+        )
+
+    def items_json(
+        self, generators: Sequence[BaseModel], fields: Iterable[str] | None = None
+    ) -> bytes:
+        if not generators:
+            return b"[]"
+        return _list_adapter(type(generators[0])).dump_json(
+            list(generators), exclude_none=True, **self.plan(fields, many=True)
+        )
@@ -3,11 +3,20 @@ from __future__ import annotations
 import asyncio
 from typing import Any, Generic, TypeVar, Type
 
+from google.api_core.exceptions import NotFound
 from google.cloud import firestore
 from pydantic import BaseModel
 
+from shared.concurrency import gather_bounded
+from shared.decorators import timed
+from shared.metrics import FIRESTORE_READS
+from shared.timing import add_count
+
 T = TypeVar("T", bound=BaseModel)
 
+# Firestore accepts at most 500 writes per batch commit.
+WRITE_BATCH_SIZE = 500
+
 
 class FirestoreRepository(Generic[T]):
     """Generic repository for Firestore with async/sync detection."""
@@ -31,6 +40,18 @@ class FirestoreRepository(Generic[T]):
             
         self._collection = self._client.collection(collection_name)
 
+    async def aclose(self) -> None:
+        """Close the client's gRPC channel and HTTP session."""
+        closed = self._client.close()
+        if asyncio.iscoroutine(closed):
+            await closed
+        # The async client opens its gRPC channel lazily and does not close it in close().
+        transport = getattr(self._client, "_transport", None)
+        if transport is not None:
+            closed = transport.close()
+            if asyncio.iscoroutine(closed):
+                await closed
+
     async def _run(self, func: Any, *args: Any, **kwargs: Any) -> Any:
         """Helper to run a method asynchronously or in an executor if sync."""
         if asyncio.iscoroutinefunction(func):
@@ -39,43 +60,150 @@ class FirestoreRepository(Generic[T]):
         loop = asyncio.get_running_loop()
         return await loop.run_in_executor(None, lambda: func(*args, **kwargs))
 
-    async def get(self, document_id: str) -> T | None:
+    @timed("firestore_get")
+    async def get(
+        self,
+        document_id: str,
+        fields: list[str] | None = None,
+        model_type: Type[BaseModel] | None = None,
+    ) -> T | None:
+        """Read one document; ``fields`` limits the read to those field paths."""
         doc_ref = self._collection.document(document_id)
-        snapshot = await self._run(doc_ref.get)
+        if fields:
+            snapshot = await self._run(doc_ref.get, field_paths=fields)
+        else:
+            snapshot = await self._run(doc_ref.get)
+        add_count(FIRESTORE_READS, 1)
         if not snapshot.exists:
             return None
-        return self.model_type.model_validate({"id": snapshot.id, **(snapshot.to_dict() or {})})
+        model = model_type or self.model_type
+        return model.model_validate({"id": snapshot.id, **(snapshot.to_dict() or {})})
+
+    @timed("firestore_get_all")
+    async def get_many(
+        self,
+        document_ids: list[str],
+        fields: list[str] | None = None,
+        model_type: Type[BaseModel] | None = None,
+    ) -> dict[str, T]:
+        """Read several documents with a single ``get_all`` call, keyed by id."""
+        model = model_type or self.model_type
+        refs = [self._collection.document(document_id) for document_id in document_ids]
+        kwargs = {"field_paths": fields} if fields else {}
+
+        snapshots = []
+        try:
+            # Try async iteration first
+            async for snapshot in self._client.get_all(refs, **kwargs):
+                snapshots.append(snapshot)
+        except (TypeError, AttributeError):
+            # Fallback to sync iteration if client is sync
+            snapshots = await self._run(lambda: list(self._client.get_all(refs, **kwargs)))
+        add_count(FIRESTORE_READS, len(refs))
+
+        return {
+            snapshot.id: model.model_validate({"id": snapshot.id, **(snapshot.to_dict() or {})})
+            for snapshot in snapshots
+            if snapshot.exists
+        }
 
+    @timed("firestore_delete")
     async def delete(self, document_id: str) -> bool:
+        """Delete in one round trip; the ``exists`` precondition reports missing documents."""
         doc_ref = self._collection.document(document_id)
-        snapshot = await self._run(doc_ref.get)
-        if not snapshot.exists:
+        try:
+            await self._run(doc_ref.delete, option=self._client.write_option(exists=True))
+        except NotFound:
             return False
-        await self._run(doc_ref.delete)
         return True
 
-    async def list_all(self, filters: list[tuple[str, str, Any]] | None = None) -> list[T]:
-        query = self._collection
-        if filters:
-            for field_path, op, value in filters:
-                query = query.where(field_path=field_path, op_string=op, value=value)
+    async def delete_many(self, document_ids: list[str], concurrency: int = 16) -> dict[str, bool]:
+        """Delete documents independently (a batch would fail as a whole on a missing id)."""
+        deleted = await gather_bounded(
+            (self.delete(document_id) for document_id in document_ids), concurrency
+        )
+        return dict(zip(document_ids, deleted))
+
+    @timed("firestore_stream")
+    async def list_all(
+        self,
+        filters: list[tuple[str, str, Any]] | None = None,
+        order_by: list[tuple[str, str]] | None = None,
+        start_after: dict[str, Any] | None = None,
+        limit: int | None = None,
+        fields: list[str] | None = None,
+        model_type: Type[BaseModel] | None = None,
+    ) -> list[T]:
+        """Stream matching documents; ``fields`` projects them server-side with ``select()``."""
+        model = model_type or self.model_type
+        query = self._query(filters)
+        if fields:
+            query = query.select(fields)
+        for field_path, direction in order_by or []:
+            query = query.order_by(field_path, direction=direction)
+        if start_after:
+            query = query.start_after(start_after)
+        if limit:
+            query = query.limit(limit)
         
         items = []
         try:
             # Try async iteration first
             async for doc in query.stream():
-                items.append(self.model_type.model_validate({"id": doc.id, **(doc.to_dict() or {})}))
+                items.append(model.model_validate({"id": doc.id, **(doc.to_dict() or {})}))
         except (TypeError, AttributeError):
             # Fallback to sync iteration if client is sync
             docs = await self._run(lambda: list(query.stream()))
             for doc in docs:
-                items.append(self.model_type.model_validate({"id": doc.id, **(doc.to_dict() or {})}))
-        
+                items.append(model.model_validate({"id": doc.id, **(doc.to_dict() or {})}))
+        # A query is billed at least one read even when it matches nothing.
+        add_count(FIRESTORE_READS, max(len(items), 1))
         return items
 
-    async def save(self, document_id: str, data: T) -> T:
+    @timed("firestore_count")
+    async def count(self, filters: list[tuple[str, str, Any]] | None = None) -> int:
+        """Count matching documents with an aggregation query (no document reads)."""
+        aggregation = self._query(filters).count()
+        result = await self._run(aggregation.get)
+        add_count(FIRESTORE_READS, 1)
+        return int(result[0][0].value)
+
+    def _query(self, filters: list[tuple[str, str, Any]] | None) -> Any:
+        query = self._collection
+        for field_path, op, value in filters or []:
+            query = query.where(field_path=field_path, op_string=op, value=value)
+        return query
+
+    @timed("firestore_set")
+    async def save(
+        self, document_id: str, data: T, extra_fields: dict[str, Any] | None = None
+    ) -> T:
+        """Persist ``data``; ``extra_fields`` are stored alongside it but not on the model."""
         doc_ref = self._collection.document(document_id)
-        payload = data.model_dump(mode="json", exclude_none=True)
         # Ensure ID is not in the body if it's the document name, but we usually keep it for portability
-        await self._run(doc_ref.set, payload)
+        await self._run(doc_ref.set, self._payload(data, extra_fields))
         return data
+
+    @timed("firestore_batch_commit")
+    async def save_many(
+        self, items: list[tuple[str, T, dict[str, Any] | None]]
+    ) -> list[T]:
+        """Persist ``(document_id, data, extra_fields)`` items with batched commits."""
+        commits = []
+        for start in range(0, len(items), WRITE_BATCH_SIZE):
+            batch = self._client.batch()
+            for document_id, data, extra_fields in items[start : start + WRITE_BATCH_SIZE]:
+                batch.set(
+                    self._collection.document(document_id),
+                    self._payload(data, extra_fields),
+                )
+            commits.append(self._run(batch.commit))
+        await asyncio.gather(*commits)
+        return [data for _, data, _ in items]
+
+    @staticmethod
+    def _payload(data: BaseModel, extra_fields: dict[str, Any] | None) -> dict[str, Any]:
+        payload = data.model_dump(mode="json", exclude_none=True)
+        if extra_fields:
+            payload.update(extra_fields)
+        return payload
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Callable, Iterable
+
+from logger import logger
+
+
+class ArtifactCleanupQueue:
+    """Deletes artifact prefixes off the request path, in batches.
+
+    ``schedule()`` only enqueues. A background task collects up to ``batch_size``
+    prefixes, waiting at most ``flush_interval_seconds`` for a batch to fill, and hands
+    them to ``delete_prefixes`` in an executor thread. ``aclose()`` flushes what is left.
+    """
+
+    def __init__(
+        self,
+        delete_prefixes: Callable[[list[str]], int],
+        batch_size: int = 100,
+        flush_interval_seconds: float = 1.0,
+        max_pending: int = 10_000,
+    ) -> None:
+        self._delete_prefixes = delete_prefixes
+        self.batch_size = max(batch_size, 1)
+        self.flush_interval_seconds = flush_interval_seconds
+        self._pending: asyncio.Queue[str] = asyncio.Queue(max_pending)
+        self._batch: list[str] = []
+        self._task: asyncio.Task[None] | None = None
+        self.scheduled = 0
+        self.dropped = 0
+        self.deleted_objects = 0
+        self.failed_batches = 0
+
+    def schedule(self, prefixes: Iterable[str]) -> None:
+        self._start()
+        for prefix in prefixes:
+            try:
+                self._pending.put_nowait(prefix)
+            except asyncio.QueueFull:
+                self.dropped += 1
+                logger.warning("Artifact cleanup queue full", extra={"prefix": prefix})
+                continue
+            self.scheduled += 1
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "scheduled": self.scheduled,
+            "pending": self._pending.qsize() + len(self._batch),
+            "dropped": self.dropped,
+            "deleted_objects": self.deleted_objects,
+            "failed_batches": self.failed_batches,
+        }
+
+    def _start(self) -> None:
+        if self._task is not None and not self._task.done():
+            return
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def aclose(self) -> None:
+        """Stop the worker and flush whatever is still queued."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        while not self._pending.empty():
+            self._batch.append(self._pending.get_nowait())
+        while self._batch:
+            chunk, self._batch = self._batch[: self.batch_size], self._batch[self.batch_size :]
+            await self._flush(chunk)
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            self._batch.append(await self._pending.get())
+            deadline = loop.time() + self.flush_interval_seconds
+            while len(self._batch) < self.batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    self._batch.append(await asyncio.wait_for(self._pending.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            batch, self._batch = self._batch, []
+            await self._flush(batch)
+
+    async def _flush(self, batch: list[str]) -> None:
+        loop = asyncio.get_running_loop()
+        try:
+            deleted = await loop.run_in_executor(None, self._delete_prefixes, batch)
+        except Exception as exc:
+            self.failed_batches += 1
+            logger.warning(
+                "Artifact cleanup failed", extra={"count": len(batch), "error": str(exc)}
+            )
+            return
+        self.deleted_objects += deleted
+        logger.info("Artifacts cleaned up", extra={"prefixes": len(batch), "objects": deleted})
@@ -2,22 +2,68 @@ from __future__ import annotations
 
 import asyncio
 from typing import Any
-from uuid import uuid4
 
-from models.dtos import Generator
-from shared.time import now_iso
-from interfaces.repositories import GeneratorMetadataPort
+from logger import logger
+from models.dtos import COMPUTED_FIELDS, ArtifactRef, Generator, GeneratorProjection
+from shared.cache import LRUCache
+from shared.tags import NORMALIZED_TAGS_FIELD, normalize_tags
+from interfaces.repositories import CatalogChangeCallback, GeneratorMetadataPort
 from repositories.base import FirestoreRepository
+from repositories.replica import CatalogReplica
+
+# Matches the composite indexes in firestore.indexes.json.
+LIST_ORDER = [("updated_at", "DESCENDING"), ("id", "DESCENDING")]
+
+TAG_COUNT_TTL_SECONDS = 300
+RESIDUAL_TAG_BATCH_SIZE = 100
+BACKFILL_BATCH_SIZE = 400
 
 
 class FirestoreMetadataAdapter(FirestoreRepository[Generator], GeneratorMetadataPort):
-    def __init__(self, project_id: str, database_id: str, collection_name: str):
+    """Generator metadata in Firestore.
+
+    With a ``replica``, lists and gets are served from its in-memory index once it has
+    synced, and from Firestore until then or while its listener is down.
+    """
+
+    def __init__(
+        self,
+        project_id: str,
+        database_id: str,
+        collection_name: str,
+        replica: CatalogReplica | None = None,
+    ):
         super().__init__(
             project_id=project_id,
             database_id=database_id,
             collection_name=collection_name,
             model_type=Generator,
         )
+        self._tag_counts: LRUCache[tuple[Any, ...], int] = LRUCache(512)
+        self._replica = replica
+
+    def _synced_replica(self) -> CatalogReplica | None:
+        if self._replica is None or not self._replica.synced:
+            return None
+        return self._replica
+
+    async def start(self) -> None:
+        if self._replica is not None:
+            await self._replica.start()
+
+    def watch(self, callback: CatalogChangeCallback) -> bool:
+        if self._replica is None:
+            return False
+        self._replica.watch(callback)
+        return True
+
+    def replica_stats(self) -> dict[str, Any] | None:
+        return self._replica.stats() if self._replica is not None else None
+
+    async def aclose(self) -> None:
+        if self._replica is not None:
+            await self._replica.aclose()
+        await super().aclose()
 
     async def list_generators(
         self,
@@ -26,7 +72,25 @@ class FirestoreMetadataAdapter(FirestoreRepository[Generator], GeneratorMetadata
         version: str | None = None,
         stack: str | None = None,
         tag: list[str] | None = None,
-    ) -> list[Generator]:
+        limit: int | None = None,
+        start_after: tuple[str, str] | None = None,
+        fields: list[str] | None = None,
+    ) -> list[Generator] | list[GeneratorProjection]:
+        replica = self._synced_replica()
+        if replica is not None:
+            items = replica.index.query(
+                language=language,
+                version=version,
+                stack=stack,
+                tags=tag,
+                limit=limit,
+                start_after=start_after,
+            )
+            if fields:
+                sort_keys = ["updated_at", *fields]
+                return [GeneratorProjection.from_generator(item, sort_keys) for item in items]
+            return items
+
         filters = []
         if language:
             filters.append(("language", "==", language))
@@ -35,51 +99,184 @@ class FirestoreMetadataAdapter(FirestoreRepository[Generator], GeneratorMetadata
         if stack:
             filters.append(("stack", "==", stack))
 
-        items = await self.list_all(filters=filters)
+        residual_tags: set[str] = set()
+        required_tags = normalize_tags(tag)
+        if required_tags:
+            primary_tag = await self._most_selective_tag(filters, required_tags)
+            filters.append((NORMALIZED_TAGS_FIELD, "array_contains", primary_tag))
+            residual_tags = set(required_tags) - {primary_tag}
+
+        projection: dict[str, Any] = {}
+        if fields:
+            # Cursors need the sort keys and residual tag checks need the tags.
+            selected = {*fields, *(name for name, _ in LIST_ORDER)} - COMPUTED_FIELDS
+            if residual_tags:
+                selected.add("tags")
+            projection = {"fields": sorted(selected), "model_type": GeneratorProjection}
 
-        if tag:
-            required_tags = {t.casefold() for t in tag}
-            items = [
-                item
-                for item in items
-                if required_tags.issubset({val.casefold() for val in (item.tags or [])})
-            ]
+        cursor = None
+        if start_after:
+            cursor = {"updated_at": start_after[0], "id": start_after[1]}
 
-        items.sort(key=lambda x: x.updated_at, reverse=True)
-        return items
+        if not residual_tags:
+            return await self.list_all(
+                filters=filters,
+                order_by=LIST_ORDER,
+                start_after=cursor,
+                limit=limit,
+                **projection,
+            )
+        return await self._list_with_residual_tags(
+            filters, residual_tags, cursor, limit, projection
+        )
+
+    async def _list_with_residual_tags(
+        self,
+        filters: list[tuple[str, str, Any]],
+        residual_tags: set[str],
+        cursor: dict[str, Any] | None,
+        limit: int | None,
+        projection: dict[str, Any],
+    ) -> list[Generator] | list[GeneratorProjection]:
+        # Firestore allows a single array_contains per query, so any other required
+        # tags are checked here, reading further batches until the page is full.
+        batch_size = max((limit or 0) * 2, RESIDUAL_TAG_BATCH_SIZE)
+        matches: list[Generator] = []
+        while True:
+            batch = await self.list_all(
+                filters=filters,
+                order_by=LIST_ORDER,
+                start_after=cursor,
+                limit=batch_size,
+                **projection,
+            )
+            matches.extend(
+                item for item in batch if residual_tags.issubset(normalize_tags(item.tags))
+            )
+            if len(batch) < batch_size or (limit and len(matches) >= limit):
+                break
+            cursor = {"updated_at": batch[-1].updated_at, "id": batch[-1].id}
+        return matches[:limit] if limit else matches
 
-    async def get_generator(self, generator_id: str) -> Generator | None:
-        return await self.get(generator_id)
+    async def _most_selective_tag(
+        self, filters: list[tuple[str, str, Any]], tags: list[str]
+    ) -> str:
+        if len(tags) == 1:
+            return tags[0]
+        counts = await asyncio.gather(*(self._tag_count(filters, tag) for tag in tags))
+        return min(zip(counts, range(len(tags)), tags))[2]
+
+    async def _tag_count(self, filters: list[tuple[str, str, Any]], tag: str) -> float:
+        key = (*filters, tag)
+        cached = self._tag_counts.get(key)
+        if cached is not None:
+            return cached.value
+        try:
+            count = await self.count([*filters, (NORMALIZED_TAGS_FIELD, "array_contains", tag)])
+        except Exception as exc:
+            logger.warning("Tag count query failed", extra={"tag": tag, "error": str(exc)})
+            return float("inf")
+        self._tag_counts.set(key, count, TAG_COUNT_TTL_SECONDS)
+        return count
+
+    async def backfill_normalized_tags(self) -> int:
+        """Write ``tags_normalized`` on documents created before it existed."""
+        docs = []
+        try:
+            async for doc in self._collection.stream():
+                docs.append(doc)
+        except (TypeError, AttributeError):
+            docs = await self._run(lambda: list(self._collection.stream()))
+
+        stale = []
+        for doc in docs:
+            data = doc.to_dict() or {}
+            expected = normalize_tags(data.get("tags"))
+            if data.get(NORMALIZED_TAGS_FIELD) != expected:
+                stale.append((doc.reference, expected))
+
+        for start in range(0, len(stale), BACKFILL_BATCH_SIZE):
+            batch = self._client.batch()
+            for reference, expected in stale[start : start + BACKFILL_BATCH_SIZE]:
+                batch.update(reference, {NORMALIZED_TAGS_FIELD: expected})
+            await self._run(batch.commit)
+        return len(stale)
+
+    async def get_generator(
+        self, generator_id: str, fields: list[str] | None = None
+    ) -> Generator | GeneratorProjection | None:
+        replica = self._synced_replica()
+        if replica is not None:
+            item = replica.index.get(generator_id)
+            if item and fields:
+                return GeneratorProjection.from_generator(item, fields)
+            return item
+
+        if not fields:
+            return await self.get(generator_id)
+        selected = sorted(set(fields) - COMPUTED_FIELDS)
+        return await self.get(generator_id, fields=selected, model_type=GeneratorProjection)
+
+    async def get_generators(
+        self, generator_ids: list[str], fields: list[str] | None = None
+    ) -> dict[str, Generator | GeneratorProjection]:
+        replica = self._synced_replica()
+        if replica is not None:
+            found = {}
+            for generator_id in generator_ids:
+                item = replica.index.get(generator_id)
+                if item:
+                    found[generator_id] = (
+                        GeneratorProjection.from_generator(item, fields) if fields else item
+                    )
+            return found
+
+        if not fields:
+            return await self.get_many(generator_ids)
+        selected = sorted(set(fields) - COMPUTED_FIELDS)
+        return await self.get_many(
+            generator_ids, fields=selected, model_type=GeneratorProjection
+        )
 
     async def create_generator(self, body: dict[str, Any]) -> Generator:
-        now = now_iso()
-        generator_id = f"gen_{uuid4().hex[:12]}"
-
-        artifact = {
-            "bucket": body.get("upload", {}).get("bucket") or "",
-            "object": f"{generator_id}/generator.zip",
-            "content_type": body.get("upload", {}).get(
-                "content_type", "application/zip"
-            ),
-        }
+        generator = Generator.new(body)
+        saved = await self.save(generator.id, generator, extra_fields=self._extra_fields(generator))
+        if self._replica is not None:
+            # Read-your-writes before the listener delivers the change.
+            self._replica.upsert(saved)
+        return saved
 
-        item_data = {
-            "id": generator_id,
-            "name": body["name"],
-            "description": body.get("description"),
-            "language": body["language"],
-            "stack": body.get("stack"),
-            "version": body.get("version"),
-            "tags": body.get("tags", []),
-            "entrypoint": body.get("entrypoint"),
-            "upload_status": "pending",
-            "artifact": artifact,
-            "created_at": now,
-            "updated_at": now,
-        }
+    async def create_generators(self, bodies: list[dict[str, Any]]) -> list[Generator]:
+        generators = [Generator.new(body) for body in bodies]
+        saved = await self.save_many(
+            [(generator.id, generator, self._extra_fields(generator)) for generator in generators]
+        )
+        if self._replica is not None:
+            for generator in saved:
+                self._replica.upsert(generator)
+        return saved
 
-        generator = Generator.model_validate(item_data)
-        return await self.save(generator_id, generator)
+    @staticmethod
+    def _extra_fields(generator: Generator) -> dict[str, Any]:
+        return {NORMALIZED_TAGS_FIELD: normalize_tags(generator.tags)}
 
     async def delete_generator(self, generator_id: str) -> bool:
-        return await self.delete(generator_id)
+        deleted = await self.delete(generator_id)
+        if self._replica is not None:
+            self._replica.remove(generator_id)
+        return deleted
+
+    async def delete_generators(
+        self, generator_ids: list[str]
+    ) -> dict[str, ArtifactRef | None]:
+        # Artifact paths are read first: legacy records do not keep them under the id.
+        records = await self.get_generators(generator_ids, fields=["artifact"])
+        results = await self.delete_many(generator_ids)
+        if self._replica is not None:
+            for generator_id in generator_ids:
+                self._replica.remove(generator_id)
+        return {
+            generator_id: getattr(records.get(generator_id), "artifact", None)
+            for generator_id, deleted in results.items()
+            if deleted
+        }
@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+from bisect import bisect_left, insort
+from typing import Iterator
+
+from pydantic import ConfigDict
+
+from models.dtos import ArtifactRef, Generator
+from shared.tags import normalize_tags
+
+# Fields with an exact-match hash index.
+INDEXED_FIELDS = ("language", "stack", "version")
+
+# Below this share of all records, sorting the matching ids beats walking the order.
+SPARSE_MATCH_RATIO = 0.125
+
+
+class FrozenArtifactRef(ArtifactRef):
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
+
+class FrozenGenerator(Generator):
+    """Stored generator record, immutable down to its tags and artifact, so readers can
+    share it; assignment is rejected and ``tags`` is a tuple."""
+
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
+    tags: tuple[str, ...] = ()
+    artifact: FrozenArtifactRef | None = None
+
+
+def _order_key(generator: Generator) -> tuple[str, str]:
+    return (generator.updated_at or "", generator.id)
+
+
+class GeneratorIndex:
+    """In-memory generator records with secondary indexes, kept up to date per write.
+
+    Holds hash indexes on ``INDEXED_FIELDS``, an inverted index of normalized tags and
+    a list of ``(updated_at, id)`` keys kept sorted ascending. Records are frozen and
+    replaced on write rather than mutated, so reads return them without copying.
+    """
+
+    def __init__(self) -> None:
+        self._records: dict[str, FrozenGenerator] = {}
+        self._by_field: dict[str, dict[str, set[str]]] = {name: {} for name in INDEXED_FIELDS}
+        self._by_tag: dict[str, set[str]] = {}
+        self._order: list[tuple[str, str]] = []
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def __contains__(self, generator_id: object) -> bool:
+        return generator_id in self._records
+
+    def get(self, generator_id: str) -> FrozenGenerator | None:
+        return self._records.get(generator_id)
+
+    def upsert(self, generator: Generator) -> FrozenGenerator:
+        record = (
+            generator
+            if isinstance(generator, FrozenGenerator)
+            else FrozenGenerator.model_validate(generator.model_dump())
+        )
+        self.remove(record.id)
+        self._records[record.id] = record
+        for name in INDEXED_FIELDS:
+            value = getattr(record, name)
+            if value is not None:
+                self._by_field[name].setdefault(value, set()).add(record.id)
+        for tag in normalize_tags(record.tags):
+            self._by_tag.setdefault(tag, set()).add(record.id)
+        insort(self._order, _order_key(record))
+        return record
+
+    def remove(self, generator_id: str) -> FrozenGenerator | None:
+        record = self._records.pop(generator_id, None)
+        if record is None:
+            return None
+        for name in INDEXED_FIELDS:
+            value = getattr(record, name)
+            if value is not None:
+                self._discard(self._by_field[name], value, generator_id)
+        for tag in normalize_tags(record.tags):
+            self._discard(self._by_tag, tag, generator_id)
+        key = _order_key(record)
+        position = bisect_left(self._order, key)
+        if position < len(self._order) and self._order[position] == key:
+            del self._order[position]
+        return record
+
+    def query(
+        self,
+        *,
+        language: str | None = None,
+        version: str | None = None,
+        stack: str | None = None,
+        tags: list[str] | None = None,
+        limit: int | None = None,
+        start_after: tuple[str, str] | None = None,
+    ) -> list[FrozenGenerator]:
+        """Matching records ordered by ``(updated_at, id)`` descending."""
+        candidates = self._candidates(
+            {"language": language, "version": version, "stack": stack}, tags
+        )
+        if candidates is None or len(candidates) > len(self._records) * SPARSE_MATCH_RATIO:
+            keys = self._walk_order(start_after)
+        else:
+            keys = iter(sorted((_order_key(self._records[i]) for i in candidates), reverse=True))
+            if start_after is not None:
+                keys = (key for key in keys if key < start_after)
+
+        results: list[FrozenGenerator] = []
+        for _, generator_id in keys:
+            if candidates is not None and generator_id not in candidates:
+                continue
+            results.append(self._records[generator_id])
+            if limit and len(results) >= limit:
+                break
+        return results
+
+    def _candidates(
+        self, filters: dict[str, str | None], tags: list[str] | None
+    ) -> set[str] | None:
+        """Intersect the matching index entries, smallest first; None means no filter."""
+        postings = [
+            self._by_field[name].get(value, set())
+            for name, value in filters.items()
+            if value
+        ]
+        postings += [self._by_tag.get(tag, set()) for tag in normalize_tags(tags)]
+        if not postings:
+            return None
+        postings.sort(key=len)
+        candidates = set(postings[0])
+        for posting in postings[1:]:
+            candidates &= posting
+            if not candidates:
+                break
+        return candidates
+
+    def _walk_order(self, start_after: tuple[str, str] | None) -> Iterator[tuple[str, str]]:
+        end = bisect_left(self._order, start_after) if start_after else len(self._order)
+        for position in range(end - 1, -1, -1):
+            yield self._order[position]
+
+    @staticmethod
+    def _discard(index: dict[str, set[str]], value: str, generator_id: str) -> None:
+        ids = index.get(value)
+        if ids is None:
+            return
+        ids.discard(generator_id)
+        if not ids:
+            del index[value]
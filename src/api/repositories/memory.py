@@ -1,20 +1,23 @@
 from __future__ import annotations
 
-from copy import deepcopy
 from dataclasses import dataclass, field
 from typing import Any
-from uuid import uuid4
 
-from models.dtos import Generator
-from shared.time import now_iso
-from interfaces.repositories import GeneratorMetadataPort
+from models.dtos import ArtifactRef, Generator, GeneratorProjection
+from interfaces.repositories import CatalogChangeCallback, GeneratorMetadataPort
+from repositories.index import FrozenGenerator, GeneratorIndex
 
 
 @dataclass(slots=True)
 class InMemoryMetadataAdapter(GeneratorMetadataPort):
-    """Local adapter used for development and testing."""
+    """Local adapter used for development, testing and load tests.
 
-    _items_by_id: dict[str, Generator] = field(init=False)
+    Backed by a ``GeneratorIndex``: filters use its hash and tag indexes, ordering
+    comes from its sorted keys, and stored records are frozen so they are returned
+    without copying.
+    """
+
+    _index: GeneratorIndex = field(init=False)
 
     def __post_init__(self) -> None:
         seed_items = [
@@ -73,9 +76,9 @@ class InMemoryMetadataAdapter(GeneratorMetadataPort):
                 "updated_at": "2026-02-12T09:20:00Z",
             },
         ]
-        self._items_by_id = {
-            item["id"]: Generator.model_validate(item) for item in seed_items
-        }
+        self._index = GeneratorIndex()
+        for item in seed_items:
+            self._index.upsert(FrozenGenerator.model_validate(item))
 
     async def list_generators(
         self,
@@ -84,59 +87,65 @@ class InMemoryMetadataAdapter(GeneratorMetadataPort):
         version: str | None = None,
         stack: str | None = None,
         tag: list[str] | None = None,
-    ) -> list[Generator]:
-        items = list(self._items_by_id.values())
-
-        if language:
-            items = [item for item in items if item.language == language]
-        if version:
-            items = [item for item in items if item.version == version]
-        if stack:
-            items = [item for item in items if item.stack == stack]
-        if tag:
-            required_tags = {value.casefold() for value in tag}
-            items = [
-                item
-                for item in items
-                if required_tags.issubset(
-                    {value.casefold() for value in (item.tags or [])}
-                )
-            ]
-
-        items.sort(key=lambda item: str(item.updated_at), reverse=True)
-        return [deepcopy(item) for item in items]
-
-    async def get_generator(self, generator_id: str) -> Generator | None:
-        item = self._items_by_id.get(generator_id)
-        return deepcopy(item) if item else None
+        limit: int | None = None,
+        start_after: tuple[str, str] | None = None,
+        fields: list[str] | None = None,
+    ) -> list[Generator] | list[GeneratorProjection]:
+        items = self._index.query(
+            language=language,
+            version=version,
+            stack=stack,
+            tags=tag,
+            limit=limit,
+            start_after=start_after,
+        )
+        if fields:
+            sort_keys = ["updated_at", *fields]
+            return [GeneratorProjection.from_generator(item, sort_keys) for item in items]
+        return items
+
+    async def get_generator(
+        self, generator_id: str, fields: list[str] | None = None
+    ) -> Generator | GeneratorProjection | None:
+        item = self._index.get(generator_id)
+        if item and fields:
+            return GeneratorProjection.from_generator(item, fields)
+        return item
+
+    async def get_generators(
+        self, generator_ids: list[str], fields: list[str] | None = None
+    ) -> dict[str, Generator | GeneratorProjection]:
+        found = {}
+        for generator_id in generator_ids:
+            item = await self.get_generator(generator_id, fields=fields)
+            if item:
+                found[generator_id] = item
+        return found
 
     async def create_generator(self, body: dict[str, Any]) -> Generator:
-        now = now_iso()
-        generator_id = f"gen_{uuid4().hex[:12]}"
-        artifact = {
-            "bucket": "constructio-generators",
-            "object": f"{generator_id}/generator.zip",
-            "content_type": body.get("upload", {}).get(
-                "content_type", "application/zip"
-            ),
-        }
-        item_data = {
-            "id": generator_id,
-            "name": body["name"],
-            "description": body.get("description"),
-            "language": body["language"],
-            "stack": body.get("stack"),
-            "version": body.get("version"),
-            "tags": body.get("tags", []),
-            "entrypoint": body.get("entrypoint"),
-            "upload_status": "pending",
-            "artifact": artifact,
-            "created_at": now,
-            "updated_at": now,
-        }
-        generator = Generator.model_validate(item_data)
-        self._items_by_id[generator_id] = generator
-        return deepcopy(generator)
+        return self._index.upsert(FrozenGenerator.new(body, bucket="constructio-generators"))
+
+    async def start(self) -> None:
+        return None
+
+    def watch(self, callback: CatalogChangeCallback) -> bool:
+        return False
+
+    async def aclose(self) -> None:
+        return None
+
+    async def create_generators(self, bodies: list[dict[str, Any]]) -> list[Generator]:
+        return [await self.create_generator(body) for body in bodies]
 
     async def delete_generator(self, generator_id: str) -> bool:
-        return self._items_by_id.pop(generator_id, None) is not None
+        return self._index.remove(generator_id) is not None
+
+    async def delete_generators(
+        self, generator_ids: list[str]
+    ) -> dict[str, ArtifactRef | None]:
+        deleted = {}
+        for generator_id in generator_ids:
+            removed = self._index.remove(generator_id)
+            if removed is not None:
+                deleted[generator_id] = removed.artifact
+        return deleted
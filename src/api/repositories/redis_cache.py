@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+from interfaces.cache import SharedCachePort
+
+# Keys deleted per UNLINK when a prefix is cleared.
+CLEAR_BATCH_SIZE = 500
+
+
+class RedisSharedCache(SharedCachePort):
+    """Shared cache tier in Redis or Memorystore; needs the ``redis`` package (``cache`` extra)."""
+
+    def __init__(self, url: str) -> None:
+        # Imported here so deployments without a shared tier do not need the package.
+        from redis import asyncio as redis
+
+        self._client = redis.from_url(url)
+
+    async def get(self, key: str) -> bytes | None:
+        return await self._client.get(key)
+
+    async def set(self, key: str, value: bytes, ttl_seconds: float) -> None:
+        await self._client.set(key, value, px=max(int(ttl_seconds * 1000), 1))
+
+    async def clear(self, prefix: str) -> None:
+        batch: list[bytes] = []
+        async for key in self._client.scan_iter(match=f"{prefix}*", count=CLEAR_BATCH_SIZE):
+            batch.append(key)
+            if len(batch) >= CLEAR_BATCH_SIZE:
+                await self._client.unlink(*batch)
+                batch.clear()
+        if batch:
+            await self._client.unlink(*batch)
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from datetime import datetime
+from typing import Any, Callable, Protocol
+
+from interfaces.repositories import CatalogChangeCallback
+from logger import logger
+from models.dtos import Generator
+from repositories.index import FrozenGenerator, GeneratorIndex
+
+SnapshotCallback = Callable[[list[Any], list[Any], datetime], None]
+
+
+class ListenerHandle(Protocol):
+    def unsubscribe(self) -> None: ...
+
+
+# Starts a listener that calls back with ``(documents, changes, read_time)`` from its
+# own thread, as ``CollectionReference.on_snapshot`` does, and returns its handle.
+Subscribe = Callable[[SnapshotCallback], ListenerHandle]
+
+
+def collection_listener(project_id: str, database_id: str, collection_name: str) -> Subscribe:
+    """Subscribe to a whole collection through a sync client's ``on_snapshot``."""
+
+    def subscribe(callback: SnapshotCallback) -> ListenerHandle:
+        from google.cloud import firestore
+
+        # The async client cannot listen, so the stream gets a sync client of its own.
+        client = firestore.Client(project=project_id, database=database_id)
+        return client.collection(collection_name).on_snapshot(callback)
+
+    return subscribe
+
+
+class CatalogReplica:
+    """In-process copy of the generators collection, kept current by a snapshot listener.
+
+    Listener callbacks arrive on the listener's thread, which validates the changed
+    documents; only the finished change set is handed to the event loop, so the
+    ``GeneratorIndex`` is only touched from the loop. The replica serves reads
+    once the first snapshot (the full collection) has been applied and while the
+    listener is active; callers read from Firestore until then.
+    """
+
+    def __init__(self, subscribe: Subscribe, clock: Callable[[], float] = time.time) -> None:
+        self.index = GeneratorIndex()
+        self._subscribe = subscribe
+        self._clock = clock
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._handle: ListenerHandle | None = None
+        self._synced = False
+        self._snapshots = 0
+        self._lag_seconds: float | None = None
+        self._applied_at: float | None = None
+        self._watchers: list[CatalogChangeCallback] = []
+
+    async def start(self) -> None:
+        """Start listening; a no-op when already started.
+
+        Building the sync client resolves credentials and opening the stream makes
+        network calls, so both run in a worker thread. A failure is logged and leaves
+        the replica unsynced, so reads keep going to Firestore.
+        """
+        if self._loop is not None:
+            return
+        self._loop = asyncio.get_running_loop()
+        try:
+            self._handle = await asyncio.to_thread(self._subscribe, self._on_snapshot)
+        except Exception as exc:
+            logger.warning("Catalog replica failed to start", extra={"error": str(exc)})
+            return
+        logger.info("Catalog replica listening")
+
+    def watch(self, callback: CatalogChangeCallback) -> None:
+        """Call ``callback(upserted, removed_ids)`` on the loop for every applied snapshot."""
+        self._watchers.append(callback)
+
+    @property
+    def synced(self) -> bool:
+        """True when reads can be served locally."""
+        if not self._synced or self._handle is None:
+            return False
+        return getattr(self._handle, "is_active", True)
+
+    def _on_snapshot(self, documents: list[Any], changes: list[Any], read_time: datetime) -> None:
+        loop = self._loop
+        if loop is None or loop.is_closed():
+            return
+        # Validation is the costly part of a snapshot (the first one holds the whole
+        # collection), so it runs here rather than on the loop.
+        generators, removed = self._parse(changes)
+        try:
+            loop.call_soon_threadsafe(self._apply, generators, removed, read_time)
+        except RuntimeError:
+            # The loop closed between the check and the call; nothing left to serve.
+            pass
+
+    @staticmethod
+    def _parse(changes: list[Any]) -> tuple[list[FrozenGenerator], list[str]]:
+        generators: list[FrozenGenerator] = []
+        removed: list[str] = []
+        for change in changes:
+            document = change.document
+            if change.type.name == "REMOVED":
+                removed.append(document.id)
+                continue
+            data = {"id": document.id, **(document.to_dict() or {})}
+            try:
+                generators.append(FrozenGenerator.model_validate(data))
+            except ValueError as exc:
+                logger.warning(
+                    "Skipping invalid generator document",
+                    extra={"generator_id": document.id, "error": str(exc)},
+                )
+        return generators, removed
+
+    def _apply(
+        self, generators: list[FrozenGenerator], removed: list[str], read_time: datetime
+    ) -> None:
+        # A snapshot lists each document once, so removals and upserts do not overlap.
+        for generator_id in removed:
+            self.index.remove(generator_id)
+        upserted: list[Generator] = [self.index.upsert(generator) for generator in generators]
+        for watcher in self._watchers:
+            watcher(upserted, removed)
+        now = self._clock()
+        self._applied_at = now
+        self._lag_seconds = max(now - read_time.timestamp(), 0.0)
+        self._snapshots += 1
+        if not self._synced:
+            self._synced = True
+            logger.info("Catalog replica synced", extra={"documents": len(self.index)})
+
+    def upsert(self, generator: Generator) -> None:
+        """Apply a write made by this process before its snapshot arrives."""
+        self.index.upsert(generator)
+
+    def remove(self, generator_id: str) -> None:
+        self.index.remove(generator_id)
+
+    def stats(self) -> dict[str, Any]:
+        """Replica health for metrics.
+
+        ``lag_seconds`` is the delay from the last snapshot's read time to its apply;
+        ``staleness_seconds`` is the time since a snapshot was last applied, which also
+        grows while the collection is quiet.
+        """
+        return {
+            "synced": self.synced,
+            "documents": len(self.index),
+            "snapshots": self._snapshots,
+            "lag_seconds": self._lag_seconds,
+            "staleness_seconds": (
+                self._clock() - self._applied_at if self._applied_at is not None else None
+            ),
+        }
+
+    async def aclose(self) -> None:
+        handle, self._handle = self._handle, None
+        self._synced = False
+        if handle is not None:
+            # Closing the stream joins its thread, so keep it off the loop.
+            await asyncio.to_thread(handle.unsubscribe)
@@ -0,0 +1,201 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from typing import Any, Callable
+
+from logger import logger
+
+try:
+    from google.auth.credentials import Signing
+except ImportError:
+    Signing = None  # type: ignore
+
+
+class CredentialRefresher:
+    """Shares one access token across executor threads and refreshes it ahead of expiry.
+
+    ``token()`` only refreshes under a lock (double-checked), so concurrent signers never
+    refresh at the same time. ``start()`` schedules a background task that refreshes the
+    credentials shortly before they expire, keeping refreshes off the request path.
+    """
+
+    def __init__(
+        self,
+        credentials: Any,
+        request_factory: Callable[[], Any] | None,
+        refresh_margin_seconds: float = 300.0,
+    ) -> None:
+        self._credentials = credentials
+        self._request_factory = request_factory
+        self.refresh_margin_seconds = refresh_margin_seconds
+        self.refreshes = 0
+        self._lock = threading.Lock()
+        self._task: asyncio.Task[None] | None = None
+
+    def token(self) -> str | None:
+        if not self._credentials or self._request_factory is None:
+            return None
+        if self._needs_refresh():
+            self.refresh_if_needed()
+        return getattr(self._credentials, "token", None)
+
+    def refresh_if_needed(self) -> None:
+        with self._lock:
+            if not self._needs_refresh():
+                return
+            self._credentials.refresh(self._request_factory())
+            self.refreshes += 1
+
+    def seconds_until_refresh(self) -> float:
+        expiry = getattr(self._credentials, "expiry", None)
+        if expiry is None:
+            return self.refresh_margin_seconds
+        now = datetime.now(UTC).replace(tzinfo=None)
+        return (expiry - now).total_seconds() - self.refresh_margin_seconds
+
+    def _needs_refresh(self) -> bool:
+        if not getattr(self._credentials, "valid", False):
+            return True
+        if getattr(self._credentials, "expired", False):
+            return True
+        return self.seconds_until_refresh() <= 0
+
+    def start(self) -> None:
+        """Start the background refresh loop on the running event loop (idempotent)."""
+        if self._task is not None and not self._task.done():
+            return
+        if self._request_factory is None:
+            return
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def aclose(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            try:
+                await loop.run_in_executor(None, self.refresh_if_needed)
+            except Exception as exc:
+                logger.warning("Credential refresh failed", extra={"error": str(exc)})
+                await asyncio.sleep(5)
+                continue
+            await asyncio.sleep(max(self.seconds_until_refresh(), 5.0))
+
+
+@dataclass(slots=True)
+class SignerStats:
+    local_signatures: int = 0
+    remote_signatures: int = 0
+    coalesced: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+    started_at: float = field(default_factory=time.monotonic)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def record(self, seconds: float, *, remote: bool) -> None:
+        with self._lock:
+            if remote:
+                self.remote_signatures += 1
+            else:
+                self.local_signatures += 1
+            self.total_seconds += seconds
+            self.max_seconds = max(self.max_seconds, seconds)
+
+    def snapshot(self) -> dict[str, float]:
+        with self._lock:
+            signatures = self.local_signatures + self.remote_signatures
+            uptime = max(time.monotonic() - self.started_at, 1e-9)
+            return {
+                "signatures": signatures,
+                "local_signatures": self.local_signatures,
+                "remote_signatures": self.remote_signatures,
+                "coalesced": self.coalesced,
+                "signatures_per_second": signatures / uptime,
+                "avg_latency_ms": (self.total_seconds / signatures * 1000) if signatures else 0.0,
+                "max_latency_ms": self.max_seconds * 1000,
+            }
+
+
+class UrlSigner:
+    """Signs V4 URLs locally when the credentials hold a private key, else via IAM signBlob.
+
+    IAM has no batch signing API, so remote signing is bounded by a semaphore and identical
+    concurrent requests (same object, method and window-aligned expiry) share one signBlob call.
+    """
+
+    def __init__(
+        self,
+        credentials: Any,
+        refresher: CredentialRefresher,
+        signer_email: str | None,
+        max_concurrent_remote: int = 8,
+    ) -> None:
+        self._refresher = refresher
+        self._signer_email = signer_email
+        self.signs_locally = (
+            Signing is not None
+            and isinstance(credentials, Signing)
+            and signer_email in (None, getattr(credentials, "signer_email", None))
+        )
+        self.stats = SignerStats()
+        self._remote_slots = threading.BoundedSemaphore(max(max_concurrent_remote, 1))
+        self._inflight: dict[tuple[Any, ...], Future[str]] = {}
+        self._inflight_lock = threading.Lock()
+
+    @property
+    def needs_access_token(self) -> bool:
+        return not self.signs_locally and bool(self._signer_email)
+
+    def sign(self, blob: Any, args: dict[str, Any]) -> str:
+        if not self.needs_access_token:
+            started = time.perf_counter()
+            url = blob.generate_signed_url(**args)
+            self.stats.record(time.perf_counter() - started, remote=False)
+            return url
+        return self._sign_remote(blob, args)
+
+    def _sign_remote(self, blob: Any, args: dict[str, Any]) -> str:
+        key = (blob.name, *sorted(args.items()))
+        with self._inflight_lock:
+            pending = self._inflight.get(key)
+            if pending is None:
+                pending = self._inflight[key] = Future()
+                owner = True
+            else:
+                owner = False
+
+        if not owner:
+            with self.stats._lock:
+                self.stats.coalesced += 1
+            return pending.result()
+
+        try:
+            started = time.perf_counter()
+            with self._remote_slots:
+                url = blob.generate_signed_url(
+                    **args,
+                    service_account_email=self._signer_email,
+                    access_token=self._refresher.token(),
+                )
+            self.stats.record(time.perf_counter() - started, remote=True)
+            pending.set_result(url)
+            return url
+        except BaseException as exc:
+            pending.set_exception(exc)
+            raise
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(key, None)
@@ -0,0 +1,282 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import queue
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator, TypeVar
+
+from interfaces.repositories import CatalogChangeCallback, GeneratorMetadataPort
+from models.dtos import COMPUTED_FIELDS, ArtifactRef, Generator, GeneratorProjection
+from shared.concurrency import executor_queue_depth
+from shared.tags import normalize_tags
+
+T = TypeVar("T")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS generators (
+    id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    description TEXT,
+    language TEXT NOT NULL,
+    stack TEXT,
+    version TEXT,
+    tags TEXT NOT NULL DEFAULT '[]',
+    entrypoint TEXT,
+    upload_status TEXT NOT NULL,
+    artifact TEXT,
+    created_at TEXT,
+    updated_at TEXT NOT NULL DEFAULT ''
+);
+CREATE INDEX IF NOT EXISTS generators_updated ON generators (updated_at DESC, id DESC);
+CREATE INDEX IF NOT EXISTS generators_language
+    ON generators (language, updated_at DESC, id DESC);
+CREATE INDEX IF NOT EXISTS generators_stack ON generators (stack, updated_at DESC, id DESC);
+CREATE INDEX IF NOT EXISTS generators_version
+    ON generators (version, updated_at DESC, id DESC);
+CREATE TABLE IF NOT EXISTS generator_tags (
+    tag TEXT NOT NULL,
+    generator_id TEXT NOT NULL REFERENCES generators (id) ON DELETE CASCADE,
+    PRIMARY KEY (tag, generator_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS generator_tags_generator ON generator_tags (generator_id);
+"""
+
+COLUMNS = (
+    "id",
+    "name",
+    "description",
+    "language",
+    "stack",
+    "version",
+    "tags",
+    "entrypoint",
+    "upload_status",
+    "artifact",
+    "created_at",
+    "updated_at",
+)
+JSON_COLUMNS = frozenset({"tags", "artifact"})
+
+INSERT_GENERATOR = (
+    f"INSERT INTO generators ({', '.join(COLUMNS)}) "
+    f"VALUES ({', '.join('?' for _ in COLUMNS)})"
+)
+INSERT_TAG = "INSERT OR IGNORE INTO generator_tags (tag, generator_id) VALUES (?, ?)"
+DELETE_GENERATOR = "DELETE FROM generators WHERE id = ? RETURNING artifact"
+
+
+class SqliteMetadataAdapter(GeneratorMetadataPort):
+    """SQLite metadata store for single-node and local deployments.
+
+    Runs in WAL mode so readers never block the writer. Reads go through a small pool
+    of connections, writes through one connection, all on a dedicated executor so the
+    event loop never waits on disk. Each connection keeps a prepared statement cache.
+    """
+
+    def __init__(
+        self, path: str, read_pool_size: int = 4, statement_cache_size: int = 128
+    ) -> None:
+        self.path = path
+        self.statement_cache_size = statement_cache_size
+        self._executor = ThreadPoolExecutor(
+            max_workers=read_pool_size + 1, thread_name_prefix="sqlite"
+        )
+        self._writer = self._connect()
+        self._writer.executescript(SCHEMA)
+        self._write_lock = threading.Lock()
+        self._readers: queue.Queue[sqlite3.Connection] = queue.Queue()
+        for _ in range(read_pool_size):
+            self._readers.put(self._connect())
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(
+            self.path,
+            check_same_thread=False,
+            isolation_level=None,
+            cached_statements=self.statement_cache_size,
+        )
+        connection.row_factory = sqlite3.Row
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        connection.execute("PRAGMA foreign_keys=ON")
+        connection.execute("PRAGMA busy_timeout=5000")
+        return connection
+
+    def executor_queue_depth(self) -> int:
+        return executor_queue_depth(self._executor)
+
+    async def _run(self, func: Callable[..., T], *args: Any) -> T:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, func, *args)
+
+    @contextmanager
+    def _reader(self) -> Iterator[sqlite3.Connection]:
+        connection = self._readers.get()
+        try:
+            yield connection
+        finally:
+            self._readers.put(connection)
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        with self._write_lock:
+            self._writer.execute("BEGIN IMMEDIATE")
+            try:
+                yield self._writer
+            except BaseException:
+                self._writer.execute("ROLLBACK")
+                raise
+            self._writer.execute("COMMIT")
+
+    async def list_generators(
+        self,
+        *,
+        language: str | None = None,
+        version: str | None = None,
+        stack: str | None = None,
+        tag: list[str] | None = None,
+        limit: int | None = None,
+        start_after: tuple[str, str] | None = None,
+        fields: list[str] | None = None,
+    ) -> list[Generator] | list[GeneratorProjection]:
+        clauses: list[str] = []
+        params: list[Any] = []
+        for column, value in (("language", language), ("version", version), ("stack", stack)):
+            if value:
+                clauses.append(f"{column} = ?")
+                params.append(value)
+        for normalized in normalize_tags(tag):
+            clauses.append(
+                "EXISTS (SELECT 1 FROM generator_tags t WHERE t.tag = ? AND t.generator_id = g.id)"
+            )
+            params.append(normalized)
+        if start_after:
+            clauses.append("(updated_at, id) < (?, ?)")
+            params.extend(start_after)
+
+        columns = self._columns(fields, extra=("updated_at",))
+        sql = f"SELECT {', '.join(columns)} FROM generators g"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY updated_at DESC, id DESC"
+        if limit:
+            sql += " LIMIT ?"
+            params.append(limit)
+
+        rows = await self._run(self._fetch_all, sql, params)
+        return [self._to_model(row, fields) for row in rows]
+
+    async def get_generator(
+        self, generator_id: str, fields: list[str] | None = None
+    ) -> Generator | GeneratorProjection | None:
+        found = await self.get_generators([generator_id], fields=fields)
+        return found.get(generator_id)
+
+    async def get_generators(
+        self, generator_ids: list[str], fields: list[str] | None = None
+    ) -> dict[str, Generator | GeneratorProjection]:
+        if not generator_ids:
+            return {}
+        columns = self._columns(fields)
+        placeholders = ", ".join("?" for _ in generator_ids)
+        sql = f"SELECT {', '.join(columns)} FROM generators WHERE id IN ({placeholders})"
+        rows = await self._run(self._fetch_all, sql, list(generator_ids))
+        return {row["id"]: self._to_model(row, fields) for row in rows}
+
+    async def create_generator(self, body: dict[str, Any]) -> Generator:
+        return (await self.create_generators([body]))[0]
+
+    async def create_generators(self, bodies: list[dict[str, Any]]) -> list[Generator]:
+        generators = [Generator.new(body) for body in bodies]
+        await self._run(self._insert_all, generators)
+        return generators
+
+    async def delete_generator(self, generator_id: str) -> bool:
+        return generator_id in await self.delete_generators([generator_id])
+
+    async def delete_generators(
+        self, generator_ids: list[str]
+    ) -> dict[str, ArtifactRef | None]:
+        return await self._run(self._delete_all, generator_ids)
+
+    async def start(self) -> None:
+        return None
+
+    def watch(self, callback: CatalogChangeCallback) -> bool:
+        return False
+
+    async def aclose(self) -> None:
+        # Running reads hold their connection until they finish, so the executor is
+        # drained first; then every connection is back in the pool and gets closed.
+        await asyncio.to_thread(self._executor.shutdown, wait=True)
+        await asyncio.to_thread(self._close_all)
+
+    def _fetch_all(self, sql: str, params: list[Any]) -> list[sqlite3.Row]:
+        with self._reader() as connection:
+            return connection.execute(sql, params).fetchall()
+
+    def _insert_all(self, generators: list[Generator]) -> None:
+        with self._transaction() as connection:
+            connection.executemany(
+                INSERT_GENERATOR, [self._to_row(generator) for generator in generators]
+            )
+            connection.executemany(
+                INSERT_TAG,
+                [
+                    (tag, generator.id)
+                    for generator in generators
+                    for tag in normalize_tags(generator.tags)
+                ],
+            )
+
+    def _delete_all(self, generator_ids: list[str]) -> dict[str, ArtifactRef | None]:
+        deleted = {}
+        with self._transaction() as connection:
+            for generator_id in generator_ids:
+                row = connection.execute(DELETE_GENERATOR, (generator_id,)).fetchone()
+                if row is not None:
+                    artifact = json.loads(row["artifact"]) if row["artifact"] else None
+                    deleted[generator_id] = (
+                        ArtifactRef.model_validate(artifact) if artifact else None
+                    )
+        return deleted
+
+    def _close_all(self) -> None:
+        with self._write_lock:
+            self._writer.close()
+        while not self._readers.empty():
+            self._readers.get_nowait().close()
+
+    @staticmethod
+    def _columns(fields: list[str] | None, extra: tuple[str, ...] = ()) -> list[str]:
+        if not fields:
+            return list(COLUMNS)
+        selected = {"id", *fields, *extra} - COMPUTED_FIELDS
+        return [column for column in COLUMNS if column in selected]
+
+    @staticmethod
+    def _to_row(generator: Generator) -> tuple[Any, ...]:
+        data = generator.model_dump(mode="json")
+        data["updated_at"] = data["updated_at"] or ""
+        return tuple(
+            json.dumps(data[column]) if column in JSON_COLUMNS else data[column]
+            for column in COLUMNS
+        )
+
+    @staticmethod
+    def _to_model(
+        row: sqlite3.Row, fields: list[str] | None
+    ) -> Generator | GeneratorProjection:
+        data = {
+            key: json.loads(row[key]) if key in JSON_COLUMNS and row[key] else row[key]
+            for key in row.keys()
+        }
+        if data.get("updated_at") == "":
+            data["updated_at"] = None
+        if fields:
+            return GeneratorProjection.model_validate(data)
+        return Generator.model_validate(data)
@@ -1,24 +1,27 @@
 from __future__ import annotations
 
 import asyncio
+import math
 import os
 from copy import deepcopy
 from dataclasses import dataclass, field
 from datetime import UTC, datetime, timedelta, timezone
 from typing import Any
 
-Request = None
-storage = None
-try:
-    import google.cloud.storage as storage
-    from google.auth.transport.requests import Request as AuthRequest
-
-    Request = AuthRequest
-except ImportError:
-    storage = None  # type: ignore
-
 from interfaces.repositories import UploadStoragePort
+from logger import logger
+from models.dtos import ArtifactRef
+from repositories.cleanup import ArtifactCleanupQueue
+from repositories.signing import CredentialRefresher, UrlSigner
+from shared.cache import LRUCache
+from shared.decorators import timed
 from shared.time import to_iso
+from shared.timing import stage
+
+PUBLISHED_UPLOAD_STATUSES = frozenset({"uploaded", "ready"})
+
+# GCS JSON API batch requests accept at most 100 calls.
+GCS_BATCH_LIMIT = 100
 
 
 @dataclass(slots=True)
@@ -27,6 +30,7 @@ class FakeSignedUploadAdapter(UploadStoragePort):
 
     base_url: str = "https://example.com/upload"
     expires_at: str = "2026-02-16T00:10:00Z"
+    cleaned_up: list[str] = field(default_factory=list)
 
     async def build_upload_instruction(self, generator: Any) -> dict[str, Any]:
         artifact = generator.artifact.model_dump() if generator.artifact else {}
@@ -38,8 +42,17 @@ class FakeSignedUploadAdapter(UploadStoragePort):
             "artifact": artifact,
         }
 
-    async def get_download_url(self, generator: Any) -> str | None:
-        return f"{self.base_url}/{generator.id}/download"
+    async def get_download_url(self, generator: Any) -> dict[str, Any] | None:
+        return {
+            "download_url": f"{self.base_url}/{generator.id}/download",
+            "download_expires_at": self.expires_at,
+        }
+
+    def schedule_artifact_cleanup(self, artifacts: dict[str, ArtifactRef | None]) -> None:
+        self.cleaned_up.extend(artifacts)
+
+    async def aclose(self) -> None:
+        return None
 
 
 @dataclass(slots=True)
@@ -47,18 +60,37 @@ class GCSSignedUploadAdapter(UploadStoragePort):
     project_id: str
     bucket_name: str
     expiry_seconds: int = 600
+    download_window_seconds: int = 300
+    download_refresh_ahead_seconds: int = 60
+    download_cache_size: int = 2048
+    signer_max_concurrency: int = 8
+    credentials_refresh_margin_seconds: int = 300
+    cleanup_batch_size: int = GCS_BATCH_LIMIT
+    cleanup_flush_seconds: float = 1.0
+    http_pool_size: int = 32
     _client: Any = field(init=False, repr=False)
     _bucket: Any = field(init=False, repr=False)
     _credentials: Any = field(init=False, repr=False)
-    _service_account_email: str | None = field(init=False, repr=False)
-    _signer_service_account: str | None = field(init=False, repr=False)
+    _refresher: CredentialRefresher = field(init=False, repr=False)
+    _signer: UrlSigner = field(init=False, repr=False)
+    _cleanup: ArtifactCleanupQueue = field(init=False, repr=False)
+    _download_urls: LRUCache[tuple[str, int | None], tuple[str, datetime]] = field(
+        init=False, repr=False
+    )
+    _download_lookups: dict[str, int] = field(
+        default_factory=lambda: {"hits": 0, "misses": 0}, init=False, repr=False
+    )
 
     def __post_init__(self) -> None:
-        if storage is None:
-            raise ImportError("google-cloud-storage is not installed.")
+        # Imported here so processes using the fake adapter never pay for the GCS client.
+        try:
+            import google.cloud.storage as storage
+        except ImportError as exc:
+            raise ImportError("google-cloud-storage is not installed.") from exc
 
         try:
             import google.auth as google_auth
+            from google.auth.transport.requests import Request
         except ImportError as exc:
             raise ImportError("google-auth is not installed.") from exc
 
@@ -66,28 +98,92 @@ class GCSSignedUploadAdapter(UploadStoragePort):
             scopes=["https://www.googleapis.com/auth/cloud-platform"]
         )
         self._client = storage.Client(
-            project=self.project_id, credentials=self._credentials
+            project=self.project_id,
+            credentials=self._credentials,
+            _http=self._http_session(),
         )
         self._bucket = self._client.bucket(self.bucket_name)
-        self._service_account_email = getattr(
-            self._credentials, "service_account_email", None
+        self._download_urls = LRUCache(self.download_cache_size)
+        self._refresher = CredentialRefresher(
+            self._credentials,
+            request_factory=Request,
+            refresh_margin_seconds=self.credentials_refresh_margin_seconds,
+        )
+        service_account_email = getattr(self._credentials, "service_account_email", None)
+        self._signer = UrlSigner(
+            self._credentials,
+            self._refresher,
+            signer_email=os.getenv("GCS_SIGNER_SERVICE_ACCOUNT") or service_account_email,
+            max_concurrent_remote=self.signer_max_concurrency,
+        )
+        self._cleanup = ArtifactCleanupQueue(
+            self._delete_prefixes_sync,
+            batch_size=self.cleanup_batch_size,
+            flush_interval_seconds=self.cleanup_flush_seconds,
         )
-        self._signer_service_account = os.getenv("GCS_SIGNER_SERVICE_ACCOUNT")
 
-    def _get_access_token(self) -> str | None:
-        if not self._credentials:
-            return None
+    def signer_stats(self) -> dict[str, float]:
+        return self._signer.stats.snapshot()
 
-        request_cls = Request
-        if request_cls is None:
-            return None
+    def _ensure_credentials_refreshing(self) -> None:
+        # Only IAM signBlob needs a bearer token; local signing uses the in-memory key.
+        if self._signer.needs_access_token:
+            self._refresher.start()
 
-        if getattr(self._credentials, "expired", True) or not getattr(
-            self._credentials, "valid", False
-        ):
-            self._credentials.refresh(request_cls())
+    def cleanup_stats(self) -> dict[str, int]:
+        return self._cleanup.stats()
 
-        return getattr(self._credentials, "token", None)
+    def download_cache_stats(self) -> dict[str, int]:
+        return {**self._download_lookups, "evictions": self._download_urls.evictions}
+
+    def _http_session(self) -> Any:
+        """Authorized session whose connection pool is sized for concurrent executor calls."""
+        from google.auth.transport.requests import AuthorizedSession
+        from requests.adapters import HTTPAdapter
+
+        session = AuthorizedSession(self._credentials)
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.http_pool_size)
+        session.mount("https://", adapter)
+        return session
+
+    async def aclose(self) -> None:
+        await self._refresher.aclose()
+        await self._cleanup.aclose()
+        self._client.close()
+
+    def schedule_artifact_cleanup(self, artifacts: dict[str, ArtifactRef | None]) -> None:
+        self._cleanup.schedule(
+            prefix
+            for generator_id, artifact in artifacts.items()
+            for prefix in self._artifact_prefixes(generator_id, artifact)
+        )
+
+    def _artifact_prefixes(self, generator_id: str, artifact: ArtifactRef | None) -> list[str]:
+        # Uploads go under ``{generator_id}/``; seeded and legacy records keep theirs at
+        # ``artifact.object`` (``name/version/generator.zip``), so that object goes too.
+        prefix = f"{generator_id}/"
+        if artifact is None or not artifact.object or artifact.object.startswith(prefix):
+            return [prefix]
+        if artifact.bucket not in (None, self.bucket_name):
+            logger.warning(
+                "Artifact cleanup skipped an object in another bucket",
+                extra={"id": generator_id, "bucket": artifact.bucket, "object": artifact.object},
+            )
+            return [prefix]
+        return [prefix, artifact.object]
+
+    def _delete_prefixes_sync(self, prefixes: list[str]) -> int:
+        blobs = [
+            blob
+            for prefix in prefixes
+            for blob in self._client.list_blobs(self._bucket, prefix=prefix)
+        ]
+        for start in range(0, len(blobs), GCS_BATCH_LIMIT):
+            # Objects already gone (404) must not fail the rest of the batch.
+            with self._client.batch(raise_exception=False):
+                for blob in blobs[start : start + GCS_BATCH_LIMIT]:
+                    blob.delete()
+        return len(blobs)
 
     async def build_upload_instruction(self, generator: Any) -> dict[str, Any]:
         # Prepare artifact metadata
@@ -103,14 +199,16 @@ class GCSSignedUploadAdapter(UploadStoragePort):
         artifact_data["content_type"] = content_type
 
         # Run blocking GCS call in a thread
+        self._ensure_credentials_refreshing()
         loop = asyncio.get_running_loop()
-        upload_url, expires_at = await loop.run_in_executor(
-            None,
-            self._generate_signed_url_sync,
-            artifact_object,
-            content_type,
-            "PUT",
-        )
+        with stage("gcs_sign"):
+            upload_url, expires_at = await loop.run_in_executor(
+                None,
+                self._generate_signed_url_sync,
+                artifact_object,
+                content_type,
+                "PUT",
+            )
 
         return {
             "upload_url": upload_url,
@@ -120,46 +218,102 @@ class GCSSignedUploadAdapter(UploadStoragePort):
             "artifact": artifact_data,
         }
 
-    async def get_download_url(self, generator: Any) -> str | None:
+    async def get_download_url(self, generator: Any) -> dict[str, Any] | None:
         if not generator.artifact or not generator.artifact.object:
             return None
 
+        if generator.upload_status == "failed":
+            return None
+
+        artifact = generator.artifact
+        signing = self._get_signed_download_url(artifact.object, artifact.generation)
+        if self._is_published(generator):
+            download_url, expires_at = await signing
+        else:
+            # Only pending uploads need a GCS round trip; sign while it is in flight.
+            exists, (download_url, expires_at) = await asyncio.gather(
+                self._blob_exists(artifact.object), signing
+            )
+            if not exists:
+                return None
+
+        return {"download_url": download_url, "download_expires_at": to_iso(expires_at)}
+
+    @staticmethod
+    def _is_published(generator: Any) -> bool:
+        """Trust the record once the upload pipeline has confirmed the object."""
+        if generator.upload_status in PUBLISHED_UPLOAD_STATUSES:
+            return True
+        artifact = generator.artifact
+        return artifact.size_bytes is not None and bool(artifact.sha256)
+
+    @timed("gcs_exists")
+    async def _blob_exists(self, blob_name: str) -> bool:
         # Check if object exists (blocking call, run in thread)
         loop = asyncio.get_running_loop()
-        blob = self._bucket.blob(generator.artifact.object)
-        exists = await loop.run_in_executor(None, blob.exists)
+        blob = self._bucket.blob(blob_name)
+        return await loop.run_in_executor(None, blob.exists)
 
-        if not exists:
-            return None
+    async def _get_signed_download_url(
+        self, blob_name: str, generation: int | None
+    ) -> tuple[str, datetime]:
+        # Reuse the signed URL until it gets close to its window-aligned expiry, so
+        # repeated reads of the same artifact return a byte-identical URL.
+        key = (blob_name, generation)
+        cached = self._download_urls.get(key)
+        if cached is not None:
+            self._download_lookups["hits"] += 1
+            return cached.value
+        self._download_lookups["misses"] += 1
 
         # Generate signed URL for GET (blocking call, run in thread)
-        download_url, _ = await loop.run_in_executor(
-            None,
-            self._generate_signed_url_sync,
-            generator.artifact.object,
-            None,  # No content-type for GET
-            "GET",
-        )
-        return download_url
+        self._ensure_credentials_refreshing()
+        loop = asyncio.get_running_loop()
+        expires_at = self._aligned_download_expiry(datetime.now(UTC))
+        with stage("gcs_sign"):
+            signed = await loop.run_in_executor(
+                None,
+                self._generate_signed_url_sync,
+                blob_name,
+                None,  # No content-type for GET
+                "GET",
+                expires_at,
+                generation,
+            )
+
+        remaining = (expires_at - datetime.now(UTC)).total_seconds()
+        reuse_for = remaining - self.download_refresh_ahead_seconds
+        if reuse_for > 0:
+            self._download_urls.set(key, signed, reuse_for)
+        return signed
+
+    def _aligned_download_expiry(self, now: datetime) -> datetime:
+        """Round ``now + expiry_seconds`` up to the next download window boundary."""
+        window = max(self.download_window_seconds, 1)
+        earliest = now.timestamp() + self.expiry_seconds
+        return datetime.fromtimestamp(math.ceil(earliest / window) * window, UTC)
 
     def _generate_signed_url_sync(
-        self, blob_name: str, content_type: str | None, method: str = "PUT"
+        self,
+        blob_name: str,
+        content_type: str | None,
+        method: str = "PUT",
+        expires_at: datetime | None = None,
+        generation: int | None = None,
     ) -> tuple[str, datetime]:
         blob = self._bucket.blob(blob_name)
-        expires_at = datetime.now(UTC) + timedelta(seconds=self.expiry_seconds)
+        if expires_at is None:
+            expires_at = datetime.now(UTC) + timedelta(seconds=self.expiry_seconds)
 
         args = {
             "version": "v4",
             "expiration": expires_at,
             "method": method,
         }
-        access_token = self._get_access_token()
-        signer_email = self._signer_service_account or self._service_account_email
-        if signer_email and access_token:
-            args["service_account_email"] = signer_email
-            args["access_token"] = access_token
+        if generation is not None:
+            args["generation"] = generation
         if content_type:
             args["content_type"] = content_type
 
-        url = blob.generate_signed_url(**args)
+        url = self._signer.sign(blob, args)
         return url, expires_at
@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from config import settings  # noqa: E402
+from repositories.firestore import FirestoreMetadataAdapter  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Write tags_normalized on generator documents that predate it."
+    )
+    parser.add_argument(
+        "--collection",
+        default=settings.firestore_collection,
+        help="Firestore collection. Defaults to FIRESTORE_COLLECTION.",
+    )
+    args = parser.parse_args()
+
+    settings.validate_gcp_settings()
+    adapter = FirestoreMetadataAdapter(
+        project_id=settings.firestore_project_id,
+        database_id=settings.firestore_database_id,
+        collection_name=args.collection,
+    )
+    updated = asyncio.run(adapter.backfill_normalized_tags())
+    print(f"Backfilled tags_normalized on {updated} document(s) in '{args.collection}'")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,19 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from shared.specification import build_cache, cache_path  # noqa: E402
+
+SPEC_PATH = Path(__file__).resolve().parents[1] / "specification.yaml"
+
+
+def main() -> None:
+    build_cache(SPEC_PATH)
+    print(f"Wrote {cache_path(SPEC_PATH)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -8,11 +8,13 @@ from google.cloud import firestore
 
 try:
     from ..config import FirestoreSettings
+    from ..shared.tags import NORMALIZED_TAGS_FIELD, normalize_tags
 except ImportError:
     import sys
 
     sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
     from config import FirestoreSettings
+    from shared.tags import NORMALIZED_TAGS_FIELD, normalize_tags
 
 
 def _load_payload(path: Path) -> dict:
@@ -46,6 +48,9 @@ def main() -> None:
     if not doc_id:
         raise RuntimeError("Document id is required. Provide --doc-id or include 'id' in payload.")
 
+    # Written as the API writes it, so tag filters match seeded documents without a backfill.
+    payload[NORMALIZED_TAGS_FIELD] = normalize_tags(payload.get("tags"))
+
     db = firestore.Client(project=settings.project_id, database=settings.database_id)
     db.collection(settings.collection).document(str(doc_id)).set(payload)
 
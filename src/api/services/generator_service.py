@@ -1,41 +1,356 @@
 from __future__ import annotations
 
+import asyncio
+import time
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, AsyncIterator
 from interfaces.repositories import GeneratorMetadataPort, UploadStoragePort
-from logger import logger
+from logger import get_logger
+from models.dtos import COMPUTED_FIELDS, Generator, GeneratorProjection
+from services.list_cache import GeneratorListCache
+from services.search_index import SEARCH_FIELDS, GeneratorSearchIndex
+from shared.concurrency import gather_bounded
+from shared.decorators import timed
+from shared.etag import VERSION_FIELDS, entity_tag, none_match, versions
+from shared.exceptions import ValidationException
+from shared.pagination import decode_page_token, encode_page_token
+
+logger = get_logger("service")
+
+SEARCH_DEFAULT_LIMIT = 20
 
 
 @dataclass(slots=True)
 class GeneratorService:
     metadata: GeneratorMetadataPort
     storage: UploadStoragePort
+    list_cache: GeneratorListCache | None = None
+    search_index: GeneratorSearchIndex | None = None
+    # Rebuild period for the search index when the metadata adapter cannot report other
+    # instances' writes (no catalog replica); 0 disables it.
+    search_refresh_seconds: float = 60.0
+    _search_refresh: asyncio.Task[None] | None = None
+    signed_url_concurrency: int = 16
+    # Signed download URLs are reused until this long before they expire; ETags of
+    # representations carrying one rotate as often, so a 304 never keeps an expired URL.
+    download_etag_seconds: float = 60.0
 
+    @timed("service")
     async def list_generators(self, **kwargs: Any) -> dict[str, Any]:
         logger.info("Listing generators", extra=kwargs)
-        items = await self.metadata.list_generators(
-            language=kwargs.get("language"),
-            version=kwargs.get("version"),
-            stack=kwargs.get("stack"),
-            tag=kwargs.get("tag"),
+        if kwargs.get("q"):
+            return await self._search(kwargs)
+        limit = kwargs.get("limit")
+        page_token = kwargs.get("page_token")
+        start_after = decode_page_token(page_token) if page_token else None
+
+        if self.list_cache is None:
+            items = await self._load_generators(kwargs, start_after)
+        else:
+            items = await self.list_cache.get_or_load(
+                kwargs, lambda: self._load_generators(kwargs, start_after)
+            )
+
+        # One extra item is fetched to know whether another page exists.
+        next_page_token = None
+        if limit and len(items) > limit:
+            items = items[:limit]
+            last = items[-1]
+            next_page_token = encode_page_token(last.updated_at, last.id)
+        return {"items": items, "next_page_token": next_page_token}
+
+    async def _load_generators(
+        self, filters: dict[str, Any], start_after: tuple[str, str] | None
+    ) -> list[Generator]:
+        limit = filters.get("limit")
+        return await self.metadata.list_generators(
+            language=filters.get("language"),
+            version=filters.get("version"),
+            stack=filters.get("stack"),
+            tag=filters.get("tag"),
+            limit=limit + 1 if limit else None,
+            start_after=start_after,
+            fields=filters.get("fields"),
+        )
+
+    @timed("service")
+    async def search_generators(self, **kwargs: Any) -> dict[str, Any]:
+        """Rank generators matching ``q`` by relevance; also takes the list filters.
+
+        Returns ``{"items", "scores"}`` with items best first and ``scores`` by id.
+        """
+        logger.info("Searching generators", extra=kwargs)
+        return await self._search(kwargs)
+
+    async def _search(self, filters: dict[str, Any]) -> dict[str, Any]:
+        if self.search_index is None:
+            raise ValidationException("Search is not enabled", {"q": filters.get("q")})
+        if filters.get("page_token"):
+            # Results are ranked, not ordered by a cursor, so there is nothing to resume.
+            raise ValidationException(
+                "page_token cannot be combined with q", {"page_token": filters["page_token"]}
+            )
+        await self.search_index.ensure_loaded(self._search_documents)
+        ranked = self.search_index.search(
+            filters["q"],
+            limit=filters.get("limit") or SEARCH_DEFAULT_LIMIT,
+            language=filters.get("language"),
+            version=filters.get("version"),
+            stack=filters.get("stack"),
+            tags=filters.get("tag"),
+        )
+        found = await self.metadata.get_generators(
+            [generator_id for generator_id, _ in ranked], fields=filters.get("fields")
         )
-        return {"items": items}
+        # A generator deleted by another instance may still be indexed here; skip it.
+        items = [found[generator_id] for generator_id, _ in ranked if generator_id in found]
+        scores = {generator_id: score for generator_id, score in ranked if generator_id in found}
+        return {"items": items, "next_page_token": None, "scores": scores}
+
+    async def _search_documents(self) -> list[GeneratorProjection]:
+        return await self.metadata.list_generators(fields=SEARCH_FIELDS)
+
+    async def start(self) -> None:
+        """Start the adapters' background work and the search index load.
+
+        The index loads in the background, so startup does not wait for it.
+        """
+        await self.metadata.start()
+        if self.search_index is None:
+            return
+        self.search_index.start_loading(self._search_documents)
+        if self.metadata.watch(self._on_catalog_change):
+            return
+        if self.search_refresh_seconds > 0:
+            self._search_refresh = asyncio.create_task(self._refresh_search_index())
+
+    def _on_catalog_change(self, upserted: list[Generator], removed: list[str]) -> None:
+        self._index(upserted)
+        self._unindex(removed)
+
+    async def _refresh_search_index(self) -> None:
+        while True:
+            await asyncio.sleep(self.search_refresh_seconds)
+            await self.search_index.reload(self._search_documents)
+
+    def _index(self, generators: list[Generator]) -> None:
+        if self.search_index is not None:
+            for generator in generators:
+                self.search_index.add(generator)
+
+    def _unindex(self, generator_ids: list[str]) -> None:
+        if self.search_index is not None:
+            for generator_id in generator_ids:
+                self.search_index.remove(generator_id)
+
+    async def aclose(self) -> None:
+        if self._search_refresh is not None:
+            self._search_refresh.cancel()
+            self._search_refresh = None
+        if self.list_cache is not None:
+            await self.list_cache.aclose()
+        await self.storage.aclose()
+        await self.metadata.aclose()
+
+    def list_cache_stats(self) -> dict[str, int]:
+        return self.list_cache.stats() if self.list_cache else {}
+
+    async def _invalidate_list_cache(self) -> None:
+        if self.list_cache is not None:
+            await self.list_cache.invalidate()
 
+    @timed("service")
     async def create_generator(self, body: dict[str, Any]) -> dict[str, Any]:
         logger.info("Creating generator", extra={"generator_name": body.get("name")})
         generator = await self.metadata.create_generator(body)
+        await self._invalidate_list_cache()
+        self._index([generator])
         upload = await self.storage.build_upload_instruction(generator)
         logger.info("Generator created", extra={"id": generator.id})
         return {"generator": generator, "upload": upload}
 
-    async def get_generator(self, generator_id: str) -> Generator | None:
+    async def create_generators(
+        self, bodies: list[dict[str, Any]]
+    ) -> AsyncIterator[tuple[int, dict[str, Any]]]:
+        """Register many generators with one batched write.
+
+        The write has committed (or raised) when this returns. The returned iterator
+        yields ``(index, result)`` as each upload instruction is signed, so results
+        arrive in completion order rather than request order.
+        """
+        logger.info("Creating generators", extra={"count": len(bodies)})
+        generators = await self.metadata.create_generators(bodies)
+        await self._invalidate_list_cache()
+        self._index(generators)
+        return self._upload_instructions(generators)
+
+    async def _upload_instructions(
+        self, generators: list[Generator]
+    ) -> AsyncIterator[tuple[int, dict[str, Any]]]:
+        semaphore = asyncio.Semaphore(max(self.signed_url_concurrency, 1))
+
+        async def _instruction(index: int, generator: Generator) -> tuple[int, dict[str, Any]]:
+            async with semaphore:
+                try:
+                    upload = await self.storage.build_upload_instruction(generator)
+                except Exception as exc:
+                    logger.warning(
+                        "Upload instruction failed", extra={"id": generator.id, "error": str(exc)}
+                    )
+                    return index, {"generator": generator, "error": str(exc)}
+            return index, {"generator": generator, "upload": upload}
+
+        tasks = [
+            asyncio.ensure_future(_instruction(index, generator))
+            for index, generator in enumerate(generators)
+        ]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
+        logger.info("Generators created", extra={"count": len(generators)})
+
+    @timed("service")
+    async def get_generator(
+        self, generator_id: str, fields: list[str] | None = None
+    ) -> Generator | GeneratorProjection | None:
         logger.info("Getting generator", extra={"id": generator_id})
-        generator = await self.metadata.get_generator(generator_id)
-        if generator:
-            download_url = await self.storage.get_download_url(generator)
-            generator.download_url = download_url
+        wants_download, metadata_fields = self._read_plan(fields)
+        generator = await self.metadata.get_generator(generator_id, fields=metadata_fields)
+        if generator and wants_download:
+            generator = await self._with_download_url(generator)
         return generator
 
+    @timed("service")
+    async def get_generator_conditional(
+        self,
+        generator_id: str,
+        fields: list[str] | None = None,
+        if_none_match: str | None = None,
+    ) -> dict[str, Any] | None:
+        """Read a generator with its ETag, signing its download URL only if needed.
+
+        Returns None when the generator does not exist, else ``{"etag", "generator"}``
+        with ``generator`` None when ``if_none_match`` matches the current ETag.
+        """
+        logger.info("Getting generator", extra={"id": generator_id})
+        wants_download, metadata_fields = self._read_plan(fields)
+        if metadata_fields is not None:
+            metadata_fields = list(dict.fromkeys([*metadata_fields, *VERSION_FIELDS]))
+        generator = await self.metadata.get_generator(generator_id, fields=metadata_fields)
+        if generator is None:
+            return None
+
+        download_epoch = None
+        if wants_download:
+            artifact = getattr(generator, "artifact", None)
+            download_epoch = (
+                int(time.time() // max(self.download_etag_seconds, 1)),
+                artifact.generation if artifact else None,
+            )
+        etag = entity_tag(versions([generator]), sorted(fields or ()), download_epoch)
+        if none_match(if_none_match, etag):
+            return {"etag": etag, "generator": None}
+        if wants_download:
+            generator = await self._with_download_url(generator)
+        return {"etag": etag, "generator": generator}
+
+    @staticmethod
+    def list_etag(query: dict[str, Any], result: dict[str, Any]) -> str:
+        """ETag of a ``list_generators`` page: the query and its records' revisions."""
+        return entity_tag(
+            GeneratorListCache.key_for(query),
+            versions(result["items"]),
+            result.get("next_page_token"),
+        )
+
+    @timed("service")
+    async def get_generators(
+        self, generator_ids: list[str], fields: list[str] | None = None
+    ) -> list[tuple[str, Generator | GeneratorProjection | None, str | None]]:
+        """Read many generators at once.
+
+        Returns ``(id, generator or None, error or None)`` in request order; a generator
+        whose download URL could not be signed comes back as None with the error.
+        """
+        unique_ids = list(dict.fromkeys(generator_ids))
+        logger.info("Getting generators", extra={"count": len(unique_ids)})
+        wants_download, metadata_fields = self._read_plan(fields)
+        found = await self.metadata.get_generators(unique_ids, fields=metadata_fields)
+        errors: dict[str, str] = {}
+        if wants_download:
+
+            async def _sign(
+                generator: Generator | GeneratorProjection,
+            ) -> Generator | GeneratorProjection | None:
+                try:
+                    return await self._with_download_url(generator)
+                except Exception as exc:
+                    logger.warning(
+                        "Download URL failed", extra={"id": generator.id, "error": str(exc)}
+                    )
+                    errors[generator.id] = str(exc)
+                    return None
+
+            signed = await gather_bounded(
+                (_sign(generator) for generator in found.values()),
+                self.signed_url_concurrency,
+            )
+            found = dict(zip(found, signed))
+        return [
+            (generator_id, found.get(generator_id), errors.get(generator_id))
+            for generator_id in unique_ids
+        ]
+
+    @staticmethod
+    def wants_download_url(fields: list[str] | None) -> bool:
+        return not fields or not COMPUTED_FIELDS.isdisjoint(fields)
+
+    @classmethod
+    def _read_plan(cls, fields: list[str] | None) -> tuple[bool, list[str] | None]:
+        """Decide whether to sign a download URL and which metadata fields to read."""
+        wants_download = cls.wants_download_url(fields)
+        if not fields:
+            return wants_download, None
+        if wants_download:
+            # Signing needs the artifact and its upload state even if they are not returned.
+            return True, [*fields, "artifact", "upload_status"]
+        return False, fields
+
+    async def _with_download_url(
+        self, generator: Generator | GeneratorProjection
+    ) -> Generator | GeneratorProjection:
+        # Records from the metadata port may be shared (frozen), so never mutate them.
+        download = await self.storage.get_download_url(generator)
+        if not download:
+            return generator
+        return generator.model_copy(
+            update={
+                "download_url": download["download_url"],
+                "download_expires_at": download["download_expires_at"],
+            }
+        )
+
+    @timed("service")
     async def delete_generator(self, generator_id: str) -> bool:
         logger.info("Deleting generator", extra={"id": generator_id})
-        return await self.metadata.delete_generator(generator_id)
+        deleted = await self.metadata.delete_generators([generator_id])
+        if deleted:
+            await self._invalidate_list_cache()
+            self._unindex([generator_id])
+            self.storage.schedule_artifact_cleanup(deleted)
+        return bool(deleted)
+
+    @timed("service")
+    async def delete_generators(self, generator_ids: list[str]) -> list[tuple[str, bool]]:
+        """Delete many generators; returns ``(id, deleted)`` in request order."""
+        unique_ids = list(dict.fromkeys(generator_ids))
+        logger.info("Deleting generators", extra={"count": len(unique_ids)})
+        deleted = await self.metadata.delete_generators(unique_ids)
+        if deleted:
+            await self._invalidate_list_cache()
+            self._unindex(list(deleted))
+            self.storage.schedule_artifact_cleanup(deleted)
+        return [(generator_id, generator_id in deleted) for generator_id in unique_ids]
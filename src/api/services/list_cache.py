@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+from typing import Any, Awaitable, Callable
+
+from interfaces.cache import SharedCachePort
+from logger import logger
+from models.dtos import Generator, GeneratorProjection
+from shared.cache import CacheEntry, LRUCache
+
+Loader = Callable[[], Awaitable[list[Generator]]]
+
+# Listings with ``fields`` hold projections, so shared entries record which model to rebuild.
+SHARED_MODELS: dict[str, type[Generator] | type[GeneratorProjection]] = {
+    "generator": Generator,
+    "projection": GeneratorProjection,
+}
+
+
+class GeneratorListCache:
+    """Two-tier read-through cache for generator listings.
+
+    The first tier is an in-process LRU; the optional second tier is shared between
+    instances. Entries past their TTL are still served for ``stale_seconds`` while a
+    single background task reloads them. Writes call :meth:`invalidate`.
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl_seconds: float,
+        stale_seconds: float,
+        max_entries: int,
+        shared: SharedCachePort | None = None,
+        namespace: str = "generators:list:",
+        clock: Callable[[], float] = time.monotonic,
+        wall_clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.stale_seconds = stale_seconds
+        self.shared = shared
+        self.namespace = namespace
+        self._wall_clock = wall_clock
+        self._local: LRUCache[str, list[Generator]] = LRUCache(max_entries, clock)
+        self._inflight: dict[str, asyncio.Future[list[Generator]]] = {}
+        self._generation = 0
+        self._counters = {
+            "hits": 0,
+            "stale_hits": 0,
+            "shared_hits": 0,
+            "misses": 0,
+            "refreshes": 0,
+            "invalidations": 0,
+        }
+
+    @staticmethod
+    def key_for(query: dict[str, Any]) -> str:
+        """Build a stable key from list filters, ignoring unset values and tag order/case."""
+        normalized: dict[str, Any] = {}
+        for name, value in query.items():
+            if value is None:
+                continue
+            if name == "tag":
+                value = sorted({tag.casefold() for tag in value})
+            elif isinstance(value, (list, tuple, set, frozenset)):
+                value = sorted(set(value))
+            normalized[name] = value
+        return json.dumps(normalized, sort_keys=True, separators=(",", ":"))
+
+    async def get_or_load(self, query: dict[str, Any], loader: Loader) -> list[Generator]:
+        key = self.key_for(query)
+
+        entry = self._local.get(key)
+        if entry is not None:
+            if entry.is_fresh(self._local.clock()):
+                self._counters["hits"] += 1
+            else:
+                self._counters["stale_hits"] += 1
+                self._refresh_in_background(key, loader)
+            return list(entry.value)
+
+        if self.shared is not None:
+            entry = await self._read_shared(key)
+            if entry is not None:
+                self._counters["shared_hits"] += 1
+                if not entry.is_fresh(self._local.clock()):
+                    self._refresh_in_background(key, loader)
+                return list(entry.value)
+
+        self._counters["misses"] += 1
+        return list(await asyncio.shield(self._load(key, loader)))
+
+    async def invalidate(self) -> None:
+        """Drop every cached listing; loads already in flight will not be stored."""
+        self._generation += 1
+        self._counters["invalidations"] += 1
+        self._local.clear()
+        self._inflight.clear()
+        if self.shared is not None:
+            try:
+                await self.shared.clear(self.namespace)
+            except Exception as exc:
+                logger.warning("Shared list cache clear failed", extra={"error": str(exc)})
+
+    async def aclose(self) -> None:
+        if self.shared is not None:
+            await self.shared.aclose()
+
+    def stats(self) -> dict[str, int]:
+        return {
+            **self._counters,
+            "evictions": self._local.evictions,
+            "size": len(self._local),
+        }
+
+    def _load(self, key: str, loader: Loader) -> asyncio.Future[list[Generator]]:
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._fill(key, loader, self._generation))
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._forget_inflight(key, done))
+        return task
+
+    def _forget_inflight(self, key: str, task: asyncio.Future[list[Generator]]) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+
+    def _refresh_in_background(self, key: str, loader: Loader) -> None:
+        if key in self._inflight:
+            return
+        self._counters["refreshes"] += 1
+        self._load(key, loader).add_done_callback(self._log_refresh_failure)
+
+    @staticmethod
+    def _log_refresh_failure(task: asyncio.Future[list[Generator]]) -> None:
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning(
+                "Background list cache refresh failed",
+                extra={"error": str(task.exception())},
+            )
+
+    async def _fill(self, key: str, loader: Loader, generation: int) -> list[Generator]:
+        items = await loader()
+        if generation == self._generation:
+            self._local.set(key, items, self.ttl_seconds, self.stale_seconds)
+            if self.shared is not None:
+                await self._write_shared(key, items)
+        return items
+
+    async def _read_shared(self, key: str) -> CacheEntry[list[Generator]] | None:
+        try:
+            raw = await self.shared.get(self.namespace + key)
+        except Exception as exc:
+            logger.warning("Shared list cache read failed", extra={"error": str(exc)})
+            return None
+        if raw is None:
+            return None
+
+        try:
+            payload = json.loads(raw)
+            age = max(self._wall_clock() - payload["stored_at"], 0.0)
+            if age >= self.ttl_seconds + self.stale_seconds:
+                return None
+            model = SHARED_MODELS[payload.get("model", "generator")]
+            items = [model.model_validate(item) for item in payload["items"]]
+        except (KeyError, TypeError, ValueError) as exc:
+            # An entry this version cannot read (or a corrupt one) is just a miss.
+            logger.warning("Shared list cache entry unreadable", extra={"error": str(exc)})
+            return None
+        return self._local.set(key, items, self.ttl_seconds - age, self.stale_seconds)
+
+    async def _write_shared(self, key: str, items: list[Generator]) -> None:
+        projected = bool(items) and isinstance(items[0], GeneratorProjection)
+        payload = {
+            "stored_at": self._wall_clock(),
+            "model": "projection" if projected else "generator",
+            "items": [item.model_dump(mode="json", exclude_none=True) for item in items],
+        }
+        try:
+            await self.shared.set(
+                self.namespace + key,
+                json.dumps(payload, separators=(",", ":")).encode(),
+                self.ttl_seconds + self.stale_seconds,
+            )
+        except Exception as exc:
+            logger.warning("Shared list cache write failed", extra={"error": str(exc)})
@@ -0,0 +1,211 @@
+from __future__ import annotations
+
+import asyncio
+import heapq
+import math
+import re
+from typing import Any, Awaitable, Callable, Iterable
+
+from logger import logger
+from shared.tags import normalize_tags
+
+# Fields the index is built from; the metadata port only has to return these.
+SEARCH_FIELDS = ["id", "name", "description", "tags", "language", "version", "stack"]
+
+# Term frequency multipliers per field, a simplified BM25F: a name match counts most.
+FIELD_WEIGHTS = {"name": 3.0, "tags": 2.0, "description": 1.0}
+
+# Okapi BM25 term saturation and length normalization.
+K1 = 1.2
+B = 0.75
+
+_TOKEN = re.compile(r"[0-9a-z]+")
+
+Loader = Callable[[], Awaitable[list[Any]]]
+
+
+def tokenize(text: str | None) -> list[str]:
+    """Lowercased alphanumeric runs, so ``fastapi-crud`` yields ``fastapi`` and ``crud``."""
+    return _TOKEN.findall(text.casefold()) if text else []
+
+
+class GeneratorSearchIndex:
+    """In-process inverted index over generator names, descriptions and tags.
+
+    Ranks with BM25 and returns the top ``limit`` matches after applying the exact
+    ``language`` / ``version`` / ``stack`` / tag filters, which are kept per document.
+    Changes arrive through ``add`` / ``remove``; the full load from the metadata store
+    runs in the background and searches wait for the first one. ``reload`` rebuilds the
+    index from the store, for changes made where ``add`` / ``remove`` are not called.
+    """
+
+    def __init__(self) -> None:
+        self._clear()
+        self._loading: asyncio.Future[None] | None = None
+        # Changes made while a load is reading the store, replayed over its result.
+        self._journal: list[tuple[str, Any]] | None = None
+
+    def _clear(self) -> None:
+        self._postings: dict[str, dict[str, float]] = {}
+        self._terms: dict[str, dict[str, float]] = {}
+        self._lengths: dict[str, float] = {}
+        self._total_length = 0.0
+        self._attributes: dict[str, tuple[Any, Any, Any, frozenset[str]]] = {}
+
+    def __len__(self) -> int:
+        return len(self._terms)
+
+    def add(self, generator: Any) -> None:
+        """Index ``generator``, replacing any previous version of it."""
+        if self._journal is not None:
+            self._journal.append(("add", generator))
+        self._add(generator)
+
+    def remove(self, generator_id: str) -> None:
+        if self._journal is not None:
+            self._journal.append(("remove", generator_id))
+        self._remove(generator_id)
+
+    def _add(self, generator: Any) -> None:
+        self._remove(generator.id)
+        terms: dict[str, float] = {}
+        texts = {
+            "name": generator.name,
+            "description": generator.description,
+            "tags": " ".join(generator.tags or ()),
+        }
+        for field, text in texts.items():
+            weight = FIELD_WEIGHTS[field]
+            for token in tokenize(text):
+                terms[token] = terms.get(token, 0.0) + weight
+
+        self._terms[generator.id] = terms
+        length = sum(terms.values())
+        self._lengths[generator.id] = length
+        self._total_length += length
+        for term, frequency in terms.items():
+            self._postings.setdefault(term, {})[generator.id] = frequency
+        self._attributes[generator.id] = (
+            generator.language,
+            generator.version,
+            generator.stack,
+            frozenset(normalize_tags(generator.tags)),
+        )
+
+    def _remove(self, generator_id: str) -> None:
+        terms = self._terms.pop(generator_id, None)
+        if terms is None:
+            return
+        self._total_length -= self._lengths.pop(generator_id)
+        del self._attributes[generator_id]
+        for term in terms:
+            postings = self._postings[term]
+            del postings[generator_id]
+            if not postings:
+                del self._postings[term]
+
+    def search(
+        self,
+        query: str,
+        *,
+        limit: int,
+        language: str | None = None,
+        version: str | None = None,
+        stack: str | None = None,
+        tags: Iterable[str] | None = None,
+    ) -> list[tuple[str, float]]:
+        """``(id, score)`` of the best ``limit`` matches, highest score first."""
+        terms = set(tokenize(query))
+        documents = len(self._terms)
+        if not terms or not documents:
+            return []
+        average_length = self._total_length / documents or 1.0
+
+        scores: dict[str, float] = {}
+        for term in terms:
+            postings = self._postings.get(term)
+            if not postings:
+                continue
+            idf = math.log(1 + (documents - len(postings) + 0.5) / (len(postings) + 0.5))
+            for generator_id, frequency in postings.items():
+                norm = frequency + K1 * (
+                    1 - B + B * self._lengths[generator_id] / average_length
+                )
+                scores[generator_id] = (
+                    scores.get(generator_id, 0.0) + idf * frequency * (K1 + 1) / norm
+                )
+
+        required_tags = frozenset(normalize_tags(list(tags) if tags else None))
+        if language or version or stack or required_tags:
+            scores = {
+                generator_id: score
+                for generator_id, score in scores.items()
+                if self._matches(generator_id, language, version, stack, required_tags)
+            }
+        return heapq.nlargest(limit, scores.items(), key=lambda item: (item[1], item[0]))
+
+    def _matches(
+        self,
+        generator_id: str,
+        language: str | None,
+        version: str | None,
+        stack: str | None,
+        tags: frozenset[str],
+    ) -> bool:
+        doc_language, doc_version, doc_stack, doc_tags = self._attributes[generator_id]
+        return (
+            (not language or doc_language == language)
+            and (not version or doc_version == version)
+            and (not stack or doc_stack == stack)
+            and tags <= doc_tags
+        )
+
+    def start_loading(self, loader: Loader) -> asyncio.Future[None]:
+        """Load every generator from ``loader`` once, in the background."""
+        if self._loading is None:
+            self._loading = asyncio.ensure_future(self._load(loader))
+            # A failed background load is logged in _load; searches see it when awaiting.
+            self._loading.add_done_callback(lambda task: task.cancelled() or task.exception())
+        return self._loading
+
+    async def ensure_loaded(self, loader: Loader) -> None:
+        # Shielded so a cancelled search does not cancel the shared load.
+        await asyncio.shield(self.start_loading(loader))
+
+    async def _load(self, loader: Loader) -> None:
+        try:
+            await self._rebuild(loader)
+        except Exception:
+            # Let the next search retry instead of caching the failure.
+            self._loading = None
+            raise
+
+    async def reload(self, loader: Loader) -> None:
+        """Rebuild from ``loader``; on failure the current index is kept."""
+        if self._journal is not None:
+            return  # A load is already running.
+        try:
+            await self._rebuild(loader)
+        except Exception:
+            pass  # Logged by _rebuild; the next reload tries again.
+
+    async def _rebuild(self, loader: Loader) -> None:
+        self._journal = []
+        try:
+            generators = await loader()
+        except Exception as exc:
+            logger.warning("Search index load failed", extra={"error": str(exc)})
+            self._journal = None
+            raise
+        journal, self._journal = self._journal, None
+        # Swapped in one step on the loop, so searches never see a partial index; the
+        # changes made while the store was read are replayed on top, in order.
+        self._clear()
+        for generator in generators:
+            self._add(generator)
+        for action, value in journal:
+            if action == "add":
+                self._add(value)
+            else:
+                self._remove(value)
+        logger.info("Search index loaded", extra={"documents": len(self)})
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Generic, Hashable, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+@dataclass(slots=True)
+class CacheEntry(Generic[V]):
+    value: V
+    fresh_until: float
+    stale_until: float
+
+    def is_fresh(self, now: float) -> bool:
+        return now < self.fresh_until
+
+    def is_usable(self, now: float) -> bool:
+        return now < self.stale_until
+
+
+class LRUCache(Generic[K, V]):
+    """Bounded least-recently-used mapping with fresh/stale expiry per entry."""
+
+    __slots__ = ("max_entries", "clock", "evictions", "_entries")
+
+    def __init__(
+        self, max_entries: int, clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.max_entries = max_entries
+        self.clock = clock
+        self.evictions = 0
+        self._entries: OrderedDict[K, CacheEntry[V]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: K) -> CacheEntry[V] | None:
+        """Return the entry if it is still usable, marking it most recently used."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if not entry.is_usable(self.clock()):
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def set(
+        self, key: K, value: V, ttl_seconds: float, stale_seconds: float = 0.0
+    ) -> CacheEntry[V]:
+        now = self.clock()
+        entry = CacheEntry(
+            value=value,
+            fresh_until=now + ttl_seconds,
+            stale_until=now + ttl_seconds + stale_seconds,
+        )
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+        return entry
+
+    def pop(self, key: K) -> CacheEntry[V] | None:
+        return self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
@@ -0,0 +1,173 @@
+"""Content codings for response compression: gzip always, brotli and zstd when installed.
+
+Each encoding compresses whole bodies in one call and streams through ``stream()``,
+which flushes after every chunk so NDJSON lines and JSON-RPC messages are not held
+back. zstd compressor contexts are pooled and reused across responses; the gzip
+encoder copies a pre-initialised deflate state instead of building one per response.
+"""
+
+from __future__ import annotations
+
+import zlib
+from functools import lru_cache
+from typing import Callable, Iterable
+
+try:
+    import brotli
+except ImportError:
+    brotli = None  # type: ignore
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None  # type: ignore
+
+# Server preference when the client accepts several encodings with the same weight.
+PREFERENCE = ("zstd", "br", "gzip")
+
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 4
+ZSTD_LEVEL = 3
+ZSTD_POOL_SIZE = 16
+
+
+class CompressionStream:
+    """One streamed response body: ``compress()`` per chunk, then ``finish()`` once."""
+
+    def __init__(
+        self,
+        compress: Callable[[bytes], bytes],
+        finish: Callable[[], bytes],
+        release: Callable[[], None] | None = None,
+    ) -> None:
+        self._compress = compress
+        self._finish = finish
+        self._release = release
+
+    def compress(self, chunk: bytes) -> bytes:
+        return self._compress(chunk)
+
+    def finish(self) -> bytes:
+        try:
+            return self._finish()
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        """Return pooled resources; safe to call more than once."""
+        release, self._release = self._release, None
+        if release is not None:
+            release()
+
+
+class GzipEncoding:
+    name = "gzip"
+
+    def __init__(self, level: int = GZIP_LEVEL) -> None:
+        # wbits=31 writes the gzip header and trailer.
+        self._template = zlib.compressobj(level, zlib.DEFLATED, 31)
+
+    def compress(self, data: bytes) -> bytes:
+        compressor = self._template.copy()
+        return compressor.compress(data) + compressor.flush()
+
+    def stream(self) -> CompressionStream:
+        compressor = self._template.copy()
+        return CompressionStream(
+            lambda chunk: compressor.compress(chunk) + compressor.flush(zlib.Z_SYNC_FLUSH),
+            compressor.flush,
+        )
+
+
+class BrotliEncoding:
+    name = "br"
+
+    def __init__(self, quality: int = BROTLI_QUALITY) -> None:
+        self.quality = quality
+
+    def compress(self, data: bytes) -> bytes:
+        return brotli.compress(data, quality=self.quality, mode=brotli.MODE_TEXT)
+
+    def stream(self) -> CompressionStream:
+        # The brotli bindings cannot reset an encoder, so each stream gets its own.
+        compressor = brotli.Compressor(quality=self.quality, mode=brotli.MODE_TEXT)
+        return CompressionStream(
+            lambda chunk: compressor.process(chunk) + compressor.flush(), compressor.finish
+        )
+
+
+class ZstdEncoding:
+    name = "zstd"
+
+    def __init__(self, level: int = ZSTD_LEVEL, pool_size: int = ZSTD_POOL_SIZE) -> None:
+        self.level = level
+        self.pool_size = pool_size
+        # A ZstdCompressor runs one operation at a time; idle ones wait here for reuse.
+        self._idle: list[zstandard.ZstdCompressor] = []
+
+    def _acquire(self) -> zstandard.ZstdCompressor:
+        return self._idle.pop() if self._idle else zstandard.ZstdCompressor(level=self.level)
+
+    def _release(self, compressor: zstandard.ZstdCompressor) -> None:
+        if len(self._idle) < self.pool_size:
+            self._idle.append(compressor)
+
+    def compress(self, data: bytes) -> bytes:
+        compressor = self._acquire()
+        try:
+            return compressor.compress(data)
+        finally:
+            self._release(compressor)
+
+    def stream(self) -> CompressionStream:
+        compressor = self._acquire()
+        stream = compressor.compressobj()
+        return CompressionStream(
+            lambda chunk: stream.compress(chunk) + stream.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK),
+            stream.flush,
+            lambda: self._release(compressor),
+        )
+
+
+Encoding = GzipEncoding | BrotliEncoding | ZstdEncoding
+
+
+def available_encodings(names: Iterable[str] = PREFERENCE) -> list[Encoding]:
+    """Encodings for ``names`` in that order, skipping those whose library is missing."""
+    factories: dict[str, Callable[[], Encoding]] = {"gzip": GzipEncoding}
+    if brotli is not None:
+        factories["br"] = BrotliEncoding
+    if zstandard is not None:
+        factories["zstd"] = ZstdEncoding
+    return [factories[name]() for name in names if name in factories]
+
+
+@lru_cache(maxsize=128)
+def negotiate(accept_encoding: str, offered: tuple[str, ...]) -> str | None:
+    """Pick the offered coding with the highest ``q`` in ``Accept-Encoding``.
+
+    Ties go to the earlier entry of ``offered``; ``q=0`` excludes a coding, and ``*``
+    covers codings the header does not name. None means send the identity coding.
+    """
+    weights: dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        name, _, params = part.partition(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+        weight = 1.0
+        for param in params.split(";"):
+            key, _, value = param.partition("=")
+            if key.strip().lower() == "q":
+                try:
+                    weight = float(value)
+                except ValueError:
+                    weight = 0.0
+        weights[name] = weight
+
+    best, best_weight = None, 0.0
+    for name in offered:
+        weight = weights.get(name, weights.get("*", 0.0))
+        if weight > best_weight:
+            best, best_weight = name, weight
+    return best
@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import Executor
+from typing import Awaitable, Iterable, TypeVar
+
+T = TypeVar("T")
+
+
+async def gather_bounded(awaitables: Iterable[Awaitable[T]], limit: int) -> list[T]:
+    """Like ``asyncio.gather`` but with at most ``limit`` awaitables running at once."""
+    semaphore = asyncio.Semaphore(max(limit, 1))
+
+    async def _run(awaitable: Awaitable[T]) -> T:
+        async with semaphore:
+            return await awaitable
+
+    return list(await asyncio.gather(*(_run(awaitable) for awaitable in awaitables)))
+
+
+def executor_queue_depth(executor: Executor | None) -> int:
+    """Work items submitted to a thread pool that no thread has picked up yet."""
+    work_queue = getattr(executor, "_work_queue", None)
+    return work_queue.qsize() if work_queue is not None else 0
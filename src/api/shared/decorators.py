@@ -5,6 +5,7 @@ import time
 from typing import Any, Callable, TypeVar
 
 from logger import logger
+from shared.timing import stage
 
 F = TypeVar("F", bound=Callable[..., Any])
 
@@ -49,3 +50,24 @@ def logged(func: F) -> F:
     if inspect.iscoroutinefunction(func):
         return async_wrapper  # type: ignore
     return sync_wrapper  # type: ignore
+
+
+def timed(name: str) -> Callable[[F], F]:
+    """Decorator recording each call as stage ``name`` of the current request's timings."""
+
+    def decorator(func: F) -> F:
+        @functools.wraps(func)
+        async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+            with stage(name):
+                return await func(*args, **kwargs)
+
+        @functools.wraps(func)
+        def sync_wrapper(*args: Any, **kwargs: Any) -> Any:
+            with stage(name):
+                return func(*args, **kwargs)
+
+        if inspect.iscoroutinefunction(func):
+            return async_wrapper  # type: ignore
+        return sync_wrapper  # type: ignore
+
+    return decorator
@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
+
+
+def dumps(value: Any) -> bytes:
+    """Encode JSON-compatible data to compact UTF-8 bytes, using orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(value)
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False).encode()
+
+
+def loads(content: bytes | str) -> Any:
+    """Decode JSON, using orjson when installed."""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+import hashlib
+from typing import Any, Iterable
+
+from pydantic import BaseModel
+
+from shared.encoding import dumps
+
+# Fields that identify a stored revision of a generator.
+VERSION_FIELDS = ("id", "updated_at", "upload_status")
+
+
+def entity_tag(*parts: Any) -> str:
+    """Strong ETag: a quoted digest of the JSON-encodable ``parts``."""
+    return '"' + hashlib.blake2b(dumps(parts), digest_size=16).hexdigest() + '"'
+
+
+def versions(generators: Iterable[BaseModel]) -> list[tuple[Any, ...]]:
+    """``(id, updated_at, upload_status)`` per record; projections may leave some unset."""
+    return [tuple(getattr(item, name, None) for name in VERSION_FIELDS) for item in generators]
+
+
+def none_match(header: str | None, etag: str) -> bool:
+    """True when an ``If-None-Match`` header lists ``etag`` or is ``*``.
+
+    ``If-None-Match`` uses the weak comparison (RFC 9110, 13.1.2), so a ``W/`` prefix
+    added by a proxy that compressed the response still matches.
+    """
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    return any(candidate.strip().removeprefix("W/") == etag for candidate in header.split(","))
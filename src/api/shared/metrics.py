@@ -0,0 +1,242 @@
+"""In-process metrics in the Prometheus text exposition format.
+
+Recording takes no lock: observations happen on the event loop thread, and a labelled
+child is created (under a lock) only the first time a label combination is seen.
+Gauges are read from a callback at scrape time, so they cost nothing in between.
+"""
+
+from __future__ import annotations
+
+import math
+import threading
+from bisect import bisect_left
+from typing import Callable, Iterable, Iterator
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+LATENCY_BUCKETS = (
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+)
+COUNT_BUCKETS = (0, 1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 5000)
+
+LabelValues = tuple[str, ...]
+
+# Per-request counter (see ``shared.timing.add_count``) of Firestore documents read.
+FIRESTORE_READS = "firestore_reads"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", r"\\").replace("\n", r"\n").replace('"', r"\"")
+
+
+def _labels(names: Iterable[str], values: Iterable[str]) -> str:
+    pairs = ",".join(f'{name}="{_escape(value)}"' for name, value in zip(names, values))
+    return f"{{{pairs}}}" if pairs else ""
+
+
+def _number(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class _Family:
+    kind = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple[str, ...]) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self._children: dict[LabelValues, object] = {}
+        self._lock = threading.Lock()
+
+    def labels(self, *values: str):
+        child = self._children.get(values)
+        if child is None:
+            if len(values) != len(self.labelnames):
+                raise ValueError(f"{self.name} expects labels {self.labelnames}")
+            with self._lock:
+                child = self._children.setdefault(values, self._new_child())
+        return child
+
+    def _new_child(self) -> object:
+        raise NotImplementedError
+
+    def header(self) -> Iterator[str]:
+        yield f"# HELP {self.name} {self.documentation}"
+        yield f"# TYPE {self.name} {self.kind}"
+
+    def render(self) -> Iterator[str]:
+        raise NotImplementedError
+
+
+class _CounterChild:
+    __slots__ = ("value",)
+
+    def __init__(self) -> None:
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.value += amount
+
+
+class Counter(_Family):
+    kind = "counter"
+
+    def _new_child(self) -> _CounterChild:
+        return _CounterChild()
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.labels().inc(amount)
+
+    def render(self) -> Iterator[str]:
+        yield from self.header()
+        for values, child in list(self._children.items()):
+            labels = _labels(self.labelnames, values)
+            yield f"{self.name}_total{labels} {_number(child.value)}"
+
+
+class _HistogramChild:
+    __slots__ = ("bounds", "counts", "sum")
+
+    def __init__(self, bounds: tuple[float, ...]) -> None:
+        self.bounds = bounds
+        # One slot per bucket plus +Inf; counts are per bucket, cumulated when rendered.
+        self.counts = [0] * (len(bounds) + 1)
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.sum += value
+
+
+class Histogram(_Family):
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple[str, ...],
+        buckets: tuple[float, ...] = LATENCY_BUCKETS,
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def _new_child(self) -> _HistogramChild:
+        return _HistogramChild(self.buckets)
+
+    def observe(self, value: float) -> None:
+        self.labels().observe(value)
+
+    def render(self) -> Iterator[str]:
+        yield from self.header()
+        names = (*self.labelnames, "le")
+        for values, child in list(self._children.items()):
+            cumulative = 0
+            for bound, count in zip((*self.buckets, math.inf), list(child.counts)):
+                cumulative += count
+                labels = _labels(names, (*values, _number(bound)))
+                yield f"{self.name}_bucket{labels} {cumulative}"
+            labels = _labels(self.labelnames, values)
+            yield f"{self.name}_sum{labels} {_number(child.sum)}"
+            yield f"{self.name}_count{labels} {cumulative}"
+
+
+class Gauge(_Family):
+    """Gauge whose samples come from a callback when the registry is rendered."""
+
+    kind = "gauge"
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple[str, ...]) -> None:
+        super().__init__(name, documentation, labelnames)
+        self._function: Callable[[], dict[LabelValues, float]] | None = None
+
+    def set_function(self, function: Callable[[], dict[LabelValues, float]]) -> None:
+        self._function = function
+
+    def render(self) -> Iterator[str]:
+        yield from self.header()
+        if self._function is None:
+            return
+        for values, value in self._function().items():
+            yield f"{self.name}{_labels(self.labelnames, values)} {_number(value)}"
+
+
+class MetricsRegistry:
+    def __init__(self) -> None:
+        self._families: dict[str, _Family] = {}
+
+    def counter(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()) -> Counter:
+        return self._register(Counter(name, documentation, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = LATENCY_BUCKETS,
+    ) -> Histogram:
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+
+    def gauge(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()) -> Gauge:
+        return self._register(Gauge(name, documentation, labelnames))
+
+    def _register(self, family):
+        if family.name in self._families:
+            raise ValueError(f"Metric '{family.name}' is already registered")
+        self._families[family.name] = family
+        return family
+
+    def render(self) -> str:
+        lines = [line for family in self._families.values() for line in family.render()]
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
+
+http_request_duration = registry.histogram(
+    "constructio_http_request_duration_seconds",
+    "REST request latency by operationId ('mcp' for the MCP endpoint).",
+    ("operation", "status"),
+)
+mcp_tool_duration = registry.histogram(
+    "constructio_mcp_tool_duration_seconds",
+    "MCP tool call latency by tool name.",
+    ("tool", "outcome"),
+)
+stage_calls = registry.counter(
+    "constructio_stage_calls",
+    "Timed stage calls (adapter calls such as firestore_get or gcs_sign) by outcome.",
+    ("stage", "outcome"),
+)
+stage_duration = registry.histogram(
+    "constructio_stage_duration_seconds",
+    "Latency of timed stages (adapter calls such as firestore_get or gcs_sign).",
+    ("stage",),
+)
+firestore_documents_read = registry.histogram(
+    "constructio_firestore_documents_read_per_request",
+    "Firestore documents read per request that touched Firestore.",
+    buckets=COUNT_BUCKETS,
+)
+cache_hit_ratio = registry.gauge(
+    "constructio_cache_hit_ratio",
+    "Share of cache lookups served from the cache since start.",
+    ("cache",),
+)
+log_records = registry.gauge(
+    "constructio_log_records",
+    "Log records dropped on a full queue or sampled out since start, and still queued.",
+    ("state",),
+)
+catalog_replica = registry.gauge(
+    "constructio_catalog_replica",
+    "Firestore catalog replica: synced (0/1), documents, lag_seconds and staleness_seconds.",
+    ("measure",),
+)
+executor_queue_depth = registry.gauge(
+    "constructio_executor_queue_depth",
+    "Work items waiting for a thread in each executor.",
+    ("executor",),
+)
@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+
+from shared.exceptions import ValidationException
+
+
+def encode_page_token(updated_at: str | None, generator_id: str) -> str:
+    """Encode the sort key of the last returned item as an opaque cursor."""
+    raw = json.dumps([updated_at or "", generator_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_page_token(token: str) -> tuple[str, str]:
+    """Return the ``(updated_at, id)`` cursor encoded in ``token``."""
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        updated_at, generator_id = json.loads(base64.urlsafe_b64decode(padded))
+    except (binascii.Error, UnicodeDecodeError, ValueError, TypeError) as exc:
+        raise ValidationException("Invalid page_token", {"page_token": token}) from exc
+    if not isinstance(updated_at, str) or not isinstance(generator_id, str):
+        raise ValidationException("Invalid page_token", {"page_token": token})
+    return updated_at, generator_id
@@ -0,0 +1,188 @@
+"""On-demand diagnostics: a sampling CPU profiler and tracemalloc snapshots.
+
+Both cost nothing until started: the profiler is a thread that exists only while a
+profile is being taken, and tracemalloc hooks allocations only between start and stop.
+"""
+
+from __future__ import annotations
+
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter, OrderedDict
+from itertools import count
+from pathlib import Path
+from types import FrameType
+from typing import Any
+
+# Snapshots kept for diffs; the oldest is dropped first.
+MAX_SNAPSHOTS = 8
+
+Stack = tuple[str, ...]
+
+
+class ProfilerBusyError(RuntimeError):
+    """Raised when a profile is requested while another one is running."""
+
+
+def _frame_label(frame: FrameType) -> str:
+    code = frame.f_code
+    # ";" separates frames in the collapsed format.
+    name = getattr(code, "co_qualname", code.co_name).replace(";", ":")
+    return f"{name} ({Path(code.co_filename).name}:{code.co_firstlineno})"
+
+
+def _stack(frame: FrameType | None) -> Stack:
+    labels = []
+    while frame is not None:
+        labels.append(_frame_label(frame))
+        frame = frame.f_back
+    labels.reverse()
+    return tuple(labels)
+
+
+class SamplingProfiler:
+    """Statistical profiler reading other threads' stacks at a fixed interval.
+
+    Call ``profile()`` from a worker thread; it blocks for ``seconds`` while the
+    profiled threads keep running. One profile runs at a time.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+
+    @property
+    def running(self) -> bool:
+        return self._lock.locked()
+
+    def profile(
+        self, seconds: float, interval: float, thread_ids: set[int] | None = None
+    ) -> Counter[Stack]:
+        """Sample ``thread_ids`` (all other threads when None) and count identical stacks."""
+        if not self._lock.acquire(blocking=False):
+            raise ProfilerBusyError("A profile is already running")
+        try:
+            return self._sample(seconds, interval, thread_ids)
+        finally:
+            self._lock.release()
+
+    @staticmethod
+    def _sample(seconds: float, interval: float, thread_ids: set[int] | None) -> Counter[Stack]:
+        own_id = threading.get_ident()
+        names = {thread.ident: thread.name for thread in threading.enumerate()}
+        stacks: Counter[Stack] = Counter()
+        deadline = time.perf_counter() + seconds
+        while time.perf_counter() < deadline:
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own_id or (thread_ids is not None and thread_id not in thread_ids):
+                    continue
+                thread_name = names.get(thread_id, str(thread_id))
+                stacks[(f"thread:{thread_name}", *_stack(frame))] += 1
+            time.sleep(interval)
+        return stacks
+
+
+def collapsed(stacks: Counter[Stack]) -> str:
+    """Brendan Gregg's collapsed format, as read by flamegraph.pl and speedscope."""
+    return "".join(f"{';'.join(stack)} {samples}\n" for stack, samples in stacks.most_common())
+
+
+def speedscope(stacks: Counter[Stack], interval: float, name: str) -> dict[str, Any]:
+    """A speedscope "sampled" profile, weighting each distinct stack by its sample time."""
+    frames: dict[str, int] = {}
+    samples = []
+    weights = []
+    for stack, hits in stacks.items():
+        samples.append([frames.setdefault(label, len(frames)) for label in stack])
+        weights.append(hits * interval)
+    return {
+        "$schema": "https://www.speedscope.app/file-format-schema.json",
+        "shared": {"frames": [{"name": label} for label in frames]},
+        "profiles": [
+            {
+                "type": "sampled",
+                "name": name,
+                "unit": "seconds",
+                "startValue": 0,
+                "endValue": sum(weights),
+                "samples": samples,
+                "weights": weights,
+            }
+        ],
+    }
+
+
+class AllocationTracker:
+    """Starts and stops tracemalloc and keeps recent snapshots for top lists and diffs."""
+
+    def __init__(self, max_snapshots: int = MAX_SNAPSHOTS) -> None:
+        self.max_snapshots = max_snapshots
+        self._snapshots: OrderedDict[str, tracemalloc.Snapshot] = OrderedDict()
+        self._ids = count(1)
+
+    @property
+    def tracing(self) -> bool:
+        return tracemalloc.is_tracing()
+
+    def start(self, frames: int = 1) -> None:
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(frames)
+
+    def stop(self) -> None:
+        tracemalloc.stop()
+        self._snapshots.clear()
+
+    def status(self) -> dict[str, Any]:
+        current, peak = tracemalloc.get_traced_memory()
+        return {
+            "tracing": self.tracing,
+            "traced_bytes": current,
+            "peak_bytes": peak,
+            "snapshots": list(self._snapshots),
+        }
+
+    def snapshot(self) -> str:
+        """Take a snapshot (tracing must be on) and return its id."""
+        snapshot = tracemalloc.take_snapshot().filter_traces(
+            (
+                tracemalloc.Filter(False, tracemalloc.__file__),
+                tracemalloc.Filter(False, "<frozen importlib._bootstrap*"),
+            )
+        )
+        snapshot_id = f"snap_{next(self._ids)}"
+        self._snapshots[snapshot_id] = snapshot
+        while len(self._snapshots) > self.max_snapshots:
+            self._snapshots.popitem(last=False)
+        return snapshot_id
+
+    def has(self, snapshot_id: str) -> bool:
+        return snapshot_id in self._snapshots
+
+    def top(self, snapshot_id: str, limit: int, key_type: str = "lineno") -> list[dict[str, Any]]:
+        stats = self._snapshots[snapshot_id].statistics(key_type)
+        return [
+            {**self._location(stat.traceback), "size_bytes": stat.size, "count": stat.count}
+            for stat in stats[:limit]
+        ]
+
+    def diff(
+        self, snapshot_id: str, base_id: str, limit: int, key_type: str = "lineno"
+    ) -> list[dict[str, Any]]:
+        """Largest changes from ``base_id`` to ``snapshot_id``, by size difference."""
+        stats = self._snapshots[snapshot_id].compare_to(self._snapshots[base_id], key_type)
+        return [
+            {
+                **self._location(stat.traceback),
+                "size_bytes": stat.size,
+                "size_diff_bytes": stat.size_diff,
+                "count": stat.count,
+                "count_diff": stat.count_diff,
+            }
+            for stat in stats[:limit]
+        ]
+
+    @staticmethod
+    def _location(traceback: tracemalloc.Traceback) -> dict[str, Any]:
+        frame = traceback[0]
+        return {"file": frame.filename, "line": frame.lineno}
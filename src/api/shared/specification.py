@@ -0,0 +1,60 @@
+"""The OpenAPI spec, pre-parsed: the YAML is parsed once and kept as JSON next to it."""
+
+from __future__ import annotations
+
+import hashlib
+from pathlib import Path
+from typing import Any
+
+from logger import logger
+from shared.encoding import dumps, loads
+
+CACHE_SUFFIX = ".cache.json"
+
+
+def cache_path(spec_path: Path) -> Path:
+    return spec_path.with_name(spec_path.name + CACHE_SUFFIX)
+
+
+def _parse_yaml(source: bytes) -> dict[str, Any]:
+    import yaml
+
+    # The C loader is an order of magnitude faster than the pure-Python one.
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    return yaml.load(source, Loader=loader)
+
+
+def _write_cache(spec_path: Path, digest: str, spec: dict[str, Any]) -> None:
+    cache_path(spec_path).write_bytes(dumps({"source_sha256": digest, "spec": spec}))
+
+
+def build_cache(spec_path: Path) -> dict[str, Any]:
+    """Parse the YAML spec and write the pre-parsed JSON, keyed by the YAML's hash."""
+    source = spec_path.read_bytes()
+    spec = _parse_yaml(source)
+    _write_cache(spec_path, hashlib.sha256(source).hexdigest(), spec)
+    return spec
+
+
+def load_specification(spec_path: Path) -> dict[str, Any]:
+    """The OpenAPI spec as a dict, pre-parsed from the JSON cache when it matches the YAML.
+
+    A stale or missing cache is rebuilt when the directory is writable; the image
+    build runs ``scripts/build_spec_cache.py`` so instances start from a fresh one.
+    """
+    source = spec_path.read_bytes()
+    digest = hashlib.sha256(source).hexdigest()
+    try:
+        cached = loads(cache_path(spec_path).read_bytes())
+        if cached.get("source_sha256") == digest:
+            return cached["spec"]
+    except (OSError, ValueError):
+        pass
+
+    spec = _parse_yaml(source)
+    try:
+        _write_cache(spec_path, digest, spec)
+    except (OSError, TypeError, ValueError) as exc:
+        # Unwritable directory, or YAML values JSON cannot hold; the parsed spec still works.
+        logger.warning("Specification cache not written", extra={"error": str(exc)})
+    return spec
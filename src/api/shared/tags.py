@@ -0,0 +1,16 @@
+from __future__ import annotations
+
+from typing import Iterable
+
+# Lowercased copy of ``tags`` written at create time so tag filters run in Firestore.
+NORMALIZED_TAGS_FIELD = "tags_normalized"
+
+
+def normalize_tags(tags: Iterable[str] | None) -> list[str]:
+    """Casefold, strip and de-duplicate tags, keeping first-seen order."""
+    normalized: dict[str, None] = {}
+    for tag in tags or []:
+        value = tag.strip().casefold()
+        if value:
+            normalized[value] = None
+    return list(normalized)
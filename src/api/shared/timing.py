@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Iterator
+
+from shared import metrics
+
+# Key under which the middleware leaves the request's timings in the ASGI scope, so
+# code running outside the request's context (MCP tool tasks) can bind them.
+SCOPE_KEY = "request_timings"
+
+
+class RequestTimings:
+    """Durations of the named stages of one request, summed per stage.
+
+    Concurrent stages (e.g. several signatures) add up, so a stage total can exceed
+    the request's wall time; the count shows how many calls it covers.
+    """
+
+    __slots__ = ("started", "counts", "_stages")
+
+    def __init__(self) -> None:
+        self.started = time.perf_counter()
+        self.counts: dict[str, int] = {}
+        self._stages: dict[str, list[float]] = {}
+
+    def record(self, name: str, seconds: float) -> None:
+        entry = self._stages.get(name)
+        if entry is None:
+            self._stages[name] = [1, seconds]
+        else:
+            entry[0] += 1
+            entry[1] += seconds
+
+    def add(self, name: str, amount: int) -> None:
+        self.counts[name] = self.counts.get(name, 0) + amount
+
+    def elapsed_ms(self) -> float:
+        return (time.perf_counter() - self.started) * 1000
+
+    def summary(self) -> dict[str, Any]:
+        """Per-stage ``{"count", "ms"}``, counters and the elapsed total, for the log line."""
+        stages = {
+            name: {"count": int(count), "ms": round(seconds * 1000, 3)}
+            for name, (count, seconds) in self._stages.items()
+        }
+        return {"total_ms": round(self.elapsed_ms(), 3), "stages": stages, "counts": self.counts}
+
+    def server_timing(self) -> str:
+        """Render as a ``Server-Timing`` header value, ending with the elapsed total."""
+        entries = []
+        for name, (count, seconds) in self._stages.items():
+            metric = f"{name};dur={seconds * 1000:.3f}"
+            if count > 1:
+                metric += f';desc="x{int(count)}"'
+            entries.append(metric)
+        entries.append(f"total;dur={self.elapsed_ms():.3f}")
+        return ", ".join(entries)
+
+
+_current: ContextVar[RequestTimings | None] = ContextVar("request_timings", default=None)
+
+
+def current_timings() -> RequestTimings | None:
+    return _current.get()
+
+
+@contextmanager
+def bind_timings(timings: RequestTimings | None) -> Iterator[RequestTimings | None]:
+    """Make ``timings`` the current request's timings for the duration of the block."""
+    token = _current.set(timings)
+    try:
+        yield timings
+    finally:
+        _current.reset(token)
+
+
+def add_count(name: str, amount: int) -> None:
+    """Add to a per-request counter (e.g. documents read) of the current request."""
+    timings = _current.get()
+    if timings is not None:
+        timings.add(name, amount)
+
+
+@contextmanager
+def stage(name: str) -> Iterator[None]:
+    """Time the block as stage ``name`` in the stage metrics and the request's timings."""
+    timings = _current.get()
+    outcome = "error"
+    started = time.perf_counter()
+    try:
+        yield
+        outcome = "ok"
+    finally:
+        seconds = time.perf_counter() - started
+        metrics.stage_duration.labels(name).observe(seconds)
+        metrics.stage_calls.labels(name, outcome).inc()
+        if timings is not None:
+            timings.record(name, seconds)
@@ -0,0 +1,84 @@
+import pytest
+
+ADMIN_TOKEN = "test-admin-token"
+
+
+@pytest.fixture()
+def admin_headers(monkeypatch: pytest.MonkeyPatch) -> dict[str, str]:
+    # Requested before ``client`` so the app is built with the token configured.
+    monkeypatch.setenv("ADMIN_TOKEN", ADMIN_TOKEN)
+    return {"X-Admin-Token": ADMIN_TOKEN}
+
+
+def test_admin_endpoints_require_token(admin_headers, client):
+    response = client.post("/admin/profile", params={"seconds": 0.1})
+
+    assert response.status_code == 401
+
+    response = client.get("/admin/tracemalloc", headers={"X-Admin-Token": "wrong"})
+
+    assert response.status_code == 401
+
+
+def test_profile_returns_collapsed_stacks(admin_headers, client):
+    response = client.post(
+        "/admin/profile",
+        params={"seconds": 0.2, "interval_ms": 5, "threads": "all"},
+        headers=admin_headers,
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    lines = response.text.splitlines()
+    assert lines
+    stack, samples = lines[0].rsplit(" ", 1)
+    assert stack.startswith("thread:")
+    assert int(samples) >= 1
+
+
+def test_profile_returns_speedscope_file(admin_headers, client):
+    response = client.post(
+        "/admin/profile",
+        params={"seconds": 0.1, "interval_ms": 5, "output": "speedscope", "threads": "all"},
+        headers=admin_headers,
+    )
+
+    assert response.status_code == 200
+    profile = response.json()["profiles"][0]
+    assert profile["type"] == "sampled"
+    assert len(profile["samples"]) == len(profile["weights"])
+
+
+def test_tracemalloc_snapshots_and_diff(admin_headers, client):
+    response = client.post("/admin/tracemalloc/snapshots", headers=admin_headers)
+    assert response.status_code == 409
+
+    response = client.post("/admin/tracemalloc:start", headers=admin_headers)
+    assert response.json()["tracing"] is True
+    try:
+        first = client.post("/admin/tracemalloc/snapshots", headers=admin_headers).json()
+        client.get("/v1/generators")
+        second = client.post(
+            "/admin/tracemalloc/snapshots", params={"limit": 5}, headers=admin_headers
+        )
+        assert second.status_code == 201
+        assert len(second.json()["stats"]) <= 5
+
+        diff = client.get(
+            f"/admin/tracemalloc/snapshots/{second.json()['id']}",
+            params={"compare_to": first["id"], "limit": 10},
+            headers=admin_headers,
+        )
+        assert diff.status_code == 200
+        assert {"size_diff_bytes", "count_diff"}.issubset(diff.json()["stats"][0])
+
+        missing = client.get("/admin/tracemalloc/snapshots/snap_missing", headers=admin_headers)
+        assert missing.status_code == 404
+    finally:
+        response = client.post("/admin/tracemalloc:stop", headers=admin_headers)
+    assert response.json() == {
+        "tracing": False,
+        "traced_bytes": 0,
+        "peak_bytes": 0,
+        "snapshots": [],
+    }
@@ -0,0 +1,184 @@
+import asyncio
+import gzip
+import zlib
+
+from middleware.compression import CompressionMiddleware
+from shared.compression import negotiate
+
+ITEMS = (b'{"id":"gen_%04d","name":"generator"}' % n for n in range(200))
+BODY = b'{"items":[' + b",".join(ITEMS) + b"]}"
+
+
+def _run(app, accept_encoding: str | None) -> list[dict]:
+    headers = [(b"accept-encoding", accept_encoding.encode())] if accept_encoding else []
+    scope = {"type": "http", "method": "GET", "path": "/", "headers": headers}
+    messages: list[dict] = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        messages.append(message)
+
+    asyncio.run(CompressionMiddleware(app, minimum_size=1024)(scope, receive, send))
+    return messages
+
+
+def _app(*chunks: bytes, content_type: bytes = b"application/json"):
+    async def app(scope, receive, send):
+        headers = [(b"content-type", content_type), (b"etag", b'"abc"')]
+        if len(chunks) == 1:
+            headers.append((b"content-length", str(len(chunks[0])).encode()))
+        await send({"type": "http.response.start", "status": 200, "headers": headers})
+        for index, chunk in enumerate(chunks):
+            more_body = index < len(chunks) - 1
+            await send({"type": "http.response.body", "body": chunk, "more_body": more_body})
+
+    return app
+
+
+def _headers(start: dict) -> dict[str, str]:
+    return {key.decode(): value.decode() for key, value in start["headers"]}
+
+
+def test_negotiate_uses_weights_then_server_preference():
+    offered = ("zstd", "br", "gzip")
+
+    assert negotiate("gzip, br", offered) == "br"
+    assert negotiate("gzip;q=1.0, br;q=0.5", offered) == "gzip"
+    assert negotiate("br;q=0, *", offered) == "zstd"
+    assert negotiate("identity", offered) is None
+    assert negotiate("gzip;q=0", ("gzip",)) is None
+
+
+def test_single_body_is_compressed_with_length_and_weak_etag():
+    start, body = _run(_app(BODY), "gzip")
+    headers = _headers(start)
+
+    assert headers["content-encoding"] == "gzip"
+    assert headers["content-length"] == str(len(body["body"]))
+    assert headers["etag"] == 'W/"abc"'
+    assert headers["vary"] == "Accept-Encoding"
+    assert gzip.decompress(body["body"]) == BODY
+
+
+def test_small_or_unaccepted_bodies_are_sent_as_is():
+    start, body = _run(_app(b'{"items":[]}'), "gzip")
+    assert "content-encoding" not in _headers(start)
+    assert _headers(start)["vary"] == "Accept-Encoding"
+    # Weak like the compressed variant, so the 304s for this request match it.
+    assert _headers(start)["etag"] == 'W/"abc"'
+    assert body["body"] == b'{"items":[]}'
+
+    start, body = _run(_app(BODY), None)
+    assert "content-encoding" not in _headers(start)
+    # Cached identity responses must not be served to clients that accept gzip.
+    assert _headers(start)["vary"] == "Accept-Encoding"
+    assert _headers(start)["etag"] == '"abc"'
+    assert body["body"] == BODY
+
+    start, body = _run(_app(BODY, content_type=b"application/zip"), "gzip")
+    assert "content-encoding" not in _headers(start)
+    assert "vary" not in _headers(start)
+
+
+def test_not_modified_matches_the_encoded_response_headers():
+    async def app(scope, receive, send):
+        headers = [(b"etag", b'"abc"'), (b"cache-control", b"max-age=30")]
+        await send({"type": "http.response.start", "status": 304, "headers": headers})
+        await send({"type": "http.response.body", "body": b""})
+
+    start, _ = _run(app, "gzip")
+    headers = _headers(start)
+
+    assert headers["etag"] == 'W/"abc"'
+    assert headers["vary"] == "Accept-Encoding"
+    assert "content-encoding" not in headers
+
+    # Without a negotiated coding the 304 keeps its strong validator, like the 200.
+    start, _ = _run(app, None)
+    assert _headers(start)["etag"] == '"abc"'
+    assert _headers(start)["vary"] == "Accept-Encoding"
+
+
+def test_streamed_body_is_compressed_and_flushed_per_chunk():
+    lines = [b'{"index":%d,"generator":{"name":"generator"}}\n' % n for n in range(100)]
+    chunks = [b"".join(lines[:50]), *lines[50:]]
+    start, *bodies = _run(_app(*chunks, content_type=b"application/x-ndjson"), "gzip")
+
+    assert _headers(start)["content-encoding"] == "gzip"
+    assert "content-length" not in _headers(start)
+    assert len(bodies) == len(chunks)
+    decoder = zlib.decompressobj(31)
+    # Each chunk decodes as soon as it arrives.
+    assert decoder.decompress(bodies[0]["body"]) == chunks[0]
+    assert decoder.decompress(bodies[1]["body"]) == chunks[1]
+    rest = b"".join(decoder.decompress(body["body"]) for body in bodies[2:])
+    assert rest == b"".join(chunks[2:])
+    assert decoder.eof
+
+
+def test_first_streamed_line_is_sent_without_waiting_for_more():
+    sent: list[dict] = []
+    line = b'{"index":0}\n'
+
+    async def app(scope, receive, send):
+        headers = [(b"content-type", b"application/x-ndjson")]
+        await send({"type": "http.response.start", "status": 200, "headers": headers})
+        await send({"type": "http.response.body", "body": line, "more_body": True})
+        # Both messages are already out, although far fewer than minimum_size bytes.
+        assert [message["type"] for message in sent] == [
+            "http.response.start",
+            "http.response.body",
+        ]
+        await send({"type": "http.response.body", "body": b""})
+
+    async def record(message):
+        sent.append(message)
+
+    headers = [(b"accept-encoding", b"gzip")]
+    scope = {"type": "http", "method": "GET", "path": "/", "headers": headers}
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    asyncio.run(CompressionMiddleware(app, minimum_size=1024)(scope, receive, record))
+
+    assert _headers(sent[0])["content-encoding"] == "gzip"
+    assert gzip.decompress(sent[1]["body"] + sent[2]["body"]) == line
+
+
+def test_list_and_mcp_responses_are_compressed(client, valid_create_body):
+    for n in range(10):
+        client.post("/v1/generators", json={**valid_create_body, "name": f"generator-{n}"})
+
+    response = client.get("/v1/generators", headers={"Accept-Encoding": "gzip"})
+    assert response.headers["content-encoding"] == "gzip"
+    assert len(response.json()["items"]) == 13
+
+    revalidated = client.get(
+        "/v1/generators",
+        headers={"Accept-Encoding": "gzip", "If-None-Match": response.headers["etag"]},
+    )
+    assert revalidated.status_code == 304
+
+    mcp = client.post(
+        "/mcp/",
+        json={
+            "jsonrpc": "2.0",
+            "id": "test",
+            "method": "tools/call",
+            "params": {"name": "list_generators", "arguments": {}},
+        },
+        headers={"Accept": "application/json", "Accept-Encoding": "gzip"},
+    )
+    assert mcp.headers["content-encoding"] == "gzip"
+    assert mcp.json()["result"]
+
+
+def test_large_body_is_compressed_off_the_event_loop():
+    large = BODY * 64
+    start, body = _run(_app(large), "gzip")
+
+    assert _headers(start)["content-encoding"] == "gzip"
+    assert gzip.decompress(body["body"]) == large
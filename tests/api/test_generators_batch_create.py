@@ -0,0 +1,63 @@
+import json
+
+
+def _item(name: str) -> dict:
+    return {"name": name, "language": "python", "upload": {"content_type": "application/zip"}}
+
+
+def test_batch_create_generators_reports_invalid_items(client):
+    response = client.post(
+        "/v1/generators:batchCreate",
+        json={"items": [_item("bulk-one"), {"name": "X"}, _item("bulk-two")]},
+    )
+
+    assert response.status_code == 200
+    results = response.json()["results"]
+    assert [result["index"] for result in results] == [0, 1, 2]
+    assert results[0]["generator"]["name"] == "bulk-one"
+    assert results[0]["upload"]["upload_url"]
+    assert "artifact" not in results[0]["generator"]
+    assert results[1]["error"]["error"] == "bad_request"
+    assert results[2]["generator"]["name"] == "bulk-two"
+
+    listed = client.get("/v1/generators").json()["items"]
+    assert {"bulk-one", "bulk-two"} <= {item["name"] for item in listed}
+
+
+def test_batch_create_generators_streams_ndjson(client):
+    response = client.post(
+        "/v1/generators:batchCreate",
+        json={"items": [_item("stream-one"), _item("stream-two")]},
+        headers={"Accept": "application/x-ndjson"},
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert sorted(line["index"] for line in lines) == [0, 1]
+    assert all(line["upload"]["upload_url"] for line in lines)
+
+
+def test_batch_create_generators_rejects_empty_items(client):
+    response = client.post("/v1/generators:batchCreate", json={"items": []})
+
+    assert response.status_code == 400
+
+
+def test_batch_create_ndjson_reports_failed_write_as_error_status(client, monkeypatch):
+    import dependencies
+
+    async def fail(bodies):
+        raise RuntimeError("batch commit failed")
+
+    metadata = dependencies.get_generator_service().metadata
+    monkeypatch.setattr(metadata, "create_generators", fail)
+
+    response = client.post(
+        "/v1/generators:batchCreate",
+        json={"items": [_item("stream-fail")]},
+        headers={"Accept": "application/x-ndjson"},
+    )
+
+    assert response.status_code == 500
+    assert not response.headers["content-type"].startswith("application/x-ndjson")
@@ -0,0 +1,16 @@
+def test_batch_delete_generators_reports_missing_ids(client, valid_create_body):
+    generator_id = client.post("/v1/generators", json=valid_create_body).json()["generator"]["id"]
+
+    response = client.post(
+        "/v1/generators:batchDelete", json={"ids": [generator_id, "gen_missing"]}
+    )
+
+    assert response.status_code == 200
+    assert response.json()["results"] == [
+        {"id": generator_id, "deleted": True},
+        {
+            "id": "gen_missing",
+            "error": {"error": "not_found", "message": "Generator 'gen_missing' was not found"},
+        },
+    ]
+    assert client.get(f"/v1/generators/{generator_id}").status_code == 404
@@ -0,0 +1,45 @@
+def test_batch_get_generators_reports_missing_ids(client):
+    response = client.post(
+        "/v1/generators:batchGet",
+        json={"ids": ["gen_01HTZ7Y4M7Z7W2B8Q6P2", "gen_missing", "gen_01HTZZAFW5Q2Y8G6M1D9"]},
+    )
+
+    assert response.status_code == 200
+    results = response.json()["results"]
+    assert [result["id"] for result in results] == [
+        "gen_01HTZ7Y4M7Z7W2B8Q6P2",
+        "gen_missing",
+        "gen_01HTZZAFW5Q2Y8G6M1D9",
+    ]
+    assert results[0]["generator"]["download_url"]
+    assert "artifact" not in results[0]["generator"]
+    assert results[1]["error"]["error"] == "not_found"
+
+
+def test_batch_get_generators_rejects_empty_ids(client):
+    response = client.post("/v1/generators:batchGet", json={"ids": []})
+
+    assert response.status_code == 400
+
+
+def test_batch_get_generators_reports_signing_failures_per_item(client, monkeypatch):
+    from dependencies import get_generator_service
+
+    storage = get_generator_service().storage
+    sign = type(storage).get_download_url
+
+    async def flaky(self, generator):
+        if generator.id == "gen_01HTZ7Y4M7Z7W2B8Q6P2":
+            raise RuntimeError("signer unavailable")
+        return await sign(self, generator)
+
+    monkeypatch.setattr(type(storage), "get_download_url", flaky)
+    response = client.post(
+        "/v1/generators:batchGet",
+        json={"ids": ["gen_01HTZ7Y4M7Z7W2B8Q6P2", "gen_01HTZZAFW5Q2Y8G6M1D9"]},
+    )
+
+    assert response.status_code == 200
+    first, second = response.json()["results"]
+    assert first["error"] == {"error": "download_unavailable", "message": "signer unavailable"}
+    assert second["generator"]["id"] == "gen_01HTZZAFW5Q2Y8G6M1D9"
@@ -0,0 +1,63 @@
+GENERATOR_ID = "gen_01HTZ7Y4M7Z7W2B8Q6P2"
+
+
+def test_list_generators_returns_not_modified_for_matching_etag(client):
+    first = client.get("/v1/generators", params={"language": "python"})
+    etag = first.headers["etag"]
+
+    assert first.status_code == 200
+    # The test client accepts gzip, so the compression middleware weakens the ETag.
+    assert etag.startswith('W/"')
+    assert "max-age=" in first.headers["cache-control"]
+
+    second = client.get(
+        "/v1/generators", params={"language": "python"}, headers={"If-None-Match": etag}
+    )
+
+    assert second.status_code == 304
+    assert second.content == b""
+    assert second.headers["etag"] == etag
+
+
+def test_list_generators_etag_changes_with_query_and_writes(client, valid_create_body):
+    etag = client.get("/v1/generators").headers["etag"]
+
+    assert client.get("/v1/generators", params={"limit": 1}).headers["etag"] != etag
+
+    client.post("/v1/generators", json=valid_create_body)
+    response = client.get("/v1/generators", headers={"If-None-Match": etag})
+
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+
+
+def test_get_generator_returns_not_modified_before_signing(client, monkeypatch):
+    from dependencies import get_generator_service
+
+    first = client.get(f"/v1/generators/{GENERATOR_ID}")
+    etag = first.headers["etag"]
+    storage = get_generator_service().storage
+
+    async def fail(generator):
+        raise AssertionError("download URL signed for a 304")
+
+    monkeypatch.setattr(type(storage), "get_download_url", fail)
+    response = client.get(
+        f"/v1/generators/{GENERATOR_ID}", headers={"If-None-Match": f'W/"other", {etag}'}
+    )
+
+    assert response.status_code == 304
+    assert response.headers["etag"] == etag
+
+
+def test_get_generator_etag_depends_on_fields(client):
+    full = client.get(f"/v1/generators/{GENERATOR_ID}")
+    projected = client.get(
+        f"/v1/generators/{GENERATOR_ID}",
+        params={"fields": "name"},
+        headers={"If-None-Match": full.headers["etag"]},
+    )
+
+    assert projected.status_code == 200
+    assert set(projected.json()) == {"id", "name"}
+    assert projected.headers["etag"] != full.headers["etag"]
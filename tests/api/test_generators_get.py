@@ -14,3 +14,12 @@ def test_get_generator_returns_not_found(client):
     assert response.status_code == 404
     payload = response.json()
     assert payload["error"] == "not_found"
+
+
+def test_get_generator_returns_only_requested_fields(client):
+    response = client.get(
+        "/v1/generators/gen_01HTZ7Y4M7Z7W2B8Q6P2", params={"fields": "name,download_url"}
+    )
+
+    assert response.status_code == 200
+    assert set(response.json()) == {"id", "name", "download_url"}
@@ -9,3 +9,38 @@ def test_list_generators_returns_items(client):
     for item in payload["items"]:
         assert "artifact" not in item
         assert "entrypoint" not in item
+
+
+def test_list_generators_reflects_new_generator_after_cached_read(client, valid_create_body):
+    client.get("/v1/generators")
+
+    created = client.post("/v1/generators", json=valid_create_body).json()["generator"]
+
+    ids = {item["id"] for item in client.get("/v1/generators").json()["items"]}
+    assert created["id"] in ids
+
+
+def test_list_generators_paginates_with_page_token(client):
+    all_ids = [item["id"] for item in client.get("/v1/generators").json()["items"]]
+
+    first = client.get("/v1/generators", params={"limit": 2}).json()
+    second = client.get(
+        "/v1/generators", params={"limit": 2, "page_token": first["next_page_token"]}
+    ).json()
+
+    assert [item["id"] for item in first["items"] + second["items"]] == all_ids
+    assert "next_page_token" not in second
+
+
+def test_list_generators_rejects_invalid_page_token(client):
+    response = client.get("/v1/generators", params={"page_token": "not-a-token"})
+
+    assert response.status_code == 400
+
+
+def test_list_generators_returns_only_requested_fields(client):
+    response = client.get("/v1/generators", params={"fields": "name,language"})
+
+    assert response.status_code == 200
+    for item in response.json()["items"]:
+        assert set(item) == {"id", "name", "language"}
@@ -0,0 +1,39 @@
+def test_search_ranks_generators_by_relevance(client):
+    response = client.get("/v1/generators", params={"q": "crud module"})
+
+    assert response.status_code == 200
+    body = response.json()
+    names = [item["name"] for item in body["items"]]
+    # Matches both terms in its name, so it ranks above the single-term match.
+    assert names == ["laravel-crud-module", "fastapi-crud", "nestjs-module"]
+    assert "next_page_token" not in body
+
+
+def test_search_combines_with_filters_and_limit(client):
+    response = client.get(
+        "/v1/generators", params={"q": "crud", "language": "python", "fields": "name"}
+    )
+
+    assert response.status_code == 200
+    assert [item["name"] for item in response.json()["items"]] == ["fastapi-crud"]
+
+    response = client.get("/v1/generators", params={"q": "crud", "limit": 1})
+    assert len(response.json()["items"]) == 1
+
+
+def test_search_reflects_creates_and_deletes(client, valid_create_body):
+    created = client.post(
+        "/v1/generators", json={**valid_create_body, "name": "quarkus-starter"}
+    ).json()["generator"]
+
+    items = client.get("/v1/generators", params={"q": "quarkus"}).json()["items"]
+    assert [item["id"] for item in items] == [created["id"]]
+
+    assert client.delete(f"/v1/generators/{created['id']}").status_code == 204
+    assert client.get("/v1/generators", params={"q": "quarkus"}).json()["items"] == []
+
+
+def test_search_rejects_page_token(client):
+    response = client.get("/v1/generators", params={"q": "crud", "page_token": "abc"})
+
+    assert response.status_code == 400
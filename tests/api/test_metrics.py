@@ -0,0 +1,52 @@
+def _samples(text: str) -> dict[str, float]:
+    samples = {}
+    for line in text.splitlines():
+        if line and not line.startswith("#"):
+            name, value = line.rsplit(" ", 1)
+            samples[name] = float(value)
+    return samples
+
+
+def test_metrics_exposes_route_and_tool_latency(client):
+    client.get("/v1/generators")
+    client.post(
+        "/mcp/",
+        json={
+            "jsonrpc": "2.0",
+            "id": "test",
+            "method": "tools/call",
+            "params": {"name": "get_generator", "arguments": {"generator_id": "gen_missing"}},
+        },
+        headers={"Accept": "application/json"},
+    )
+
+    response = client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    samples = _samples(response.text)
+    assert samples[
+        'constructio_http_request_duration_seconds_count{operation="list_generators",status="200"}'
+    ] == 1
+    assert samples['constructio_http_request_duration_seconds_count{operation="mcp",status="200"}'] == 1
+    assert samples[
+        'constructio_mcp_tool_duration_seconds_count{tool="get_generator",outcome="ok"}'
+    ] == 1
+    assert samples['constructio_stage_calls_total{stage="service",outcome="ok"}'] == 2
+    assert 'constructio_executor_queue_depth{executor="default"}' in samples
+
+
+def test_metrics_histogram_buckets_are_cumulative(client):
+    from shared.metrics import MetricsRegistry
+
+    registry = MetricsRegistry()
+    histogram = registry.histogram("latency_seconds", "Latency.", ("route",), buckets=(0.1, 1.0))
+    for value in (0.05, 0.1, 0.5, 5.0):
+        histogram.labels("list").observe(value)
+
+    samples = _samples(registry.render())
+
+    assert samples['latency_seconds_bucket{route="list",le="0.1"}'] == 2
+    assert samples['latency_seconds_bucket{route="list",le="1"}'] == 3
+    assert samples['latency_seconds_bucket{route="list",le="+Inf"}'] == 4
+    assert samples['latency_seconds_count{route="list"}'] == 4
@@ -0,0 +1,35 @@
+def _metrics(header: str) -> dict[str, str]:
+    return {metric.split(";", 1)[0].strip(): metric for metric in header.split(",")}
+
+
+def test_get_generator_reports_stage_timings(client):
+    response = client.get("/v1/generators/gen_01HTZ7Y4M7Z7W2B8Q6P2")
+
+    assert response.status_code == 200
+    metrics = _metrics(response.headers["server-timing"])
+    assert {"validate", "service", "serialize", "total"}.issubset(metrics)
+    assert "dur=" in metrics["total"]
+
+
+def test_not_found_response_is_timed(client):
+    response = client.get("/v1/generators/gen_missing")
+
+    assert response.status_code == 404
+    assert "total" in _metrics(response.headers["server-timing"])
+
+
+def test_mcp_tool_call_reports_stage_timings(client):
+    response = client.post(
+        "/mcp/",
+        json={
+            "jsonrpc": "2.0",
+            "id": "test",
+            "method": "tools/call",
+            "params": {"name": "list_generators", "arguments": {}},
+        },
+        headers={"Accept": "application/json"},
+    )
+
+    assert response.status_code == 200
+    metrics = _metrics(response.headers["server-timing"])
+    assert {"mcp_list_generators", "service", "total"}.issubset(metrics)
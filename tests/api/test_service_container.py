@@ -0,0 +1,19 @@
+import sys
+
+
+def test_rest_and_mcp_share_one_service(client, mcp_call_tool, valid_create_body):
+    generator_id = client.post("/v1/generators", json=valid_create_body).json()["generator"]["id"]
+
+    result = mcp_call_tool("get_generator", {"generator_id": generator_id})
+
+    assert result["id"] == generator_id
+
+
+def test_container_lives_for_the_app_lifespan(client):
+    dependencies = sys.modules["dependencies"]
+    assert dependencies._container is not None
+
+    # Runs the lifespan shutdown; the fixture's own exit is then a no-op.
+    client.__exit__(None, None, None)
+
+    assert dependencies._container is None
@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from shared.encoding import loads
+from shared.specification import cache_path, load_specification
+
+SPEC = "openapi: 3.0.3\ninfo:\n  title: Test\n  version: '1'\npaths: {}\n"
+
+
+def test_load_specification_writes_and_reuses_cache(tmp_path: Path) -> None:
+    spec_path = tmp_path / "specification.yaml"
+    spec_path.write_text(SPEC)
+
+    spec = load_specification(spec_path)
+
+    assert spec["info"]["title"] == "Test"
+    cached = loads(cache_path(spec_path).read_bytes())
+    assert cached["spec"] == spec
+
+    # A cache matching the YAML's hash is used as is.
+    cache_path(spec_path).write_text(
+        '{"source_sha256": "%s", "spec": {"info": {"title": "From cache"}}}'
+        % cached["source_sha256"]
+    )
+    assert load_specification(spec_path)["info"]["title"] == "From cache"
+
+
+def test_load_specification_rebuilds_stale_cache(tmp_path: Path) -> None:
+    spec_path = tmp_path / "specification.yaml"
+    spec_path.write_text(SPEC)
+    load_specification(spec_path)
+
+    spec_path.write_text(SPEC.replace("title: Test", "title: Changed"))
+
+    assert load_specification(spec_path)["info"]["title"] == "Changed"
+    assert loads(cache_path(spec_path).read_bytes())["spec"]["info"]["title"] == "Changed"
+
+
+def test_load_specification_falls_back_when_spec_is_not_json(tmp_path: Path) -> None:
+    spec_path = tmp_path / "specification.yaml"
+    spec_path.write_text(SPEC + "x-codes: !!set {a, b}\n")
+
+    spec = load_specification(spec_path)
+
+    assert spec["x-codes"] == {"a", "b"}
+    assert not cache_path(spec_path).exists()
@@ -10,6 +10,9 @@ from starlette.testclient import TestClient
 ROOT = Path(__file__).resolve().parents[1]
 API_PATH = ROOT / "src" / "api"
 
+if str(API_PATH) not in sys.path:
+    sys.path.insert(0, str(API_PATH))
+
 
 def _clear_api_modules() -> None:
     prefixes = (
@@ -0,0 +1,51 @@
+import asyncio
+
+
+def test_mcp_proxy_serves_json_rpc_without_trailing_slash(client):
+    response = client.post(
+        "/mcp",
+        json={"jsonrpc": "2.0", "id": "proxy", "method": "tools/list"},
+        headers={"Accept": "application/json"},
+    )
+
+    assert response.status_code == 200
+    tool_names = {tool["name"] for tool in response.json()["result"]["tools"]}
+    assert "list_generators" in tool_names
+
+
+def test_mcp_proxy_forwards_chunks_as_they_are_sent():
+    from mcp.proxy import MCPProxy
+
+    sent: list[dict] = []
+    seen_paths: list[tuple[str, str]] = []
+    scope = {"type": "http", "path": "/mcp", "root_path": ""}
+    release = asyncio.Event()
+
+    async def streaming_app(scope, receive, send):
+        seen_paths.append((scope["path"], scope["root_path"]))
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b"first", "more_body": True})
+        await release.wait()
+        await send({"type": "http.response.body", "body": b"second"})
+
+    async def scenario():
+        async def send(message):
+            sent.append(message)
+
+        proxy_call = asyncio.create_task(
+            MCPProxy(streaming_app)(scope, None, send)
+        )
+        await asyncio.sleep(0)
+        chunks_before_release = [m.get("body") for m in sent]
+        release.set()
+        await proxy_call
+        return chunks_before_release
+
+    chunks_before_release = asyncio.run(scenario())
+
+    # Routed as the /mcp/ mount would route it.
+    assert seen_paths == [("/mcp/", "/mcp")]
+    # The caller's scope is untouched, so request logs show the path that was called.
+    assert scope["path"] == "/mcp"
+    assert chunks_before_release == [None, b"first"]
+    assert [m.get("body") for m in sent] == [None, b"first", b"second"]
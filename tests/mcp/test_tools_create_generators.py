@@ -0,0 +1,29 @@
+def test_mcp_create_generators_returns_results_in_order(mcp_call_tool):
+    bodies = [
+        {"name": f"mcp-bulk-{n}", "language": "python", "upload": {"content_type": "application/zip"}}
+        for n in range(3)
+    ]
+
+    result = mcp_call_tool("create_generators", {"bodies": bodies})
+
+    assert [item["index"] for item in result["results"]] == [0, 1, 2]
+    assert [item["generator"]["name"] for item in result["results"]] == [
+        "mcp-bulk-0",
+        "mcp-bulk-1",
+        "mcp-bulk-2",
+    ]
+    assert all(item["upload"]["upload_url"] for item in result["results"])
+
+
+def test_mcp_create_generators_reports_invalid_items_per_index(mcp_call_tool):
+    bodies = [
+        {"name": "mcp-bulk-ok", "language": "python", "upload": {"content_type": "application/zip"}},
+        {"name": "Not Valid", "language": "python", "upload": {"content_type": "application/zip"}},
+    ]
+
+    result = mcp_call_tool("create_generators", {"bodies": bodies})
+
+    first, second = result["results"]
+    assert first["index"] == 0 and first["generator"]["name"] == "mcp-bulk-ok"
+    assert second["index"] == 1 and second["error"] == "bad_request"
+    assert second["details"]["errors"]
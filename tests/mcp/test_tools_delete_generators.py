@@ -0,0 +1,8 @@
+def test_mcp_delete_generators_reports_missing_ids(mcp_call_tool, valid_create_body):
+    generator_id = mcp_call_tool("create_generator", {"body": valid_create_body})["generator"]["id"]
+
+    result = mcp_call_tool("delete_generators", {"generator_ids": [generator_id, "gen_missing"]})
+
+    deleted, missing = result["items"]
+    assert deleted == {"id": generator_id, "deleted": True}
+    assert missing["error"] == "not_found"
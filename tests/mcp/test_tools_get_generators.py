@@ -0,0 +1,13 @@
+def test_mcp_get_generators_returns_items_in_order(mcp_call_tool):
+    result = mcp_call_tool(
+        "get_generators",
+        {"generator_ids": ["gen_missing", "gen_01HTZ7Y4M7Z7W2B8Q6P2"], "fields": ["name"]},
+    )
+
+    missing, found = result["items"]
+    assert missing == {
+        "id": "gen_missing",
+        "error": "not_found",
+        "message": "Generator 'gen_missing' was not found",
+    }
+    assert found == {"id": "gen_01HTZ7Y4M7Z7W2B8Q6P2", "name": "fastapi-crud"}
@@ -10,3 +10,9 @@ def test_mcp_list_generators_returns_minimal_fields(mcp_call_tool):
         assert "name" in item
         assert "language" in item
         assert set(item.keys()).issubset(allowed_keys)
+
+
+def test_mcp_list_generators_rejects_malformed_page_token(mcp_call_tool):
+    result = mcp_call_tool("list_generators", {"filters": {"page_token": "not-a-token"}})
+
+    assert result["error"] == "bad_request"
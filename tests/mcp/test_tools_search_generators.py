@@ -0,0 +1,21 @@
+def test_mcp_search_generators_returns_scored_matches(mcp_call_tool):
+    result = mcp_call_tool("search_generators", {"query": "nestjs", "limit": 5})
+
+    items = result["items"]
+    assert [item["name"] for item in items] == ["nestjs-module"]
+    assert items[0]["score"] > 0
+    assert set(items[0]) <= {"id", "name", "description", "language", "stack", "score"}
+
+
+def test_mcp_search_generators_rejects_empty_query(mcp_call_tool):
+    result = mcp_call_tool("search_generators", {"query": " "})
+
+    assert result["error"] == "bad_request"
+
+
+def test_mcp_search_generators_filters_by_version(mcp_call_tool):
+    matched = mcp_call_tool("search_generators", {"query": "nestjs", "version": "0.9.1"})
+    missed = mcp_call_tool("search_generators", {"query": "nestjs", "version": "9.9.9"})
+
+    assert [item["name"] for item in matched["items"]] == ["nestjs-module"]
+    assert missed["items"] == []
@@ -0,0 +1,24 @@
+from models.dtos import Generator
+from repositories.index import FrozenGenerator
+
+
+def test_new_builds_a_pending_record_with_its_artifact_location():
+    body = {"name": "new-kit", "language": "go", "upload": {"content_type": "application/gzip"}}
+
+    generator = Generator.new(body, bucket="artifacts")
+
+    assert generator.id.startswith("gen_")
+    assert generator.upload_status == "pending"
+    assert generator.tags == []
+    assert generator.created_at == generator.updated_at
+    assert generator.artifact.bucket == "artifacts"
+    assert generator.artifact.object == f"{generator.id}/generator.zip"
+    assert generator.artifact.content_type == "application/gzip"
+
+
+def test_new_keeps_the_subclass():
+    generator = FrozenGenerator.new({"name": "frozen-kit", "language": "python"})
+
+    assert isinstance(generator, FrozenGenerator)
+    assert generator.artifact.bucket == ""
+    assert generator.artifact.content_type == "application/zip"
@@ -0,0 +1,34 @@
+import json
+
+from models.dtos import Generator, GeneratorProjection, GeneratorView
+
+
+def _generator(n: int) -> Generator:
+    return Generator(
+        id=f"gen_{n:04d}",
+        name=f"view-{n}",
+        language="python",
+        entrypoint="generate.py",
+        upload_status="ready",
+        artifact={"bucket": "b", "object": f"gen_{n:04d}/generator.zip"},
+    )
+
+
+def test_items_json_hides_internal_fields_without_revalidating():
+    view = GeneratorView({"artifact", "entrypoint"})
+    generators = [_generator(n) for n in range(3)]
+
+    items = json.loads(view.items_json(generators))
+
+    assert [item["id"] for item in items] == ["gen_0000", "gen_0001", "gen_0002"]
+    assert all("artifact" not in item and "entrypoint" not in item for item in items)
+    assert items == view.items(generators)
+
+
+def test_field_selection_plan_is_cached_and_applied_to_projections():
+    view = GeneratorView({"artifact"})
+    projection = GeneratorProjection(id="gen_0001", name="view-1")
+
+    assert view.plan(["id", "name"]) is view.plan(["name", "id"])
+    assert view.items([projection], ["id", "name"]) == [{"id": "gen_0001", "name": "view-1"}]
+    assert view.items_json([]) == b"[]"
@@ -0,0 +1,335 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+import pytest
+from google.api_core.exceptions import NotFound
+
+LISTENER_READ_TIME = datetime(2026, 2, 16, 12, 0, 0, tzinfo=timezone.utc)
+
+
+class FakeCredentials:
+    def __init__(self) -> None:
+        self.token = "token-1"
+        self.valid = True
+        self.expired = False
+        self.service_account_email = "signer@example.iam.gserviceaccount.com"
+        self.refreshes = 0
+
+    def refresh(self, request) -> None:
+        self.refreshes += 1
+        self.token = f"token-{self.refreshes + 1}"
+        self.valid = True
+        self.expired = False
+
+
+class FakeBlob:
+    def __init__(self, bucket: "FakeBucket", name: str) -> None:
+        self.bucket = bucket
+        self.name = name
+
+    def exists(self) -> bool:
+        self.bucket.exists_calls += 1
+        return self.name in self.bucket.objects
+
+    def delete(self) -> None:
+        self.bucket.objects.discard(self.name)
+
+    def generate_signed_url(self, **kwargs) -> str:
+        self.bucket.signed.append({"name": self.name, **kwargs})
+        return f"https://storage.example.com/{self.name}?sig={len(self.bucket.signed)}"
+
+
+class FakeBucket:
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.objects: set[str] = set()
+        self.exists_calls = 0
+        self.signed: list[dict[str, object]] = []
+
+    def blob(self, name: str) -> FakeBlob:
+        return FakeBlob(self, name)
+
+
+class FakeStorageClient:
+    def __init__(self, project=None, credentials=None, **kwargs) -> None:
+        self.project = project
+        self.credentials = credentials
+        self.buckets: dict[str, FakeBucket] = {}
+        self.batches = 0
+
+    def bucket(self, name: str) -> FakeBucket:
+        return self.buckets.setdefault(name, FakeBucket(name))
+
+    def list_blobs(self, bucket: FakeBucket, prefix: str = ""):
+        return [bucket.blob(name) for name in sorted(bucket.objects) if name.startswith(prefix)]
+
+    def close(self) -> None:
+        self.closed = True
+
+    def batch(self, raise_exception: bool = True):
+        from contextlib import nullcontext
+
+        self.batches += 1
+        return nullcontext()
+
+
+@pytest.fixture()
+def fake_credentials() -> FakeCredentials:
+    return FakeCredentials()
+
+
+@pytest.fixture()
+def gcs_adapter_factory(monkeypatch: pytest.MonkeyPatch, fake_credentials: FakeCredentials):
+    import google.auth
+    import google.cloud.storage
+
+    from repositories import storage as storage_module
+
+    monkeypatch.setattr(
+        google.auth, "default", lambda scopes=None: (fake_credentials, "test-project")
+    )
+    monkeypatch.setattr(google.cloud.storage, "Client", FakeStorageClient)
+
+    def _build(**kwargs) -> storage_module.GCSSignedUploadAdapter:
+        return storage_module.GCSSignedUploadAdapter(
+            project_id="test-project", bucket_name="test-bucket", **kwargs
+        )
+
+    return _build
+
+
+class FakeSnapshot:
+    def __init__(self, reference: "FakeDocumentReference", data: dict | None) -> None:
+        self.reference = reference
+        self.id = reference.id
+        self.exists = data is not None
+        self._data = data
+
+    def to_dict(self) -> dict | None:
+        return dict(self._data) if self._data is not None else None
+
+
+class FakeDocumentReference:
+    def __init__(self, collection: "FakeCollection", document_id: str) -> None:
+        self.collection = collection
+        self.id = document_id
+
+    async def get(self, field_paths: list[str] | None = None, **kwargs) -> FakeSnapshot:
+        self.collection.client.reads += 1
+        data = self.collection.documents.get(self.id)
+        if data is not None and field_paths:
+            data = {key: value for key, value in data.items() if key in field_paths}
+        return FakeSnapshot(self, data)
+
+    async def set(self, data: dict) -> None:
+        self.collection.documents[self.id] = dict(data)
+
+    async def update(self, data: dict) -> None:
+        self.collection.documents[self.id].update(data)
+
+    async def delete(self, option=None, **kwargs) -> None:
+        self.collection.client.writes += 1
+        if option is not None and option.get("exists") and self.id not in self.collection.documents:
+            raise NotFound("No document to update")
+        self.collection.documents.pop(self.id, None)
+
+
+class FakeAggregation:
+    def __init__(self, query: "FakeQuery") -> None:
+        self.query = query
+
+    async def get(self):
+        class Result:
+            value = len(self.query._matches())
+
+        return [[Result()]]
+
+
+class FakeQuery:
+    def __init__(self, collection: "FakeCollection") -> None:
+        self.collection = collection
+        self.filters: list[tuple[str, str, object]] = []
+        self.orders: list[tuple[str, str]] = []
+        self.cursor: dict | None = None
+        self.max_results: int | None = None
+        self.selected: list[str] | None = None
+
+    def _copy(self) -> "FakeQuery":
+        query = FakeQuery(self.collection)
+        query.filters = list(self.filters)
+        query.orders = list(self.orders)
+        query.cursor = self.cursor
+        query.max_results = self.max_results
+        query.selected = self.selected
+        return query
+
+    def select(self, field_paths: list[str]) -> "FakeQuery":
+        query = self._copy()
+        query.selected = list(field_paths)
+        return query
+
+    def where(self, field_path: str, op_string: str, value: object) -> "FakeQuery":
+        query = self._copy()
+        query.filters.append((field_path, op_string, value))
+        return query
+
+    def order_by(self, field_path: str, direction: str = "ASCENDING") -> "FakeQuery":
+        query = self._copy()
+        query.orders.append((field_path, direction))
+        return query
+
+    def start_after(self, values: dict) -> "FakeQuery":
+        query = self._copy()
+        query.cursor = values
+        return query
+
+    def limit(self, count: int) -> "FakeQuery":
+        query = self._copy()
+        query.max_results = count
+        return query
+
+    def count(self) -> FakeAggregation:
+        return FakeAggregation(self)
+
+    def _matches(self) -> list[tuple[str, dict]]:
+        matches = []
+        for document_id, data in self.collection.documents.items():
+            ok = True
+            for field_path, op, value in self.filters:
+                if op == "==":
+                    ok = ok and data.get(field_path) == value
+                elif op == "array_contains":
+                    ok = ok and value in (data.get(field_path) or [])
+                else:
+                    raise NotImplementedError(op)
+            if ok:
+                matches.append((document_id, data))
+
+        if self.orders:
+            descending = self.orders[0][1] == "DESCENDING"
+            sort_key = lambda pair: tuple(pair[1].get(field) or "" for field, _ in self.orders)
+            matches.sort(key=sort_key, reverse=descending)
+            if self.cursor is not None:
+                cursor = tuple(self.cursor[field] for field, _ in self.orders)
+                matches = [
+                    pair
+                    for pair in matches
+                    if (sort_key(pair) < cursor if descending else sort_key(pair) > cursor)
+                ]
+        if self.max_results:
+            matches = matches[: self.max_results]
+        return matches
+
+    async def stream(self):
+        for document_id, data in self._matches():
+            self.collection.client.reads += 1
+            if self.selected is not None:
+                data = {key: value for key, value in data.items() if key in self.selected}
+            yield FakeSnapshot(FakeDocumentReference(self.collection, document_id), data)
+
+
+class FakeCollection(FakeQuery):
+    def __init__(self, client: "FakeFirestoreClient", name: str) -> None:
+        self.client = client
+        self.name = name
+        self.documents: dict[str, dict] = {}
+        super().__init__(self)
+
+    def document(self, document_id: str) -> FakeDocumentReference:
+        return FakeDocumentReference(self, document_id)
+
+
+class FakeWriteBatch:
+    def __init__(self, client: "FakeFirestoreClient") -> None:
+        self.client = client
+        self.operations: list = []
+
+    def set(self, reference: FakeDocumentReference, data: dict) -> None:
+        self.operations.append(reference.set(data))
+
+    def update(self, reference: FakeDocumentReference, data: dict) -> None:
+        self.operations.append(reference.update(data))
+
+    async def commit(self) -> None:
+        self.client.commits += 1
+        for operation in self.operations:
+            await operation
+
+
+class FakeFirestoreClient:
+    def __init__(self, project=None, database=None, **kwargs) -> None:
+        self.collections: dict[str, FakeCollection] = {}
+        self.reads = 0
+        self.commits = 0
+        self.writes = 0
+        self.get_all_calls = 0
+
+    @staticmethod
+    def write_option(**kwargs) -> dict:
+        return kwargs
+
+    def collection(self, name: str) -> FakeCollection:
+        return self.collections.setdefault(name, FakeCollection(self, name))
+
+    def batch(self) -> FakeWriteBatch:
+        return FakeWriteBatch(self)
+
+    def close(self) -> None:
+        return None
+
+    async def get_all(self, references, field_paths: list[str] | None = None):
+        self.get_all_calls += 1
+        for reference in references:
+            yield await reference.get(field_paths=field_paths)
+
+
+@pytest.fixture()
+def firestore_adapter(monkeypatch: pytest.MonkeyPatch):
+    from repositories import base as base_module
+    from repositories.firestore import FirestoreMetadataAdapter
+
+    monkeypatch.setattr(base_module.firestore, "AsyncClient", FakeFirestoreClient)
+    return FirestoreMetadataAdapter(
+        project_id="test-project", database_id="(default)", collection_name="generators"
+    )
+
+
+class FakeListener:
+    """Stands in for ``on_snapshot``: tests push changes as the listener thread would."""
+
+    def __init__(self) -> None:
+        self.callback = None
+        self.is_active = True
+        self.unsubscribed = False
+
+    def __call__(self, callback) -> "FakeListener":
+        self.callback = callback
+        return self
+
+    def push(self, *changes, read_time: datetime = LISTENER_READ_TIME) -> None:
+        self.callback([], list(changes), read_time)
+
+    def unsubscribe(self) -> None:
+        self.unsubscribed = True
+
+
+@pytest.fixture()
+def listener() -> FakeListener:
+    return FakeListener()
+
+
+@pytest.fixture()
+def replicated_adapter(monkeypatch: pytest.MonkeyPatch, listener: FakeListener):
+    from repositories import base as base_module
+    from repositories.firestore import FirestoreMetadataAdapter
+    from repositories.replica import CatalogReplica
+
+    monkeypatch.setattr(base_module.firestore, "AsyncClient", FakeFirestoreClient)
+    replica = CatalogReplica(listener, clock=lambda: LISTENER_READ_TIME.timestamp() + 0.25)
+    return FirestoreMetadataAdapter(
+        project_id="test-project",
+        database_id="(default)",
+        collection_name="generators",
+        replica=replica,
+    )
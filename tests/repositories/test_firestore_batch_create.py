@@ -0,0 +1,14 @@
+import asyncio
+
+def test_create_generators_commits_in_write_batches(firestore_adapter):
+    bodies = [
+        {"name": f"bulk-{n}", "language": "python", "tags": ["API"], "upload": {}}
+        for n in range(501)
+    ]
+
+    generators = asyncio.run(firestore_adapter.create_generators(bodies))
+
+    assert [generator.name for generator in generators] == [body["name"] for body in bodies]
+    assert firestore_adapter._client.commits == 2
+    stored = firestore_adapter._collection.documents[generators[0].id]
+    assert stored["tags_normalized"] == ["api"]
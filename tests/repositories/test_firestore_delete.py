@@ -0,0 +1,21 @@
+import asyncio
+
+
+def test_delete_is_a_single_conditional_write(firestore_adapter):
+    body = {"name": "to-delete", "language": "python", "upload": {}}
+    generator = asyncio.run(firestore_adapter.create_generator(body))
+    client = firestore_adapter._client
+
+    assert asyncio.run(firestore_adapter.delete_generator(generator.id)) is True
+    assert asyncio.run(firestore_adapter.delete_generator(generator.id)) is False
+    assert client.reads == 0
+    assert client.writes == 2
+
+
+def test_delete_generators_reports_missing_ids(firestore_adapter):
+    body = {"name": "bulk-delete", "language": "python", "upload": {}}
+    generator = asyncio.run(firestore_adapter.create_generator(body))
+
+    results = asyncio.run(firestore_adapter.delete_generators([generator.id, "gen_missing"]))
+
+    assert results == {generator.id: generator.artifact}
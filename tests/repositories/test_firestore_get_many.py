@@ -0,0 +1,36 @@
+import asyncio
+
+
+def test_get_generators_uses_single_get_all(firestore_adapter):
+    created = [
+        asyncio.run(
+            firestore_adapter.create_generator(
+                {"name": f"batch-{index}", "language": "go", "upload": {}}
+            )
+        )
+        for index in range(3)
+    ]
+    ids = [generator.id for generator in created] + ["gen_missing"]
+
+    found = asyncio.run(firestore_adapter.get_generators(ids))
+
+    assert set(found) == set(ids[:3])
+    assert firestore_adapter._client.get_all_calls == 1
+
+
+def test_get_generators_counts_documents_read(firestore_adapter):
+    from shared.timing import RequestTimings, bind_timings
+
+    created = asyncio.run(
+        firestore_adapter.create_generator({"name": "counted", "language": "go", "upload": {}})
+    )
+    timings = RequestTimings()
+
+    async def _read() -> None:
+        with bind_timings(timings):
+            await firestore_adapter.get_generators([created.id, "gen_missing"])
+
+    asyncio.run(_read())
+
+    assert timings.counts == {"firestore_reads": 2}
+    assert "firestore_get_all" in timings.server_timing()
@@ -0,0 +1,25 @@
+import asyncio
+
+
+def test_list_generators_selects_only_requested_fields(firestore_adapter):
+    body = {"name": "projected", "language": "python", "entrypoint": "gen.py", "upload": {}}
+    asyncio.run(firestore_adapter.create_generator(body))
+
+    items = asyncio.run(firestore_adapter.list_generators(fields=["id", "name"]))
+
+    assert type(items[0]).__name__ == "GeneratorProjection"
+    assert items[0].name == "projected"
+    assert items[0].entrypoint is None
+    assert items[0].artifact is None
+
+
+def test_get_generator_projection_skips_computed_fields(firestore_adapter):
+    body = {"name": "projected", "language": "python", "upload": {}}
+    created = asyncio.run(firestore_adapter.create_generator(body))
+
+    item = asyncio.run(
+        firestore_adapter.get_generator(created.id, fields=["id", "language", "download_url"])
+    )
+
+    assert item.language == "python"
+    assert item.name is None
@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+
+def _document(generator_id: str, **data) -> SimpleNamespace:
+    data = {
+        "name": generator_id,
+        "language": "python",
+        "tags": ["api"],
+        "upload_status": "ready",
+        "created_at": "2026-02-10T12:00:00Z",
+        "updated_at": "2026-02-10T12:00:00Z",
+        **data,
+    }
+    return SimpleNamespace(id=generator_id, to_dict=lambda: dict(data))
+
+
+def _change(kind: str, document: SimpleNamespace) -> SimpleNamespace:
+    return SimpleNamespace(type=SimpleNamespace(name=kind), document=document)
+
+
+async def _flush() -> None:
+    # Snapshot callbacks are applied on the next loop iteration.
+    await asyncio.sleep(0)
+
+
+def test_reads_fall_back_to_firestore_until_synced(replicated_adapter, listener):
+    async def scenario():
+        await replicated_adapter.start()
+        body = {"name": "direct", "language": "python", "upload": {}}
+        created = await replicated_adapter.create_generator(body)
+        client = replicated_adapter._client
+        reads = client.reads
+
+        assert (await replicated_adapter.get_generator(created.id)).name == "direct"
+        assert client.reads == reads + 1
+
+        listener.push(_change("ADDED", _document("gen_replica")))
+        await _flush()
+        reads = client.reads
+        items = await replicated_adapter.list_generators()
+        assert client.reads == reads
+        # The local write is kept alongside the snapshot.
+        assert {item.id for item in items} == {created.id, "gen_replica"}
+
+    asyncio.run(scenario())
+
+
+def test_snapshot_changes_update_indexed_queries(replicated_adapter, listener):
+    async def scenario():
+        await replicated_adapter.start()
+        listener.push(
+            _change("ADDED", _document("gen_a", language="python", tags=["API", "crud"])),
+            _change("ADDED", _document("gen_b", language="go", updated_at="2026-02-11T00:00:00Z")),
+        )
+        await _flush()
+
+        assert [i.id for i in await replicated_adapter.list_generators(tag=["api", "crud"])] == [
+            "gen_a"
+        ]
+        assert [i.id for i in await replicated_adapter.list_generators()] == ["gen_b", "gen_a"]
+
+        listener.push(
+            _change("MODIFIED", _document("gen_a", language="go")),
+            _change("REMOVED", _document("gen_b")),
+        )
+        await _flush()
+
+        assert [i.id for i in await replicated_adapter.list_generators(language="go")] == ["gen_a"]
+        assert await replicated_adapter.get_generator("gen_b") is None
+        found = await replicated_adapter.get_generators(["gen_a", "gen_b"], fields=["name"])
+        assert list(found) == ["gen_a"]
+        assert found["gen_a"].language is None
+
+    asyncio.run(scenario())
+
+
+def test_replica_stats_and_listener_failure(replicated_adapter, listener):
+    async def scenario():
+        await replicated_adapter.start()
+        listener.push(_change("ADDED", _document("gen_a")))
+        await _flush()
+
+        stats = replicated_adapter.replica_stats()
+        assert stats["synced"] is True
+        assert stats["documents"] == 1
+        assert stats["lag_seconds"] == pytest.approx(0.25)
+        assert stats["staleness_seconds"] == 0
+
+        # A stopped listener sends reads back to Firestore, which has no such document.
+        listener.is_active = False
+        assert await replicated_adapter.get_generator("gen_a") is None
+
+        await replicated_adapter.aclose()
+        assert listener.unsubscribed
+
+    asyncio.run(scenario())
+
+
+def test_replica_subscribes_off_the_loop_and_survives_failures():
+    from repositories.replica import CatalogReplica
+
+    async def scenario():
+        loop_thread = threading.get_ident()
+        threads = []
+
+        def subscribe(callback):
+            threads.append(threading.get_ident())
+            raise RuntimeError("no credentials")
+
+        replica = CatalogReplica(subscribe)
+        await replica.start()
+
+        assert threads and threads[0] != loop_thread
+        assert replica.synced is False
+        await replica.aclose()
+
+    asyncio.run(scenario())
+
+
+def test_search_index_follows_replica_snapshots(replicated_adapter, listener):
+    from repositories.storage import FakeSignedUploadAdapter
+    from services.generator_service import GeneratorService
+    from services.search_index import GeneratorSearchIndex
+
+    async def scenario():
+        service = GeneratorService(
+            metadata=replicated_adapter,
+            storage=FakeSignedUploadAdapter(),
+            search_index=GeneratorSearchIndex(),
+        )
+        await service.start()
+        assert service._search_refresh is None
+
+        listener.push(_change("ADDED", _document("gen_remote", name="quarkus-starter")))
+        await _flush()
+        result = await service.search_generators(q="quarkus")
+        assert [item.id for item in result["items"]] == ["gen_remote"]
+
+        listener.push(_change("REMOVED", _document("gen_remote")))
+        await _flush()
+        assert service.search_index.search("quarkus", limit=5) == []
+        await service.aclose()
+
+    asyncio.run(scenario())
+
+
+def test_snapshot_documents_are_validated_on_the_listener_thread(replicated_adapter, listener):
+    async def scenario():
+        await replicated_adapter.start()
+        loop_thread = threading.get_ident()
+        reads = []
+        document = _document("gen_threaded")
+        to_dict = document.to_dict
+
+        def record_thread():
+            reads.append(threading.get_ident())
+            return to_dict()
+
+        document.to_dict = record_thread
+        pushing = threading.Thread(target=listener.push, args=(_change("ADDED", document),))
+        pushing.start()
+        pushing.join()
+        await _flush()
+
+        assert reads and loop_thread not in reads
+        assert (await replicated_adapter.get_generator("gen_threaded")).name == "gen_threaded"
+
+    asyncio.run(scenario())
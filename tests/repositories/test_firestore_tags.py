@@ -0,0 +1,44 @@
+import asyncio
+
+
+def _create(adapter, name: str, tags: list[str]):
+    body = {"name": name, "language": "python", "tags": tags, "upload": {}}
+    return asyncio.run(adapter.create_generator(body))
+
+
+def test_create_generator_stores_normalized_tags(firestore_adapter):
+    generator = _create(firestore_adapter, "tagged", ["API", "Crud", "api"])
+
+    stored = firestore_adapter._collection.documents[generator.id]
+    assert stored["tags_normalized"] == ["api", "crud"]
+    assert stored["tags"] == ["API", "Crud", "api"]
+
+
+def test_tag_filter_runs_in_firestore_and_checks_residual_tags(firestore_adapter):
+    both = _create(firestore_adapter, "both-tags", ["api", "crud"])
+    _create(firestore_adapter, "api-only", ["api"])
+    _create(firestore_adapter, "untagged", [])
+    client = firestore_adapter._client
+    client.reads = 0
+
+    items = asyncio.run(firestore_adapter.list_generators(tag=["CRUD", "api"]))
+
+    assert [item.id for item in items] == [both.id]
+    assert client.reads == 1
+
+
+def test_backfill_normalized_tags_updates_legacy_documents(firestore_adapter):
+    firestore_adapter._collection.documents["gen_legacy01"] = {
+        "id": "gen_legacy01",
+        "name": "legacy",
+        "language": "python",
+        "tags": ["Backend"],
+        "upload_status": "ready",
+    }
+
+    updated = asyncio.run(firestore_adapter.backfill_normalized_tags())
+
+    assert updated == 1
+    assert firestore_adapter._collection.documents["gen_legacy01"]["tags_normalized"] == [
+        "backend"
+    ]
@@ -0,0 +1,56 @@
+import asyncio
+
+from models.dtos import ArtifactRef
+
+
+def test_artifact_cleanup_deletes_prefixes_in_batches(gcs_adapter_factory):
+    adapter = gcs_adapter_factory(cleanup_batch_size=2, cleanup_flush_seconds=0.01)
+    bucket = adapter._bucket
+    bucket.objects |= {"gen_a/generator.zip", "gen_b/generator.zip", "gen_c/generator.zip"}
+    bucket.objects.add("gen_keep/generator.zip")
+
+    async def scenario():
+        adapter.schedule_artifact_cleanup({"gen_a": None, "gen_b": None, "gen_c": None})
+        await asyncio.sleep(0.1)
+        await adapter.aclose()
+
+    asyncio.run(scenario())
+
+    assert bucket.objects == {"gen_keep/generator.zip"}
+    stats = adapter.cleanup_stats()
+    assert stats["deleted_objects"] == 3
+    assert stats["pending"] == 0
+
+
+def test_artifact_cleanup_flushes_pending_prefixes_on_close(gcs_adapter_factory):
+    adapter = gcs_adapter_factory(cleanup_flush_seconds=60)
+    adapter._bucket.objects.add("gen_a/generator.zip")
+
+    async def scenario():
+        adapter.schedule_artifact_cleanup({"gen_a": None})
+        await asyncio.sleep(0)
+        await adapter.aclose()
+
+    asyncio.run(scenario())
+
+    assert adapter._bucket.objects == set()
+
+
+def test_artifact_cleanup_deletes_legacy_artifact_objects(gcs_adapter_factory):
+    adapter = gcs_adapter_factory(cleanup_flush_seconds=60)
+    bucket = adapter._bucket
+    bucket.objects |= {
+        "fastapi-crud/1.0.0/generator.zip",
+        "fastapi-crud/1.1.0/generator.zip",
+        "gen_legacy/notes.txt",
+    }
+    legacy = ArtifactRef(object="fastapi-crud/1.0.0/generator.zip")
+    elsewhere = ArtifactRef(bucket="other-bucket", object="fastapi-crud/1.1.0/generator.zip")
+
+    async def scenario():
+        adapter.schedule_artifact_cleanup({"gen_legacy": legacy, "gen_elsewhere": elsewhere})
+        await adapter.aclose()
+
+    asyncio.run(scenario())
+
+    assert bucket.objects == {"fastapi-crud/1.1.0/generator.zip"}
@@ -0,0 +1,69 @@
+import asyncio
+from datetime import datetime
+
+from models.dtos import Generator
+
+
+def _published_generator(generation: int | None = None) -> Generator:
+    return Generator.model_validate(
+        {
+            "id": "gen_download01",
+            "name": "download-me",
+            "language": "python",
+            "upload_status": "ready",
+            "artifact": {
+                "bucket": "test-bucket",
+                "object": "gen_download01/generator.zip",
+                "generation": generation,
+            },
+        }
+    )
+
+
+def test_download_url_is_reused_with_window_aligned_expiry(gcs_adapter_factory):
+    adapter = gcs_adapter_factory(expiry_seconds=600, download_window_seconds=300)
+    adapter._bucket.objects.add("gen_download01/generator.zip")
+    generator = _published_generator()
+
+    async def scenario():
+        return [await adapter.get_download_url(generator) for _ in range(3)]
+
+    first, second, third = asyncio.run(scenario())
+
+    assert first == second == third
+    assert len(adapter._bucket.signed) == 1
+    expires_at = datetime.fromisoformat(first["download_expires_at"].replace("Z", "+00:00"))
+    assert expires_at.timestamp() % 300 == 0
+
+
+def test_download_url_cache_is_keyed_by_generation(gcs_adapter_factory):
+    adapter = gcs_adapter_factory()
+    adapter._bucket.objects.add("gen_download01/generator.zip")
+
+    async def scenario():
+        await adapter.get_download_url(_published_generator(generation=1))
+        await adapter.get_download_url(_published_generator(generation=2))
+
+    asyncio.run(scenario())
+
+    assert [call["generation"] for call in adapter._bucket.signed] == [1, 2]
+
+
+def test_published_generator_skips_exists_check(gcs_adapter_factory):
+    adapter = gcs_adapter_factory()
+
+    download = asyncio.run(adapter.get_download_url(_published_generator()))
+
+    assert download is not None
+    assert adapter._bucket.exists_calls == 0
+
+
+def test_pending_generator_checks_existence(gcs_adapter_factory):
+    adapter = gcs_adapter_factory()
+    pending = _published_generator().model_copy(update={"upload_status": "pending"})
+
+    assert asyncio.run(adapter.get_download_url(pending)) is None
+
+    adapter._bucket.objects.add("gen_download01/generator.zip")
+    assert asyncio.run(adapter.get_download_url(pending)) is not None
+    assert adapter._bucket.exists_calls == 2
@@ -0,0 +1,72 @@
+import asyncio
+
+import pytest
+from pydantic import ValidationError
+
+from repositories.index import FrozenGenerator, GeneratorIndex
+from repositories.memory import InMemoryMetadataAdapter
+
+
+def _record(n: int, **overrides) -> FrozenGenerator:
+    data = {
+        "id": f"gen_{n:04d}",
+        "name": f"indexed-{n}",
+        "language": "python" if n % 2 else "go",
+        "stack": "fastapi" if n % 3 == 0 else None,
+        "tags": ["API"] if n % 4 == 0 else ["cli"],
+        "upload_status": "ready",
+        "updated_at": f"2026-01-01T00:{n // 60:02d}:{n % 60:02d}Z",
+        **overrides,
+    }
+    return FrozenGenerator.model_validate(data)
+
+
+@pytest.fixture()
+def index() -> GeneratorIndex:
+    index = GeneratorIndex()
+    for n in range(200):
+        index.upsert(_record(n))
+    return index
+
+
+def test_query_intersects_indexes_and_orders_newest_first(index):
+    items = index.query(language="go", stack="fastapi", tags=["api"])
+
+    expected = [n for n in range(199, -1, -1) if n % 2 == 0 and n % 3 == 0 and n % 4 == 0]
+    assert [item.id for item in items] == [f"gen_{n:04d}" for n in expected]
+
+
+def test_query_pages_with_start_after(index):
+    first = index.query(language="python", limit=3)
+    last = first[-1]
+    second = index.query(language="python", limit=3, start_after=(last.updated_at, last.id))
+
+    assert [item.id for item in first + second] == [
+        f"gen_{n:04d}" for n in (199, 197, 195, 193, 191, 189)
+    ]
+
+
+def test_upsert_and_remove_update_indexes(index):
+    index.upsert(_record(4, language="rust", tags=["new"]))
+    index.remove("gen_0008")
+
+    assert [item.id for item in index.query(language="rust")] == ["gen_0004"]
+    assert [item.id for item in index.query(tags=["new"])] == ["gen_0004"]
+    assert "gen_0004" not in {item.id for item in index.query(tags=["api"])}
+    assert "gen_0008" not in index
+    assert len(index) == 199
+
+
+def test_memory_adapter_reads_share_frozen_records():
+    adapter = InMemoryMetadataAdapter()
+
+    first = asyncio.run(adapter.get_generator("gen_01HTZ7Y4M7Z7W2B8Q6P2"))
+    second = asyncio.run(adapter.list_generators(language="python"))[0]
+
+    assert first is second
+    with pytest.raises(ValidationError):
+        first.name = "changed"
+    with pytest.raises(ValidationError):
+        first.artifact.object = "changed/generator.zip"
+    with pytest.raises(AttributeError):
+        first.tags.append("changed")
@@ -0,0 +1,87 @@
+import asyncio
+import sqlite3
+import time
+
+import pytest
+
+from repositories.sqlite import SqliteMetadataAdapter
+
+
+def _body(name: str, language: str = "python", tags: list[str] | None = None) -> dict:
+    return {"name": name, "language": language, "tags": tags or [], "upload": {}}
+
+
+@pytest.fixture()
+def db_path(tmp_path):
+    return str(tmp_path / "generators.db")
+
+
+def test_list_filters_by_columns_and_tags(db_path):
+    async def scenario():
+        adapter = SqliteMetadataAdapter(db_path, read_pool_size=2)
+        both = await adapter.create_generator(_body("both", tags=["API", "crud"]))
+        await adapter.create_generator(_body("api-only", tags=["api"]))
+        await adapter.create_generator(_body("go-crud", language="go", tags=["crud", "api"]))
+        items = await adapter.list_generators(language="python", tag=["crud", "Api"])
+        projected = await adapter.list_generators(tag=["api"], fields=["id", "name"])
+        await adapter.aclose()
+        return both, items, projected
+
+    both, items, projected = asyncio.run(scenario())
+
+    assert [item.id for item in items] == [both.id]
+    assert items[0].tags == ["API", "crud"]
+    assert type(projected[0]).__name__ == "GeneratorProjection"
+    assert projected[0].language is None
+
+
+def test_pages_and_deletes_persist_across_reopen(db_path):
+    async def write():
+        adapter = SqliteMetadataAdapter(db_path)
+        created = await adapter.create_generators([_body(f"gen-{n}", tags=["bulk"]) for n in range(5)])
+        deleted = await adapter.delete_generators([created[0].id, "gen_missing"])
+        await adapter.aclose()
+        return created, deleted
+
+    async def read():
+        adapter = SqliteMetadataAdapter(db_path)
+        first = await adapter.list_generators(limit=2)
+        last = first[-1]
+        rest = await adapter.list_generators(start_after=(last.updated_at, last.id))
+        await adapter.aclose()
+        return first + rest
+
+    created, deleted = asyncio.run(write())
+    items = asyncio.run(read())
+
+    assert deleted == {created[0].id: created[0].artifact}
+    assert sorted(item.id for item in items) == sorted(g.id for g in created[1:])
+    keys = [(item.updated_at, item.id) for item in items]
+    assert keys == sorted(keys, reverse=True)
+    with sqlite3.connect(db_path) as connection:
+        assert connection.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        orphans = connection.execute(
+            "SELECT COUNT(*) FROM generator_tags WHERE generator_id = ?", (created[0].id,)
+        ).fetchone()[0]
+    assert orphans == 0
+
+
+def test_aclose_waits_for_running_reads_and_closes_every_connection(db_path):
+    adapter = SqliteMetadataAdapter(db_path, read_pool_size=2)
+    connections = [adapter._writer, *adapter._readers.queue]
+
+    def slow_read() -> int:
+        with adapter._reader() as connection:
+            time.sleep(0.05)
+            return connection.execute("SELECT count(*) FROM generators").fetchone()[0]
+
+    async def scenario():
+        read = asyncio.ensure_future(adapter._run(slow_read))
+        await asyncio.sleep(0.01)
+        await adapter.aclose()
+        return await read
+
+    assert asyncio.run(scenario()) == 0
+    for connection in connections:
+        with pytest.raises(sqlite3.ProgrammingError):
+            connection.execute("SELECT 1")
@@ -0,0 +1,78 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from google.auth.credentials import Signing
+
+from repositories.signing import CredentialRefresher, UrlSigner
+
+
+class SlowRefreshCredentials:
+    def __init__(self) -> None:
+        self.token = None
+        self.valid = False
+        self.expired = True
+        self.expiry = None
+        self.refreshes = 0
+        self._gate = threading.Event()
+
+    def refresh(self, request) -> None:
+        self._gate.wait(0.05)
+        self.refreshes += 1
+        self.token = "fresh-token"
+        self.valid = True
+        self.expired = False
+
+
+class LocalKeyCredentials(Signing):
+    signer_email = "local@example.iam.gserviceaccount.com"
+    signer = None
+
+    def sign_bytes(self, message: bytes) -> bytes:
+        return b"signature"
+
+
+class RecordingBlob:
+    name = "gen_sign01/generator.zip"
+
+    def __init__(self) -> None:
+        self.calls: list[dict[str, object]] = []
+
+    def generate_signed_url(self, **kwargs) -> str:
+        self.calls.append(kwargs)
+        return "https://storage.example.com/signed"
+
+
+def test_concurrent_token_reads_refresh_once():
+    credentials = SlowRefreshCredentials()
+    refresher = CredentialRefresher(credentials, request_factory=object)
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        tokens = list(pool.map(lambda _: refresher.token(), range(8)))
+
+    assert credentials.refreshes == 1
+    assert set(tokens) == {"fresh-token"}
+
+
+def test_signer_uses_local_key_without_access_token():
+    credentials = LocalKeyCredentials()
+    refresher = CredentialRefresher(credentials, request_factory=object)
+    signer = UrlSigner(credentials, refresher, signer_email=credentials.signer_email)
+    blob = RecordingBlob()
+
+    signer.sign(blob, {"version": "v4", "method": "GET"})
+
+    assert signer.signs_locally
+    assert "access_token" not in blob.calls[0]
+    assert signer.stats.snapshot()["local_signatures"] == 1
+
+
+def test_signer_falls_back_to_iam_with_shared_token(fake_credentials):
+    refresher = CredentialRefresher(fake_credentials, request_factory=object)
+    signer = UrlSigner(fake_credentials, refresher, signer_email="signer@example.com")
+    blob = RecordingBlob()
+
+    signer.sign(blob, {"version": "v4", "method": "GET"})
+
+    assert blob.calls[0]["service_account_email"] == "signer@example.com"
+    assert blob.calls[0]["access_token"] == fake_credentials.token
+    assert signer.stats.snapshot()["remote_signatures"] == 1
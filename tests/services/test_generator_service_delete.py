@@ -0,0 +1,22 @@
+import asyncio
+
+from repositories.memory import InMemoryMetadataAdapter
+from repositories.storage import FakeSignedUploadAdapter
+from services.generator_service import GeneratorService
+
+
+def test_delete_generators_schedules_artifact_cleanup_for_deleted_ids():
+    storage = FakeSignedUploadAdapter()
+    service = GeneratorService(metadata=InMemoryMetadataAdapter(), storage=storage)
+    body = {"name": "cleanup-me", "language": "python", "upload": {}}
+
+    async def scenario():
+        created = await service.create_generator(body)
+        generator_id = created["generator"].id
+        results = await service.delete_generators([generator_id, "gen_missing", generator_id])
+        return generator_id, results
+
+    generator_id, results = asyncio.run(scenario())
+
+    assert results == [(generator_id, True), ("gen_missing", False)]
+    assert storage.cleaned_up == [generator_id]
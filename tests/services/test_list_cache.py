@@ -0,0 +1,134 @@
+import asyncio
+
+import pytest
+
+from models.dtos import Generator, GeneratorProjection
+from services.list_cache import GeneratorListCache
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _generator(generator_id: str) -> Generator:
+    return Generator(id=generator_id, name="cached", language="python", upload_status="ready")
+
+
+def _counting_loader(calls: list[int], generator_id: str = "gen_cached01"):
+    async def _load() -> list[Generator]:
+        calls.append(1)
+        return [_generator(generator_id)]
+
+    return _load
+
+
+def test_list_cache_normalizes_query_keys():
+    cache = GeneratorListCache(ttl_seconds=30, stale_seconds=60, max_entries=8)
+
+    first = cache.key_for({"language": "python", "tag": ["CRUD", "api"], "stack": None})
+    second = cache.key_for({"tag": ["api", "crud"], "language": "python"})
+
+    assert first == second
+
+
+def test_list_cache_serves_hits_stale_and_invalidates():
+    clock = FakeClock()
+    cache = GeneratorListCache(ttl_seconds=30, stale_seconds=60, max_entries=8, clock=clock)
+    calls: list[int] = []
+
+    async def scenario() -> None:
+        loader = _counting_loader(calls)
+        await cache.get_or_load({"language": "python"}, loader)
+        await cache.get_or_load({"language": "python"}, loader)
+        assert len(calls) == 1
+
+        clock.now = 45
+        stale = await cache.get_or_load({"language": "python"}, loader)
+        assert stale[0].id == "gen_cached01"
+        await asyncio.sleep(0)
+        assert len(calls) == 2
+
+        await cache.invalidate()
+        await cache.get_or_load({"language": "python"}, loader)
+        assert len(calls) == 3
+
+    asyncio.run(scenario())
+
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["stale_hits"] == 1
+    assert stats["misses"] == 2
+    assert stats["invalidations"] == 1
+
+
+class DictSharedCache:
+    def __init__(self) -> None:
+        self.values: dict[str, bytes] = {}
+
+    async def get(self, key: str) -> bytes | None:
+        return self.values.get(key)
+
+    async def set(self, key: str, value: bytes, ttl_seconds: float) -> None:
+        self.values[key] = value
+
+    async def clear(self, prefix: str) -> None:
+        self.values = {k: v for k, v in self.values.items() if not k.startswith(prefix)}
+
+    async def aclose(self) -> None:
+        return None
+
+
+def test_list_cache_reads_through_shared_tier():
+    shared = DictSharedCache()
+    writer = GeneratorListCache(ttl_seconds=30, stale_seconds=60, max_entries=8, shared=shared)
+    reader = GeneratorListCache(ttl_seconds=30, stale_seconds=60, max_entries=8, shared=shared)
+    calls: list[int] = []
+
+    async def scenario() -> list[Generator]:
+        await writer.get_or_load({}, _counting_loader(calls))
+        return await reader.get_or_load({}, _counting_loader(calls))
+
+    items = asyncio.run(scenario())
+
+    assert len(calls) == 1
+    assert items[0].id == "gen_cached01"
+    assert reader.stats()["shared_hits"] == 1
+
+
+def test_shared_tier_keeps_projections_and_skips_unreadable_entries():
+    shared = DictSharedCache()
+    writer = GeneratorListCache(ttl_seconds=30, stale_seconds=60, max_entries=8, shared=shared)
+    reader = GeneratorListCache(ttl_seconds=30, stale_seconds=60, max_entries=8, shared=shared)
+    query = {"fields": ["id", "name"]}
+    calls: list[int] = []
+
+    async def projected() -> list[GeneratorProjection]:
+        calls.append(1)
+        return [GeneratorProjection(id="gen_projected", name="projected")]
+
+    async def scenario():
+        await writer.get_or_load(query, projected)
+        items = await reader.get_or_load(query, projected)
+        assert isinstance(items[0], GeneratorProjection)
+        assert len(calls) == 1
+
+        shared.values[reader.namespace + reader.key_for({})] = b'{"stored_at": "soon"'
+        fallback = await reader.get_or_load({}, _counting_loader(calls))
+        assert fallback[0].id == "gen_cached01"
+        assert len(calls) == 2
+
+    asyncio.run(scenario())
+
+
+def test_build_list_cache_wires_the_redis_tier(monkeypatch):
+    pytest.importorskip("redis")
+    import dependencies
+    from repositories.redis_cache import RedisSharedCache
+
+    monkeypatch.setattr(dependencies.settings, "list_cache_redis_url", "redis://localhost:6379/0")
+
+    assert isinstance(dependencies.build_list_cache().shared, RedisSharedCache)
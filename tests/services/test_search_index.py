@@ -0,0 +1,102 @@
+import asyncio
+
+from models.dtos import Generator
+from services.search_index import GeneratorSearchIndex, tokenize
+
+
+def _generator(generator_id: str, name: str, **data) -> Generator:
+    return Generator(
+        id=generator_id, name=name, language="python", upload_status="ready", **data
+    )
+
+
+def _index(*generators: Generator) -> GeneratorSearchIndex:
+    index = GeneratorSearchIndex()
+    for generator in generators:
+        index.add(generator)
+    return index
+
+
+def test_tokenize_splits_on_punctuation_and_lowercases():
+    assert tokenize("FastAPI-CRUD, v2!") == ["fastapi", "crud", "v2"]
+    assert tokenize(None) == []
+
+
+def test_search_ranks_name_matches_above_description_matches():
+    index = _index(
+        _generator("gen_desc", "service-kit", description="Scaffolds a CRUD layer."),
+        _generator("gen_name", "crud-kit", description="Scaffolds a service."),
+        _generator("gen_none", "docs-site", description="Static documentation."),
+    )
+
+    ranked = index.search("crud", limit=10)
+
+    assert [generator_id for generator_id, _ in ranked] == ["gen_name", "gen_desc"]
+    assert ranked[0][1] > ranked[1][1] > 0
+    assert [generator_id for generator_id, _ in index.search("crud", limit=1)] == ["gen_name"]
+
+
+def test_search_applies_filters_and_removals():
+    index = _index(
+        _generator("gen_py", "api-kit", tags=["API", "crud"]),
+        _generator("gen_go", "api-kit", tags=["api"], stack="gin"),
+    )
+
+    assert [i for i, _ in index.search("api", limit=10, tags=["crud"])] == ["gen_py"]
+    assert [i for i, _ in index.search("api", limit=10, stack="gin")] == ["gen_go"]
+
+    index.remove("gen_py")
+    assert [i for i, _ in index.search("crud api", limit=10)] == ["gen_go"]
+    assert index.search("crud", limit=10) == []
+    assert len(index) == 1
+
+
+def test_load_skips_generators_deleted_while_loading():
+    async def scenario():
+        index = GeneratorSearchIndex()
+        release = asyncio.Event()
+
+        async def loader() -> list[Generator]:
+            await release.wait()
+            return [_generator("gen_kept", "kept-kit"), _generator("gen_gone", "gone-kit")]
+
+        index.start_loading(loader)
+        await asyncio.sleep(0)
+        index.add(_generator("gen_new", "new-kit"))
+        index.remove("gen_gone")
+        release.set()
+        await index.ensure_loaded(loader)
+
+        found = {generator_id for generator_id, _ in index.search("kit", limit=10)}
+        assert found == {"gen_kept", "gen_new"}
+
+    asyncio.run(scenario())
+
+
+def test_refresh_picks_up_generators_written_by_other_instances():
+    from repositories.memory import InMemoryMetadataAdapter
+    from repositories.storage import FakeSignedUploadAdapter
+    from services.generator_service import GeneratorService
+
+    async def scenario():
+        metadata = InMemoryMetadataAdapter()
+        service = GeneratorService(
+            metadata=metadata,
+            storage=FakeSignedUploadAdapter(),
+            search_index=GeneratorSearchIndex(),
+            search_refresh_seconds=0.01,
+        )
+        await service.start()
+        # Written straight to the store, as another instance would.
+        created = await metadata.create_generator({"name": "quarkus-starter", "language": "java"})
+
+        for _ in range(100):
+            result = await service.search_generators(q="quarkus")
+            if result["items"]:
+                break
+            await asyncio.sleep(0.01)
+
+        assert [item.id for item in result["items"]] == [created.id]
+        await service.aclose()
+
+    asyncio.run(scenario())
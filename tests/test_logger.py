@@ -0,0 +1,46 @@
+import logging
+import queue
+
+from logger import DroppingQueueHandler, Lazy, SamplingFilter, _resolve_lazy
+
+
+def _record(name: str, level: int = logging.INFO, **extra: object) -> logging.LogRecord:
+    record = logging.LogRecord(name, level, __file__, 1, "message", None, None)
+    record.__dict__.update(extra)
+    return record
+
+
+def test_sampling_filter_uses_longest_prefix_and_keeps_warnings():
+    sampling = SamplingFilter({"api.controllers": 0.0, "api.controllers.admin": 1.0})
+
+    assert not sampling.filter(_record("api.controllers"))
+    assert not sampling.filter(_record("api.controllers.generators"))
+    assert sampling.filter(_record("api.controllers.admin"))
+    assert sampling.filter(_record("api.service"))
+    assert sampling.filter(_record("api.controllers", logging.WARNING))
+    assert sampling.sampled_out == 2
+
+
+def test_queue_handler_drops_and_counts_when_full():
+    handler = DroppingQueueHandler(queue.Queue(1))
+
+    handler.handle(_record("api"))
+    handler.handle(_record("api"))
+
+    assert handler.queue.qsize() == 1
+    assert handler.dropped == 1
+
+
+def test_lazy_extra_is_evaluated_only_when_written():
+    calls = []
+    sampling = SamplingFilter({"api": 0.0})
+    skipped = _record("api", payload=Lazy(calls.append, "skipped"))
+    written = _record("api.errors", logging.ERROR, payload=Lazy(lambda: {"ok": True}))
+
+    if sampling.filter(skipped):
+        _resolve_lazy(skipped)
+    if sampling.filter(written):
+        _resolve_lazy(written)
+
+    assert calls == []
+    assert written.payload == {"ok": True}